@@ -1,17 +1,23 @@
 # -*- mode: python ; coding: utf-8 -*-
 from PyInstaller.utils.hooks import collect_data_files
+import importlib.util
 import sys
 
 datas = [('assets', 'assets')]
 datas += collect_data_files('pygame')
 
+hiddenimports = ['pygame', 'numpy']
+# noise is optional, bundle it only when the build environment has it
+if importlib.util.find_spec('noise') is not None:
+    hiddenimports.append('noise')
+
 
 a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
     datas=datas,
-    hiddenimports=['pygame', 'noise'],
+    hiddenimports=hiddenimports,
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -1,103 +1,269 @@
 from circleshape import *
-import random
+import rng
 import pygame
 import math
+import numpy as np
 from constants import *
 from powerup import PowerUp
 from ringblast import RingChargePowerUp
+from asteroidstore import AsteroidStore, SlotVector
+from spritecache import RotationSpriteCache
+
+shape_rng = rng.stream("shapes")  # Cosmetic: outlines, craters, spin
+split_rng = rng.stream("splits")
+drop_rng = rng.stream("drops")
 
 class Asteroid(CircleShape):
-    """Jagged asteroid with random shape and rotation"""
+    """Jagged asteroid with random shape and rotation.
+
+    Kinematic state lives in the shared AsteroidStore arrays; the sprite is a
+    thin handle whose properties read and write its slot (vector properties
+    return write-through SlotVectors). Hot paths should read the arrays in
+    bulk instead, see draw_batch and narrowphase.circle_arrays. Once killed,
+    the last known state is detached onto the instance so it stays readable.
+    """
     sounds = {}
+    store = AsteroidStore()
+    sprite_cache = RotationSpriteCache()
 
     def __init__(self, x, y, radius):
+        self.slot = self.store.allocate(x, y, radius)
+        self._detached = None
         super().__init__(x, y, radius)
         
         # Generate random jagged shape
-        self.num_vertices = random.randint(8, 14)
+        self.num_vertices = shape_rng.randint(8, 14)
         self.vertices = []
-        self.rotation = random.uniform(0, 360)
-        self.rotation_speed = random.uniform(-30, 30)
+        self.craters = []
+        self._generate_shape(radius)
+
+    def reset(self, x, y, radius):
+        """Reinitialise a pooled asteroid with a new slot and reshaped outline"""
+        self.sprite_cache.discard(self.entity_id)
+        self.slot = self.store.allocate(x, y, radius)
+        self._detached = None
+        self.entity_id = next(entity_ids)
+        self.num_vertices = shape_rng.randint(8, 14)
+        del self.vertices[self.num_vertices:]
+        self._generate_shape(radius)
+
+    def _generate_shape(self, radius):
+        """Randomise rotation, outline and craters, reusing existing vertex vectors"""
+        self.rotation = shape_rng.uniform(0, 360)
+        self.rotation_speed = shape_rng.uniform(-30, 30)
         
         # Generate vertices with random distance variations
         for i in range(self.num_vertices):
             angle = (360 / self.num_vertices) * i
-            distance = radius * random.uniform(0.7, 1.0)
+            distance = radius * shape_rng.uniform(0.7, 1.0)
             rad = math.radians(angle)
-            offset = pygame.Vector2(distance * math.cos(rad), distance * math.sin(rad))
-            self.vertices.append(offset)
+            if i < len(self.vertices):
+                self.vertices[i].update(distance * math.cos(rad), distance * math.sin(rad))
+            else:
+                self.vertices.append(pygame.Vector2(distance * math.cos(rad), distance * math.sin(rad)))
         
         # Add craters for detail
-        self.craters = []
-        for _ in range(random.randint(0, 3)):
+        self.craters.clear()
+        for _ in range(shape_rng.randint(0, 3)):
             self.craters.append({
-                'angle': random.uniform(0, 360),
-                'distance': random.uniform(0.5, 0.8) * radius,
-                'size': random.uniform(0.1, 0.2) * radius
+                'angle': shape_rng.uniform(0, 360),
+                'distance': shape_rng.uniform(0.5, 0.8) * radius,
+                'size': shape_rng.uniform(0.1, 0.2) * radius
             })
     
+    @property
+    def position(self):
+        if self.slot is None:
+            return self._detached["position"]
+        return SlotVector(self.store, "position", self.slot)
+
+    @position.setter
+    def position(self, value):
+        if self.slot is None:
+            self._detached["position"] = pygame.Vector2(value)
+        else:
+            self.store.position[self.slot] = (value[0], value[1])
+
+    @property
+    def previous_position(self):
+        if self.slot is None:
+            return self._detached["position"]
+        return SlotVector(self.store, "previous_position", self.slot)
+
+    @previous_position.setter
+    def previous_position(self, value):
+        if self.slot is not None:
+            self.store.previous_position[self.slot] = (value[0], value[1])
+
+    @property
+    def velocity(self):
+        if self.slot is None:
+            return self._detached["velocity"]
+        return SlotVector(self.store, "velocity", self.slot)
+
+    @velocity.setter
+    def velocity(self, value):
+        if self.slot is None:
+            self._detached["velocity"] = pygame.Vector2(value)
+        else:
+            self.store.velocity[self.slot] = (value[0], value[1])
+
+    @property
+    def radius(self):
+        if self.slot is None:
+            return self._detached["radius"]
+        return float(self.store.radius[self.slot])
+
+    @radius.setter
+    def radius(self, value):
+        if self.slot is None:
+            self._detached["radius"] = value
+        else:
+            self.store.radius[self.slot] = value
+
+    @property
+    def rotation(self):
+        if self.slot is None:
+            return self._detached["rotation"]
+        return float(self.store.rotation[self.slot])
+
+    @rotation.setter
+    def rotation(self, value):
+        if self.slot is None:
+            self._detached["rotation"] = value
+        else:
+            self.store.rotation[self.slot] = value
+
+    @property
+    def rotation_speed(self):
+        if self.slot is None:
+            return self._detached["rotation_speed"]
+        return float(self.store.rotation_speed[self.slot])
+
+    @rotation_speed.setter
+    def rotation_speed(self, value):
+        if self.slot is None:
+            self._detached["rotation_speed"] = value
+        else:
+            self.store.rotation_speed[self.slot] = value
+
+    def kill(self):
+        """Remove from all groups and hand the store slot back"""
+        super().kill()
+        if self.slot is not None:
+            self._detached = {
+                "position": pygame.Vector2(self.position),
+                "velocity": pygame.Vector2(self.velocity),
+                "radius": self.radius,
+                "rotation": self.rotation,
+                "rotation_speed": self.rotation_speed,
+            }
+            self.store.release(self.slot)
+            self.slot = None
+            self.sprite_cache.discard(self.entity_id)
+
     def draw(self, screen):
+        # Blit the cached rendering nearest the current rotation
+        surf = self.sprite_cache.get(self.entity_id, self.rotation, self._render)
+        position = self.position
+        half = surf.get_width() // 2
+        screen.blit(surf, (int(position.x) - half, int(position.y) - half))
+
+    @classmethod
+    def draw_batch(cls, screen, asteroids, alpha):
+        """Draw every store-backed asteroid in asteroids with one blits() call.
+
+        Positions are interpolated by alpha between the previous and current
+        store rows (as draw_interpolated would) and read in bulk rather than
+        per sprite. Anything without a live slot, such as bosses sharing the
+        group, is skipped. Returns the rects drawn.
+        """
+        batch = [asteroid for asteroid in asteroids if getattr(asteroid, "slot", None) is not None]
+        if not batch:
+            return []
+        store = cls.store
+        slots = [asteroid.slot for asteroid in batch]
+        previous = store.previous_position[slots]
+        positions = previous + (store.position[slots] - previous) * min(max(alpha, 0.0), 1.0)
+        get = cls.sprite_cache.get
+        blits = []
+        for asteroid, (x, y), rotation in zip(batch, positions.tolist(), store.rotation[slots].tolist()):
+            surf = get(asteroid.entity_id, rotation, asteroid._render)
+            half = surf.get_width() // 2
+            blits.append((surf, (int(x) - half, int(y) - half)))
+        return screen.blits(blits)
+
+    def _render(self, rotation):
+        """Render outline and craters at a rotation onto a surface centred on the asteroid"""
+        half = int(math.ceil(self.radius)) + 2
+        surf = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+        
         # Rotate vertices based on current rotation
         rotated_vertices = []
         for vertex in self.vertices:
-            rotated = vertex.rotate(self.rotation)
-            world_pos = self.position + rotated
-            rotated_vertices.append((world_pos.x, world_pos.y))
+            rotated = vertex.rotate(rotation)
+            rotated_vertices.append((half + rotated.x, half + rotated.y))
         
         # Draw the jagged asteroid outline
         if len(rotated_vertices) >= 3:
-            pygame.draw.polygon(screen, (255, 255, 255), rotated_vertices, 2)
+            pygame.draw.polygon(surf, (255, 255, 255), rotated_vertices, 2)
         
         # Draw craters for detail
         for crater in self.craters:
-            rad = math.radians(crater['angle'] + self.rotation)
-            crater_x = self.position.x + crater['distance'] * math.cos(rad)
-            crater_y = self.position.y + crater['distance'] * math.sin(rad)
-            pygame.draw.circle(screen, (200, 200, 200), (int(crater_x), int(crater_y)), 
+            rad = math.radians(crater['angle'] + rotation)
+            crater_x = half + crater['distance'] * math.cos(rad)
+            crater_y = half + crater['distance'] * math.sin(rad)
+            pygame.draw.circle(surf, (200, 200, 200), (int(crater_x), int(crater_y)), 
                              int(crater['size']), 1)
+        return surf
 
     def update(self, dt):
-        self.position += self.velocity * dt
-        self.rotation += self.rotation_speed * dt
+        """Kinematics are advanced in bulk by AsteroidStore.step"""
+        pass
 
     def split(self):
         """Split asteroid and potentially drop powerups"""
+        # Read state up front, a pooled instance may be reused once killed
+        position = self.position
+        velocity = self.velocity
+        radius = self.radius
+        
         # Play size-appropriate sound
         if self.sounds:
-            sound_key = "asteroid_small" if self.radius <= ASTEROID_MIN_RADIUS else \
-                       "asteroid_medium" if self.radius <= ASTEROID_MIN_RADIUS * 2 else \
+            sound_key = "asteroid_small" if radius <= ASTEROID_MIN_RADIUS else \
+                       "asteroid_medium" if radius <= ASTEROID_MIN_RADIUS * 2 else \
                        "asteroid_large"
             sound = self.sounds.get(sound_key)
             if sound:
                 sound.play()
 
         # Drop powerup with configured chance
-        if random.random() < POWER_UP_DROP_CHANCE:
-            kind = random.choice(["rapid_fire", "spread", "rapid_fire", "spread", "ring_charge"])
+        if drop_rng.random() < POWER_UP_DROP_CHANCE:
+            kind = drop_rng.choice(["rapid_fire", "spread", "rapid_fire", "spread", "ring_charge"])
             
             # Calculate powerup velocity
-            if self.velocity.length_squared() > 0:
-                direction = self.velocity.normalize()
+            if velocity.length_squared() > 0:
+                direction = velocity.normalize()
             else:
-                direction = pygame.Vector2(1, 0).rotate(random.uniform(0, 360))
+                direction = pygame.Vector2(1, 0).rotate(drop_rng.uniform(0, 360))
             vel = direction * 80.0
             
             # Spawn powerup
             if kind == "ring_charge":
-                RingChargePowerUp(self.position.x, self.position.y, vel)
+                RingChargePowerUp(position.x, position.y, vel)
             else:
-                PowerUp(self.position.x, self.position.y, kind, vel)
+                PowerUp.spawn(position.x, position.y, kind, vel)
 
         self.kill()
 
         # Split into smaller asteroids if not minimum size
-        if self.radius > ASTEROID_MIN_RADIUS:
-            new_radius = self.radius - ASTEROID_MIN_RADIUS
-            split_angle = random.uniform(20, 50)
+        if radius > ASTEROID_MIN_RADIUS:
+            new_radius = radius - ASTEROID_MIN_RADIUS
+            split_angle = split_rng.uniform(20, 50)
             
             for angle_sign in [1, -1]:
-                asteroid = Asteroid(self.position.x, self.position.y, new_radius)
-                asteroid.velocity = self.velocity.rotate(split_angle * angle_sign) * 1.2
+                asteroid = Asteroid.spawn(position.x, position.y, new_radius)
+                asteroid.velocity = velocity.rotate(split_angle * angle_sign) * 1.2
 
 
 
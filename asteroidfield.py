@@ -1,8 +1,10 @@
 import pygame
-import random
+import rng
 from asteroid import Asteroid
 from constants import *
 
+spawn_rng = rng.stream("spawns")
+
 
 class AsteroidField(pygame.sprite.Sprite):
     edges = [
@@ -34,7 +36,7 @@ class AsteroidField(pygame.sprite.Sprite):
                 # Don't spawn if position is unreasonable
                 return
             
-            asteroid = Asteroid(position.x, position.y, radius)
+            asteroid = Asteroid.spawn(position.x, position.y, radius)
             if velocity and hasattr(velocity, 'x') and hasattr(velocity, 'y'):
                 # Ensure velocity is reasonable (prevent super-fast asteroids)
                 max_speed = 150  # Reasonable maximum
@@ -42,7 +44,7 @@ class AsteroidField(pygame.sprite.Sprite):
                     velocity = velocity.normalize() * max_speed
                 asteroid.velocity = velocity
             else:
-                asteroid.velocity = pygame.Vector2(50, 0).rotate(random.uniform(0, 360))
+                asteroid.velocity = pygame.Vector2(50, 0).rotate(spawn_rng.uniform(0, 360))
                 
         except Exception as e:
             raise
@@ -66,24 +68,24 @@ class AsteroidField(pygame.sprite.Sprite):
                     return
                     
                 try:
-                    edge = random.choice(self.edges)
+                    edge = spawn_rng.choice(self.edges)
                     if not edge or len(edge) < 2:
                         return
                     
                     # Generate spawn parameters with validation
-                    speed = random.randint(max(20, 40), min(150, 100))  # Ensure valid range
-                    angle_variation = random.randint(-45, 45)  # Slightly wider spread
+                    speed = spawn_rng.randint(max(20, 40), min(150, 100))  # Ensure valid range
+                    angle_variation = spawn_rng.randint(-45, 45)  # Slightly wider spread
                     velocity = (edge[0] * speed).rotate(angle_variation)
                     
                     # Generate position with bounds checking
-                    spawn_param = random.uniform(0.1, 0.9)  # Avoid exact edges (0,1)
+                    spawn_param = spawn_rng.uniform(0.1, 0.9)  # Avoid exact edges (0,1)
                     position = edge[1](spawn_param)
                     
                     # Validate generated position
                     if not position or not hasattr(position, 'x') or not hasattr(position, 'y'):
                         return
                     
-                    kind = random.randint(1, max(1, ASTEROID_KINDS))  # Ensure at least 1
+                    kind = spawn_rng.randint(1, max(1, ASTEROID_KINDS))  # Ensure at least 1
                     radius = ASTEROID_MIN_RADIUS * kind
                     
                     self.spawn(radius, position, velocity)
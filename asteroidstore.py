@@ -0,0 +1,152 @@
+import numpy as np
+import pygame
+from constants import *
+
+
+_vector_setattr = pygame.Vector2.__setattr__
+
+
+class SlotVector(pygame.Vector2):
+    """Vector2 view of one row of an AsteroidStore array.
+
+    Reading an asteroid's position or velocity returns one of these, so
+    in-place updates (+=, scale_to_length, .x = ...) write through to the
+    store instead of being silently lost on a temporary copy. The array is
+    looked up by field name on each write because the store replaces its
+    arrays when it grows. Results of ordinary arithmetic are detached.
+    """
+    __slots__ = ("store", "field", "slot")
+
+    def __init__(self, store, field, slot):
+        x, y = getattr(store, field)[slot].tolist()
+        pygame.Vector2.__init__(self, x, y)
+        _vector_setattr(self, "store", store)
+        _vector_setattr(self, "field", field)
+        _vector_setattr(self, "slot", slot)
+
+    def _write_back(self):
+        # Copies made by arithmetic never ran __init__ and have no store
+        store = getattr(self, "store", None)
+        if store is not None:
+            getattr(store, self.field)[self.slot] = (self.x, self.y)
+
+    def __setattr__(self, name, value):
+        # x, y and swizzles such as .xy go through Vector2
+        _vector_setattr(self, name, value)
+        self._write_back()
+
+    def __setitem__(self, key, value):
+        pygame.Vector2.__setitem__(self, key, value)
+        self._write_back()
+
+
+def _write_through(name):
+    """Wrap an in-place Vector2 method so it also updates the store"""
+    method = getattr(pygame.Vector2, name)
+
+    def wrapper(self, *args):
+        result = method(self, *args)
+        self._write_back()
+        return result
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+for _name in ("__iadd__", "__isub__", "__imul__", "__itruediv__", "__ifloordiv__",
+              "update", "normalize_ip", "scale_to_length", "rotate_ip", "rotate_rad_ip",
+              "reflect_ip", "clamp_magnitude_ip", "move_towards_ip", "from_polar"):
+    if hasattr(pygame.Vector2, _name):
+        setattr(SlotVector, _name, _write_through(_name))
+
+
+class AsteroidStore:
+    """Struct-of-arrays storage for asteroid kinematics.
+
+    Every live asteroid owns one slot in a set of contiguous NumPy arrays, so
+    the whole field advances in a single vectorized step instead of one
+    Python update() call per sprite. Free slots are recycled and the arrays
+    double in size when they run out.
+    """
+
+    def __init__(self, capacity=ASTEROID_STORE_CAPACITY):
+        self.capacity = 0
+        self.size = 0  # One past the highest slot ever handed out
+        self.position = np.zeros((0, 2))
+        self.previous_position = np.zeros((0, 2))  # Position before the last step()
+        self.velocity = np.zeros((0, 2))
+        self.radius = np.zeros(0)
+        self.rotation = np.zeros(0)
+        self.rotation_speed = np.zeros(0)
+        self.alive = np.zeros(0, dtype=bool)
+        self.free_slots = []
+        self._grow(capacity)
+
+    def __len__(self):
+        return int(np.count_nonzero(self.alive[:self.size]))
+
+    def _grow(self, capacity):
+        """Resize every array to capacity, keeping existing slot data"""
+        old = self.capacity
+        self.position = np.resize(self.position, (capacity, 2))
+        self.previous_position = np.resize(self.previous_position, (capacity, 2))
+        self.velocity = np.resize(self.velocity, (capacity, 2))
+        self.radius = np.resize(self.radius, capacity)
+        self.rotation = np.resize(self.rotation, capacity)
+        self.rotation_speed = np.resize(self.rotation_speed, capacity)
+        self.alive = np.resize(self.alive, capacity)
+
+        # np.resize repeats data into the new tail, so zero it out
+        self.position[old:] = 0.0
+        self.previous_position[old:] = 0.0
+        self.velocity[old:] = 0.0
+        self.radius[old:] = 0.0
+        self.rotation[old:] = 0.0
+        self.rotation_speed[old:] = 0.0
+        self.alive[old:] = False
+
+        # Hand out low slots first to keep the active range compact
+        self.free_slots.extend(range(capacity - 1, old - 1, -1))
+        self.capacity = capacity
+
+    def allocate(self, x, y, radius, rotation=0.0, rotation_speed=0.0):
+        """Claim a slot for a new asteroid and return its index"""
+        if not self.free_slots:
+            self._grow(max(1, self.capacity * 2))
+        slot = self.free_slots.pop()
+        self.position[slot] = (x, y)
+        self.previous_position[slot] = (x, y)
+        self.velocity[slot] = 0.0
+        self.radius[slot] = radius
+        self.rotation[slot] = rotation
+        self.rotation_speed[slot] = rotation_speed
+        self.alive[slot] = True
+        self.size = max(self.size, slot + 1)
+        return slot
+
+    def release(self, slot):
+        """Return a slot to the free list"""
+        if not self.alive[slot]:
+            return
+        self.alive[slot] = False
+        # Zeroed velocity keeps dead slots stationary in step()
+        self.velocity[slot] = 0.0
+        self.rotation_speed[slot] = 0.0
+        self.free_slots.append(slot)
+
+    def clear(self):
+        """Release every slot"""
+        self.alive[:] = False
+        self.velocity[:] = 0.0
+        self.rotation_speed[:] = 0.0
+        self.free_slots = list(range(self.capacity - 1, -1, -1))
+        self.size = 0
+
+    def step(self, dt):
+        """Advance every asteroid by dt in one vectorized pass"""
+        n = self.size
+        if n == 0:
+            return
+        self.previous_position[:n] = self.position[:n]
+        self.position[:n] += self.velocity[:n] * dt
+        self.rotation[:n] += self.rotation_speed[:n] * dt
@@ -1,75 +1,182 @@
 import pygame
-import random
 import math
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import constants
-from noise import pnoise2
+import rng
+from noisefield import fractal_noise
+from effectbudget import budget
+
+try:
+    from noise import pnoise2
+except ImportError:  # Only the "blobs" nebula renderer needs the noise extension
+    pnoise2 = None
+
+background_rng = rng.stream("background")  # Cosmetic only, never affects gameplay
+starfield_rng = rng.numpy_stream("starfield")
+nebula_rng = rng.numpy_stream("nebula")  # Only drawn from on the main thread
+
+STAR_LAYERS = (1, 2, 3)  # Parallax layers, deeper layers are smaller, dimmer and slower
+STAR_LAYER_WEIGHTS = (4, 2, 1)
+STAR_WRAP_MARGIN = 10  # Distance off-screen before a star wraps around
+
+nebula_executor = None  # Shared by every Background, created on first use
+noise_volume = None  # (frames, size, size) fractal noise shared by every nebula
+noise_volume_lock = threading.Lock()
+
+
+def get_nebula_executor():
+    """Thread pool that generates nebula surfaces off the main thread"""
+    global nebula_executor
+    if nebula_executor is None:
+        nebula_executor = ThreadPoolExecutor(max_workers=constants.NEBULA_WORKERS,
+                                             thread_name_prefix="nebula")
+    return nebula_executor
+
+
+def get_noise_volume(generator):
+    """Precomputed looping noise volume for the "field" nebula renderer.
 
+    generator is only drawn from by whichever worker builds the volume, so
+    callers hand in a generator of their own rather than a registry stream.
+    """
+    global noise_volume
+    with noise_volume_lock:
+        if noise_volume is None:
+            size = constants.NEBULA_TEXTURE_SIZE
+            noise_volume = fractal_noise((constants.NEBULA_NOISE_FRAMES, size, size), generator=generator)
+        return noise_volume
 
-class Star:
-    def __init__(self, layer):
-        self.x = random.uniform(0, constants.SCREEN_WIDTH)
-        self.y = random.uniform(0, constants.SCREEN_HEIGHT)
-        self.layer = layer
-        self.size = layer * 0.8
-        self.alpha = int(50 + layer * 50)
-        self.twinkle_offset = random.uniform(0, 2 * 3.14159)
-        self.twinkle_speed = random.uniform(1.5, 3.0)
 
+class Starfield:
+    """Parallax starfield stored as NumPy arrays.
+
+    Positions, layers and twinkle phases live in flat arrays so scrolling and
+    wrapping are a handful of vector operations. Stars are drawn with one
+    Surface.blits call from an atlas of pre-rendered stamps indexed by
+    (layer, alpha level).
+    """
+    
+    def __init__(self, count=None):
+        if count is None:
+            count = constants.STAR_COUNT
+        # Split the count across layers by weight, any remainder goes to the first layer
+        counts = [count * weight // sum(STAR_LAYER_WEIGHTS) for weight in STAR_LAYER_WEIGHTS]
+        counts[0] += count - sum(counts)
+        
+        self.layer = np.repeat(np.array(STAR_LAYERS), counts)
+        self.x = starfield_rng.uniform(0, constants.SCREEN_WIDTH, count)
+        self.y = starfield_rng.uniform(0, constants.SCREEN_HEIGHT, count)
+        self.size = self.layer * 0.8
+        self.alpha = (50 + self.layer * 50).astype(float)
+        self.twinkle_offset = starfield_rng.uniform(0, 2 * math.pi, count)
+        self.twinkle_speed = starfield_rng.uniform(1.5, 3.0, count)
+        self.scroll_speed = 15.0 * self.layer
+        
+        # Atlas offset of each star's layer
+        self.atlas_row = (self.layer - 1) * constants.STAR_ALPHA_LEVELS
+        self.atlas = self._build_atlas()
+    
+    def __len__(self):
+        return len(self.x)
+    
+    @staticmethod
+    def _build_atlas():
+        """Stamps for every (layer, alpha level), flattened layer-major"""
+        levels = constants.STAR_ALPHA_LEVELS
+        atlas = []
+        for layer in STAR_LAYERS:
+            size = layer * 0.8
+            for level in range(levels):
+                alpha = level * 255 // (levels - 1)
+                surf = pygame.Surface((int(size * 2), int(size * 2)), pygame.SRCALPHA)
+                pygame.draw.circle(surf, (255, 255, 255, alpha), (int(size), int(size)), size)
+                atlas.append(surf)
+        return atlas
+    
+    def scale(self, alpha=1.0, twinkle_speed=1.0):
+        """Dim and slow the whole field (used for menu backgrounds)"""
+        self.alpha = np.floor(self.alpha * alpha)
+        self.twinkle_speed *= twinkle_speed
+    
     def update(self, dt, scroll_direction):
-        """Update star position with parallax scrolling"""
-        scroll_speed = 15 * self.layer
+        """Scroll every star with parallax and wrap the ones that left the screen"""
+        if not 0 <= scroll_direction < 4:
+            return
+        width = constants.SCREEN_WIDTH
+        height = constants.SCREEN_HEIGHT
+        step = self.scroll_speed * dt
         
-        # Direction-based scrolling with wrapping
-        directions = [
-            (-scroll_speed, 0, -10, constants.SCREEN_WIDTH + 10, 'x', 'y'),  # Left
-            (0, scroll_speed, constants.SCREEN_HEIGHT + 10, -10, 'y', 'x'),  # Down
-            (scroll_speed, 0, constants.SCREEN_WIDTH + 10, -10, 'x', 'y'),   # Right
-            (0, -scroll_speed, -10, constants.SCREEN_HEIGHT + 10, 'y', 'x')  # Up
-        ]
+        # 0=left, 1=down, 2=right, 3=up
+        if scroll_direction == 0:
+            self.x -= step
+            wrapped = self.x < -STAR_WRAP_MARGIN
+            self.x[wrapped] = width + STAR_WRAP_MARGIN
+        elif scroll_direction == 2:
+            self.x += step
+            wrapped = self.x > width + STAR_WRAP_MARGIN
+            self.x[wrapped] = -STAR_WRAP_MARGIN
+        elif scroll_direction == 1:
+            self.y += step
+            wrapped = self.y > height + STAR_WRAP_MARGIN
+            self.y[wrapped] = -STAR_WRAP_MARGIN
+        else:
+            self.y -= step
+            wrapped = self.y < -STAR_WRAP_MARGIN
+            self.y[wrapped] = height + STAR_WRAP_MARGIN
         
-        if 0 <= scroll_direction < 4:
-            dx, dy, edge_check, wrap_pos, primary_axis, secondary_axis = directions[scroll_direction]
-            self.x += dx * dt
-            self.y += dy * dt
-            
-            # Wrap around screen
-            if (dx < 0 and self.x < -10) or (dx > 0 and self.x > constants.SCREEN_WIDTH + 10):
-                self.x = wrap_pos
-                self.y = random.uniform(0, constants.SCREEN_HEIGHT)
-            elif (dy < 0 and self.y < -10) or (dy > 0 and self.y > constants.SCREEN_HEIGHT + 10):
-                self.y = wrap_pos
-                self.x = random.uniform(0, constants.SCREEN_WIDTH)
+        # Wrapped stars re-enter at a random spot along the far edge
+        count = int(np.count_nonzero(wrapped))
+        if count:
+            if scroll_direction in (0, 2):
+                self.y[wrapped] = starfield_rng.uniform(0, height, count)
+            else:
+                self.x[wrapped] = starfield_rng.uniform(0, width, count)
+    
+    def draw(self, screen, time):
+        twinkle = np.abs(np.sin(time * self.twinkle_speed + self.twinkle_offset))
+        alpha = (self.alpha * (0.3 + 0.7 * twinkle)).astype(int)
+        levels = constants.STAR_ALPHA_LEVELS
+        stamp_index = self.atlas_row + (alpha * (levels - 1) + 127) // 255
+        
+        atlas = self.atlas
+        xs = (self.x - self.size).astype(int).tolist()
+        ys = (self.y - self.size).astype(int).tolist()
+        screen.blits([(atlas[i], (x, y)) for i, x, y in zip(stamp_index.tolist(), xs, ys)], doreturn=False)
 
 
 class NebulaCloud:
     def __init__(self):
-        self.x = random.uniform(0, constants.SCREEN_WIDTH)
-        self.y = random.uniform(0, constants.SCREEN_HEIGHT)
-        self.size = random.uniform(120, 280)
+        self.x = background_rng.uniform(0, constants.SCREEN_WIDTH)
+        self.y = background_rng.uniform(0, constants.SCREEN_HEIGHT)
+        self.size = background_rng.uniform(120, 280)
         
         # Purple/Indigo color scheme
-        self.color = random.choice([
+        self.color = background_rng.choice([
             (60, 30, 100),   # Deep purple
             (40, 20, 80),    # Dark purple
             (30, 40, 90),    # Purple-blue
             (50, 20, 70),    # Magenta-purple
             (35, 30, 85),    # Indigo
         ])
-        self.secondary_color = random.choice([
+        self.secondary_color = background_rng.choice([
             (80, 50, 130),   # Light purple
             (60, 40, 110),   # Medium purple
             (70, 60, 120),   # Purple-blue light
         ])
-        self.alpha = random.randint(25, 50)
-        self.drift_speed = random.uniform(3, 8)  # Moderate lazy drift
-        self.noise_offset_x = random.uniform(0, 1000)
-        self.noise_offset_y = random.uniform(0, 1000)
-        self.time_offset = random.uniform(0, 100)
-        self.pulse_speed = random.uniform(0.2, 0.5)  # Slower pulse
+        self.alpha = background_rng.randint(25, 50)
+        self.drift_speed = background_rng.uniform(3, 8)  # Moderate lazy drift
+        self.noise_offset_x = background_rng.uniform(0, 1000)
+        self.noise_offset_y = background_rng.uniform(0, 1000)
+        self.time_offset = background_rng.uniform(0, 100)
+        self.pulse_speed = background_rng.uniform(0.2, 0.5)  # Slower pulse
         
-        # Pre-generate cloud surface for performance
+        # Surfaces are generated on a worker thread and swapped in when due
         self.surface = None
-        self.last_generated_time = -999
+        self.pending = None  # Future for the next surface
+        self.swap_time = 0.0  # Background time at which the next surface is shown
 
     def update(self, dt, scroll_direction):
         """Update nebula position with lazy drift"""
@@ -81,24 +188,65 @@ class NebulaCloud:
             self.x -= drift
             if self.x < -buffer:
                 self.x = constants.SCREEN_WIDTH + buffer
-                self.y = random.uniform(0, constants.SCREEN_HEIGHT)
+                self.y = background_rng.uniform(0, constants.SCREEN_HEIGHT)
         elif scroll_direction == 1:  # Down
             self.y += drift
             if self.y > constants.SCREEN_HEIGHT + buffer:
                 self.y = -buffer
-                self.x = random.uniform(0, constants.SCREEN_WIDTH)
+                self.x = background_rng.uniform(0, constants.SCREEN_WIDTH)
         elif scroll_direction == 2:  # Right
             self.x += drift
             if self.x > constants.SCREEN_WIDTH + buffer:
                 self.x = -buffer
-                self.y = random.uniform(0, constants.SCREEN_HEIGHT)
+                self.y = background_rng.uniform(0, constants.SCREEN_HEIGHT)
         elif scroll_direction == 3:  # Up
             self.y -= drift
             if self.y < -buffer:
                 self.y = constants.SCREEN_HEIGHT + buffer
-                self.x = random.uniform(0, constants.SCREEN_WIDTH)
+                self.x = background_rng.uniform(0, constants.SCREEN_WIDTH)
     
-    def generate_surface(self, time):
+    def generate_surface(self, time, blob_rng=background_rng, noise_rng=nebula_rng):
+        """Generate the nebula surface with the configured renderer.
+
+        Runs on a worker thread, so callers pass their own blob_rng and
+        noise_rng rather than sharing registry streams with the main thread.
+        """
+        if constants.NEBULA_RENDERER == "blobs" and pnoise2 is not None:
+            return self.generate_blob_surface(time, blob_rng)
+        return self.generate_field_surface(time, noise_rng)
+    
+    def generate_field_surface(self, time, noise_rng=nebula_rng):
+        """Generate nebula surface by colouring a slice of the shared noise volume"""
+        volume = get_noise_volume(noise_rng)
+        frames, size = volume.shape[0], volume.shape[1]
+        pulse = 0.85 + 0.15 * math.sin(time * self.pulse_speed + self.time_offset)
+        
+        # Scroll through the volume over time, blending neighbouring slices
+        depth = (time * constants.NEBULA_NOISE_SPEED + self.time_offset) % frames
+        frame = int(depth)
+        blend = depth - frame
+        field = volume[frame] * (1 - blend) + volume[(frame + 1) % frames] * blend
+        # Each cloud looks at its own part of the tileable texture
+        field = np.roll(field, (int(self.noise_offset_x) % size, int(self.noise_offset_y) % size), axis=(0, 1))
+        
+        # Threshold the noise and fade it out towards the edge of the surface
+        coords = np.linspace(-1.0, 1.0, size)
+        distance = np.sqrt(coords[:, None] ** 2 + coords[None, :] ** 2)
+        falloff = np.clip(1.0 - distance / (0.85 * pulse), 0.0, 1.0)
+        density = np.clip((field - 0.3) / 0.5, 0.0, 1.0) * falloff
+        
+        color = np.array(self.color, dtype=float)
+        secondary = np.array(self.secondary_color, dtype=float)
+        rgb = color + (secondary - color) * density[..., None]
+        alpha = np.clip(self.alpha * 1.5 * density, 0, 255)
+        
+        texture = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.surfarray.pixels3d(texture)[...] = rgb.astype(np.uint8)
+        pygame.surfarray.pixels_alpha(texture)[...] = alpha.astype(np.uint8)
+        surf_size = int(self.size * 3)
+        return pygame.transform.smoothscale(texture, (surf_size, surf_size))
+    
+    def generate_blob_surface(self, time, blob_rng=background_rng):
         """Generate nebula surface using noise and overlapping circles"""
         surf_size = int(self.size * 3)
         surf = pygame.Surface((surf_size, surf_size), pygame.SRCALPHA)
@@ -112,7 +260,7 @@ class NebulaCloud:
             noise_y = pnoise2(blob * 0.5 + self.noise_offset_y, time * 0.1 + 100, octaves=2) * self.size * 0.4
             
             blob_pos = (center + noise_x, center + noise_y)
-            blob_radius = self.size * random.uniform(0.4, 0.7) * pulse
+            blob_radius = self.size * blob_rng.uniform(0.4, 0.7) * pulse
             
             # Layer colors and alphas
             layers = [
@@ -130,15 +278,10 @@ class NebulaCloud:
 
 class Background:
     def __init__(self):
-        self.stars = []
-        for _ in range(100):
-            self.stars.append(Star(1))
-        for _ in range(50):
-            self.stars.append(Star(2))
-        for _ in range(25):
-            self.stars.append(Star(3))
-        
+        self.stars = Starfield()
         self.nebulae = [NebulaCloud() for _ in range(12)]  # Increased from 5 to 12
+        # Seeds the shared noise volume if a worker of this background builds it
+        self.noise_rng = np.random.Generator(np.random.PCG64(nebula_rng.integers(2 ** 63)))
         self.time = 0
         self.scroll_direction = 0  # 0=left, 1=down, 2=right, 3=up
 
@@ -148,30 +291,46 @@ class Background:
 
     def update(self, dt):
         self.time += dt
-        for star in self.stars:
-            star.update(dt, self.scroll_direction)
+        self.stars.update(dt, self.scroll_direction)
         for nebula in self.nebulae:
             nebula.update(dt, self.scroll_direction)
 
-    def draw(self, screen):
-        # Draw nebulae with noise-based rendering
-        for nebula in self.nebulae:
-            # Regenerate surface every 2 seconds for subtle animation
-            if nebula.surface is None or (self.time - nebula.last_generated_time) > 2.0:
-                nebula.surface = nebula.generate_surface(self.time)
-                nebula.last_generated_time = self.time
+    def refresh_nebulae(self):
+        """Queue nebula regeneration ahead of time and swap in finished surfaces.
+
+        Never waits for a worker: a nebula keeps its old surface until the
+        new one is ready, and at most one nebula changes per frame. After the
+        first round each nebula is refreshed every NEBULA_REGEN_INTERVAL,
+        offset by its index so the clouds stay staggered.
+        """
+        swapped = False
+        for index, nebula in enumerate(self.nebulae):
+            job = nebula.pending
+            if job is not None and not swapped and job.done() and self.time >= nebula.swap_time:
+                first_round = nebula.surface is None
+                nebula.surface = job.result()
+                nebula.pending = None
+                swapped = True
+                if first_round:
+                    stagger = constants.NEBULA_REGEN_INTERVAL * index / len(self.nebulae)
+                    nebula.swap_time = self.time + constants.NEBULA_REGEN_INTERVAL + stagger
+                else:
+                    nebula.swap_time += constants.NEBULA_REGEN_INTERVAL
             
+            if nebula.pending is None and self.time >= nebula.swap_time - constants.NEBULA_PREFETCH:
+                blob_rng = random.Random(background_rng.random())
+                nebula.pending = get_nebula_executor().submit(nebula.generate_surface, nebula.swap_time,
+                                                              blob_rng, self.noise_rng)
+    
+    def draw(self, screen):
+        self.refresh_nebulae()
+        
+        # Draw nebulae with noise-based rendering (fewer at lower effect quality)
+        for nebula in self.nebulae[:budget.scale(len(self.nebulae))]:
             # Blit the pre-generated surface
             if nebula.surface:
                 surf_size = nebula.surface.get_width()
                 screen.blit(nebula.surface, (int(nebula.x - surf_size // 2), int(nebula.y - surf_size // 2)))
 
         # Draw stars
-        for star in self.stars:
-            twinkle = abs(math.sin(self.time * star.twinkle_speed + star.twinkle_offset))
-            alpha = int(star.alpha * (0.3 + 0.7 * twinkle))
-            color = (255, 255, 255, alpha)
-            
-            surf = pygame.Surface((int(star.size * 2), int(star.size * 2)), pygame.SRCALPHA)
-            pygame.draw.circle(surf, color, (int(star.size), int(star.size)), star.size)
-            screen.blit(surf, (int(star.x - star.size), int(star.y - star.size)))
+        self.stars.draw(screen, self.time)
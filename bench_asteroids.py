@@ -0,0 +1,171 @@
+"""Microbenchmark for store-backed asteroids.
+
+Times one simulation step plus grid rebuild, reaper pass and draw for a
+field of asteroids three ways:
+
+    legacy    plain Vector2 sprites updated one update() call at a time
+    property  AsteroidStore step, consumers reading each slot's properties
+    bulk      AsteroidStore step, consumers gathering the arrays in bulk
+
+Runs without a window:
+
+    python bench_asteroids.py [--count N] [--frames N] [--seed N]
+"""
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import constants as const
+import rng
+from asteroid import Asteroid
+from circleshape import CircleShape
+from reaper import EntityReaper
+from spatialhash import SpatialHash
+from timestep import draw_interpolated
+
+DT = 1 / 120
+PHASES = ("step", "rebuild", "reaper", "draw")
+
+
+class LegacyAsteroid(CircleShape):
+    """Asteroid as it was before AsteroidStore: kinematics on the sprite.
+
+    Drawing borrows the cached sprites of the store-backed twin so every
+    path blits the same surfaces.
+    """
+
+    def __init__(self, twin):
+        super().__init__(twin.position.x, twin.position.y, twin.radius)
+        self.twin = twin
+        self.velocity = pygame.Vector2(twin.velocity)
+        self.rotation = twin.rotation
+        self.rotation_speed = twin.rotation_speed
+
+    def update(self, dt):
+        self.position += self.velocity * dt
+        self.rotation += self.rotation_speed * dt
+
+    def draw(self, screen):
+        surf = Asteroid.sprite_cache.get(self.twin.entity_id, self.rotation, self.twin._render)
+        half = surf.get_width() // 2
+        screen.blit(surf, (int(self.position.x) - half, int(self.position.y) - half))
+
+
+def make_field(count, field_rng):
+    """count on-screen asteroids drifting slowly enough that none are reaped.
+
+    Spin is zeroed so each asteroid keeps one cached sprite and the draw
+    phase times blitting rather than re-rendering evicted surfaces.
+    """
+    group = pygame.sprite.Group()
+    for _ in range(count):
+        asteroid = Asteroid(field_rng.uniform(0, const.SCREEN_WIDTH),
+                            field_rng.uniform(0, const.SCREEN_HEIGHT),
+                            field_rng.uniform(const.ASTEROID_MIN_RADIUS, const.ASTEROID_MAX_RADIUS))
+        asteroid.velocity = (field_rng.uniform(-20, 20), field_rng.uniform(-20, 20))
+        asteroid.rotation_speed = 0.0
+        group.add(asteroid)
+    return group
+
+
+def per_sprite_consumers(screen, group, grid, reaper, laps):
+    """Grid rebuild, reaper and draw reading every asteroid one sprite at a time"""
+    start = time.perf_counter()
+    grid.clear()
+    for asteroid in group:
+        grid.insert(asteroid)
+    laps["rebuild"] += time.perf_counter() - start
+
+    start = time.perf_counter()
+    for asteroid in group:
+        reaper.is_outbound(asteroid)
+    laps["reaper"] += time.perf_counter() - start
+
+    start = time.perf_counter()
+    for asteroid in group:
+        draw_interpolated(asteroid, screen, 0.5)
+    laps["draw"] += time.perf_counter() - start
+
+
+def legacy_frame(screen, group, grid, reaper, laps):
+    """One frame with the original per-sprite update and consumers"""
+    start = time.perf_counter()
+    for asteroid in group:
+        asteroid.previous_position = asteroid.position.copy()
+        asteroid.update(DT)
+    laps["step"] += time.perf_counter() - start
+    per_sprite_consumers(screen, group, grid, reaper, laps)
+
+
+def property_frame(screen, group, grid, reaper, laps):
+    """One frame stepping the store but reading every slot through properties"""
+    start = time.perf_counter()
+    Asteroid.store.step(DT)
+    laps["step"] += time.perf_counter() - start
+    per_sprite_consumers(screen, group, grid, reaper, laps)
+
+
+def bulk_frame(screen, group, grid, reaper, laps):
+    """One frame stepping the store and gathering its arrays in bulk"""
+    start = time.perf_counter()
+    Asteroid.store.step(DT)
+    laps["step"] += time.perf_counter() - start
+
+    start = time.perf_counter()
+    grid.rebuild(group)
+    laps["rebuild"] += time.perf_counter() - start
+
+    start = time.perf_counter()
+    reaper.update(pygame.sprite.Group(), group)
+    laps["reaper"] += time.perf_counter() - start
+
+    start = time.perf_counter()
+    Asteroid.draw_batch(screen, group, 0.5)
+    laps["draw"] += time.perf_counter() - start
+
+
+def time_path(screen, group, frame, frames):
+    """Milliseconds per frame spent in each phase"""
+    grid = SpatialHash()
+    reaper = EntityReaper()
+    laps = dict.fromkeys(PHASES, 0.0)
+    frame(screen, group, grid, reaper, dict.fromkeys(PHASES, 0.0))  # Warm the sprite cache
+    for _ in range(frames):
+        screen.fill((0, 0, 0))
+        frame(screen, group, grid, reaper, laps)
+    return {phase: total * 1000 / frames for phase, total in laps.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark store-backed asteroid consumers")
+    parser.add_argument("--count", type=int, default=3000, help="asteroids in the field")
+    parser.add_argument("--frames", type=int, default=100, help="frames to time per path")
+    parser.add_argument("--seed", type=int, default=1, help="seed for the field layout")
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((const.SCREEN_WIDTH, const.SCREEN_HEIGHT))
+    rng.seed(args.seed)
+    Asteroid.sprite_cache.max_bytes = float("inf")
+    field = make_field(args.count, rng.stream("bench"))
+    legacy = pygame.sprite.Group(LegacyAsteroid(asteroid) for asteroid in field)
+
+    results = {
+        "legacy": time_path(screen, legacy, legacy_frame, args.frames),
+        "property": time_path(screen, field, property_frame, args.frames),
+        "bulk": time_path(screen, field, bulk_frame, args.frames),
+    }
+
+    print(f"{args.count} asteroids, ms/frame")
+    print(f"{'path':>8}  " + "  ".join(f"{phase:>7}" for phase in PHASES) + f"  {'total':>7}")
+    for name, laps in results.items():
+        row = "  ".join(f"{laps[phase]:>7.2f}" for phase in PHASES)
+        print(f"{name:>8}  {row}  {sum(laps.values()):>7.2f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Microbenchmark for the lightning ring renderer.
+
+Compares the old per-segment line drawing with RingBlast._draw_lightning_ring
+for 1, 3 and 10 concurrent charge-3 rings. Runs without a window:
+
+    python bench_lightning.py [--frames N] [--seed N]
+"""
+import argparse
+import math
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import constants as const
+import rng
+from ringblast import RingBlast
+from particles import LIGHTNING_GLOW, LIGHTNING_PRIMARY
+
+RING_COUNTS = (1, 3, 10)
+
+
+def legacy_lightning_ring(ring, screen, legacy_rng):
+    """The original renderer: 48 segments, each drawn as a glow line and a core line"""
+    num_segments = 48
+    points = []
+    for i in range(num_segments):
+        angle = (i / num_segments) * math.pi * 2
+        jitter = legacy_rng.uniform(-5, 5) if legacy_rng.random() > 0.7 else 0
+        radius = ring.current_radius + jitter
+        px = ring.position.x + math.cos(angle) * radius
+        py = ring.position.y + math.sin(angle) * radius
+        points.append((int(px), int(py)))
+
+    for i in range(len(points)):
+        next_i = (i + 1) % len(points)
+        pygame.draw.line(screen, LIGHTNING_GLOW, points[i], points[next_i], 4)
+        pygame.draw.line(screen, LIGHTNING_PRIMARY, points[i], points[next_i], 2)
+
+
+def make_rings(count):
+    """count charge-3 rings spread across the screen at staggered radii"""
+    rings = []
+    for i in range(count):
+        ring = RingBlast(const.SCREEN_WIDTH * (i + 1) / (count + 1), const.SCREEN_HEIGHT / 2, 3)
+        ring.current_radius = ring.max_radius * (i + 1) / (count + 1)
+        rings.append(ring)
+    return rings
+
+
+def time_path(screen, rings, draw, frames):
+    """Milliseconds per frame spent drawing every ring once per frame"""
+    screen.fill((0, 0, 0))
+    start = time.perf_counter()
+    for _ in range(frames):
+        for ring in rings:
+            draw(ring, screen)
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the lightning ring renderer")
+    parser.add_argument("--frames", type=int, default=300, help="frames to time per case")
+    parser.add_argument("--seed", type=int, default=1, help="seed for the jitter streams")
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((const.SCREEN_WIDTH, const.SCREEN_HEIGHT))
+    RingBlast.containers = ()
+    rng.seed(args.seed)
+    legacy_rng = random.Random(args.seed)
+
+    print(f"{'rings':>5}  {'old ms/frame':>12}  {'new ms/frame':>12}  {'speedup':>7}")
+    for count in RING_COUNTS:
+        rings = make_rings(count)
+        # Warm-up so stamp creation is not timed
+        time_path(screen, rings, RingBlast._draw_lightning_ring, 5)
+        old = time_path(screen, rings, lambda ring, surf: legacy_lightning_ring(ring, surf, legacy_rng), args.frames)
+        new = time_path(screen, rings, RingBlast._draw_lightning_ring, args.frames)
+        print(f"{count:>5}  {old:>12.3f}  {new:>12.3f}  {old / new:>6.2f}x")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,56 @@
 import pygame
-import random
 import math
-from circleshape import CircleShape
+import rng
+from circleshape import CircleShape, sweep_time
 from constants import *
 from powerup import PowerUp
 from ringblast import RingChargePowerUp
+from effectbudget import budget
+
+boss_rng = rng.stream("boss")  # Boss spawn edges and bounce deflection
+drop_rng = rng.stream("drops")
 
 class IceTrail(pygame.sprite.Sprite):
-    """Ice trail left by boss that damages player"""
+    """Ice trail left by boss that damages player.
+
+    Trails from the same boss are linked newest to oldest. With
+    ICE_TRAIL_MERGED each trail covers the capsule back to the previous one
+    and the newest trail draws the whole chain as a single layer; otherwise
+    each trail blits a cached circle stamp.
+    """
     containers = ()
+    stamps = {}  # (radius, alpha) -> pre-rendered trail circle
     
-    def __init__(self, x, y, radius):
+    def __init__(self, x, y, radius, previous_trail=None):
         super().__init__(*self.containers)
         self.position = pygame.Vector2(x, y)
         self.radius = radius
         self.lifetime = ICE_TRAIL_DURATION
         self.damage_cooldown = 0.0
+        self.previous_trail = previous_trail  # Older trail from the same boss
+        self.newest = True
+        if previous_trail is not None:
+            previous_trail.newest = False
+            previous_trail.chain_layer = None
+        self.chain_layer = None  # Merged chain layer, only kept by the newest trail
+        self.chain_key = None
+        self.chain_origin = (0, 0)
+    
+    @property
+    def link(self):
+        """Previous trail in the chain if it is still around"""
+        previous = self.previous_trail
+        if previous is not None and previous.alive():
+            return previous
+        return None
         
     def update(self, dt):
         self.lifetime -= dt
         if self.lifetime <= 0:
             self.kill()
+        if self.previous_trail is not None and not self.previous_trail.alive():
+            # Unlink expired trails so the chain does not keep them in memory
+            self.previous_trail = None
         
         # Update damage cooldown
         self.damage_cooldown += dt
@@ -34,26 +64,139 @@ class IceTrail(pygame.sprite.Sprite):
     
     def crash_check(self, other):
         """Check collision with another object"""
-        distance = self.position.distance_to(other.position)
-        return distance < self.radius + getattr(other, 'radius', 0)
+        reach = self.radius + getattr(other, 'radius', 0)
+        link = self.link if ICE_TRAIL_MERGED else None
+        if link is None:
+            return self.position.distance_to(other.position) < reach
+        # Distance to the capsule between this trail and the previous one
+        segment = link.position - self.position
+        length_sq = segment.length_squared()
+        t = 0.0
+        if length_sq > 0:
+            t = max(0.0, min(1.0, (other.position - self.position).dot(segment) / length_sq))
+        closest = self.position + segment * t
+        return closest.distance_to(other.position) < reach
+    
+    def sweep_check(self, other):
+        """Time of impact (0..1) of other's last step against this trail, or None.
+
+        Trails never move, so other is swept from previous_position to
+        position against the same circle or capsule crash_check tests.
+        """
+        start = getattr(other, "previous_position", other.position)
+        end = other.position
+        reach = self.radius + getattr(other, 'radius', 0)
+        hits = [sweep_time(start.x, start.y, end.x, end.y, self.position.x, self.position.y, reach)]
+        link = self.link if ICE_TRAIL_MERGED else None
+        if link is not None:
+            # Round end caps, then the straight sides between them
+            hits.append(sweep_time(start.x, start.y, end.x, end.y, link.position.x, link.position.y, reach))
+            segment = link.position - self.position
+            length = segment.length()
+            if length > 0:
+                axis = segment / length
+                normal = pygame.Vector2(-axis.y, axis.x)
+                offset = start - self.position
+                step = end - start
+                side = offset.dot(normal)
+                approach = step.dot(normal)
+                if abs(side) < reach:
+                    t = 0.0
+                elif side * approach < 0:
+                    t = (abs(side) - reach) / abs(approach)
+                else:
+                    t = None
+                if t is not None and t < 1 and 0 <= (offset + step * t).dot(axis) <= length:
+                    hits.append(t)
+        hits = [t for t in hits if t is not None]
+        return min(hits) if hits else None
+    
+    def bounds(self):
+        """Bounding circle (x, y, radius) used by the spatial hash"""
+        link = self.link if ICE_TRAIL_MERGED else None
+        if link is None:
+            return self.position.x, self.position.y, self.radius
+        middle = (self.position + link.position) / 2
+        return middle.x, middle.y, self.position.distance_to(link.position) / 2 + self.radius
+    
+    def fade_alpha(self):
+        """Current opacity quantised to ICE_TRAIL_ALPHA_BUCKETS levels"""
+        alpha = max(0.0, min(1.0, self.lifetime / ICE_TRAIL_DURATION))
+        levels = ICE_TRAIL_ALPHA_BUCKETS - 1
+        return round(alpha * levels) * 255 // levels
+    
+    @classmethod
+    def stamp(cls, radius, alpha, glow=True):
+        """Cached trail circle for a radius and fade level, optionally without the outer glow"""
+        key = (int(radius), alpha, glow)
+        surf = cls.stamps.get(key)
+        if surf is None:
+            # Draw icy blue trail with glow
+            surf = pygame.Surface((int(radius * 2), int(radius * 2)), pygame.SRCALPHA)
+            center = int(radius)
+            if glow:
+                pygame.draw.circle(surf, (100, 200, 255, alpha // 2), (center, center), int(radius))
+            pygame.draw.circle(surf, (150, 220, 255, alpha), (center, center), int(radius * 0.7))
+            pygame.draw.circle(surf, (200, 240, 255, alpha), (center, center), int(radius * 0.4), 2)
+            cls.stamps[key] = surf
+        return surf
         
     def draw(self, screen):
+        if ICE_TRAIL_MERGED:
+            # The newest trail of each chain draws the others
+            if self.newest:
+                self._draw_chain(screen)
+            return
         # Fade out ice trail as it expires
-        alpha = int(255 * (self.lifetime / ICE_TRAIL_DURATION))
-        alpha = max(0, min(255, alpha))
-        
-        # Draw icy blue trail with glow
-        surf = pygame.Surface((int(self.radius * 2), int(self.radius * 2)), pygame.SRCALPHA)
-        center = int(self.radius)
-        pygame.draw.circle(surf, (100, 200, 255, alpha // 2), (center, center), int(self.radius))
-        pygame.draw.circle(surf, (150, 220, 255, alpha), (center, center), int(self.radius * 0.7))
-        pygame.draw.circle(surf, (200, 240, 255, alpha), (center, center), int(self.radius * 0.4), 2)
+        surf = self.stamp(self.radius, self.fade_alpha(), glow=budget.quality >= 0.5)
         screen.blit(surf, (int(self.position.x - self.radius), int(self.position.y - self.radius)))
+    
+    def _draw_chain(self, screen):
+        """Draw this trail and every older one it links to as one capsule layer"""
+        chain = []
+        trail = self
+        while trail is not None:
+            chain.append(trail)
+            trail = trail.link
+        chain.reverse()  # Oldest first so fresher trails paint over older ones
+        
+        # Trails never move, so the layer is redrawn when the chain grows or
+        # shrinks or a trail fades to its next quantised level
+        glow = budget.quality >= 0.5
+        chain_key = (len(chain), glow, tuple(trail.fade_alpha() for trail in chain))
+        if self.chain_layer is None or self.chain_key != chain_key:
+            self.chain_key = chain_key
+            self.chain_layer, self.chain_origin = self._render_chain(chain, glow)
+        screen.blit(self.chain_layer, self.chain_origin)
+    
+    def _render_chain(self, chain, glow=True):
+        margin = int(self.radius) + 2
+        left = int(min(trail.position.x for trail in chain)) - margin
+        top = int(min(trail.position.y for trail in chain)) - margin
+        width = int(max(trail.position.x for trail in chain)) + margin - left
+        height = int(max(trail.position.y for trail in chain)) + margin - top
+        layer = pygame.Surface((width, height), pygame.SRCALPHA)
+        
+        points = [(int(trail.position.x) - left, int(trail.position.y) - top) for trail in chain]
+        alphas = [trail.fade_alpha() for trail in chain]
+        # Glow, then body, each as round-capped capsules between consecutive trails
+        passes = [((100, 200, 255), 1.0, 2), ((150, 220, 255), 0.7, 1)]
+        for color, scale, alpha_divisor in passes if glow else passes[1:]:
+            radius = int(self.radius * scale)
+            for i, point in enumerate(points):
+                rgba = (*color, alphas[i] // alpha_divisor)
+                if i > 0:
+                    pygame.draw.line(layer, rgba, points[i - 1], point, radius * 2)
+                pygame.draw.circle(layer, rgba, point, radius)
+        for point, alpha in zip(points, alphas):
+            pygame.draw.circle(layer, (200, 240, 255, alpha), point, int(self.radius * 0.4), 2)
+        return layer, (left, top)
 
 class BossAsteroid(CircleShape):
     """Large boss asteroid with ice trail and scaling HP"""
     sounds = {}
     boss_channel = None
+    sprites = {}  # (radius, glow frame) -> pre-rendered boss surface
     
     def __init__(self, boss_number):
         # Calculate HP with cumulative square root growth
@@ -63,19 +206,23 @@ class BossAsteroid(CircleShape):
         
         # Spawn from random edge
         edges = [
-            (-BOSS_RADIUS, random.uniform(0, SCREEN_HEIGHT), pygame.Vector2(1, 0)),  # Left
-            (SCREEN_WIDTH + BOSS_RADIUS, random.uniform(0, SCREEN_HEIGHT), pygame.Vector2(-1, 0)),  # Right
-            (random.uniform(0, SCREEN_WIDTH), -BOSS_RADIUS, pygame.Vector2(0, 1)),  # Top
-            (random.uniform(0, SCREEN_WIDTH), SCREEN_HEIGHT + BOSS_RADIUS, pygame.Vector2(0, -1))  # Bottom
+            (-BOSS_RADIUS, boss_rng.uniform(0, SCREEN_HEIGHT), pygame.Vector2(1, 0)),  # Left
+            (SCREEN_WIDTH + BOSS_RADIUS, boss_rng.uniform(0, SCREEN_HEIGHT), pygame.Vector2(-1, 0)),  # Right
+            (boss_rng.uniform(0, SCREEN_WIDTH), -BOSS_RADIUS, pygame.Vector2(0, 1)),  # Top
+            (boss_rng.uniform(0, SCREEN_WIDTH), SCREEN_HEIGHT + BOSS_RADIUS, pygame.Vector2(0, -1))  # Bottom
         ]
-        x, y, direction = random.choice(edges)
+        x, y, direction = boss_rng.choice(edges)
             
         super().__init__(x, y, BOSS_RADIUS)
         self.hp = hp
         self.max_hp = hp
-        self.velocity = direction.rotate(random.uniform(-15, 15)) * BOSS_SPEED
+        self.velocity = direction.rotate(boss_rng.uniform(-15, 15)) * BOSS_SPEED
         self.trail_timer = 0.0
         self.trail_interval = 0.3
+        self.last_trail = None
+        self.glow_time = 0.0
+        self.hp_bar_key = None  # (hp, font, width, height) the cached HP bar was drawn for
+        self.hp_bar_surface = None
         self.boss_number = boss_number
         
     def take_damage(self, damage):
@@ -85,6 +232,7 @@ class BossAsteroid(CircleShape):
             
     def update(self, dt):
         self.position += self.velocity * dt
+        self.glow_time += dt
         
         # Bounce off screen edges when center hits the edge
         bounced = False
@@ -96,7 +244,7 @@ class BossAsteroid(CircleShape):
             # Reverse X velocity and add randomness
             self.velocity.x = -self.velocity.x
             # Add random deflection
-            random_angle = random.uniform(-45, 45)
+            random_angle = boss_rng.uniform(-45, 45)
             self.velocity = self.velocity.rotate(random_angle)
             # Ensure minimum speed
             if self.velocity.length() < BOSS_SPEED * 0.8:
@@ -111,7 +259,7 @@ class BossAsteroid(CircleShape):
             self.velocity.y = -self.velocity.y
             # Add random deflection if we haven't already bounced this frame
             if not bounced:
-                random_angle = random.uniform(-45, 45)
+                random_angle = boss_rng.uniform(-45, 45)
                 self.velocity = self.velocity.rotate(random_angle)
                 # Ensure minimum speed
                 if self.velocity.length() < BOSS_SPEED * 0.8:
@@ -120,24 +268,74 @@ class BossAsteroid(CircleShape):
         # Leave ice trail
         self.trail_timer += dt
         if self.trail_timer >= self.trail_interval:
-            IceTrail(self.position.x, self.position.y, self.radius * 0.8)
+            self.last_trail = IceTrail(self.position.x, self.position.y, self.radius * 0.8, self.last_trail)
             self.trail_timer = 0.0
             
-    def draw(self, screen):
+    @classmethod
+    def sprite(cls, radius, frame=0):
+        """Cached boss surface for a radius and glow frame"""
+        key = (int(radius), frame)
+        surf = cls.sprites.get(key)
+        if surf is None:
+            surf = cls._render_sprite(radius, frame)
+            cls.sprites[key] = surf
+        return surf
+    
+    @staticmethod
+    def _render_sprite(radius, frame):
+        # Glow strength follows a sine pulse across the animation frames
+        pulse = 1.0
+        if BOSS_GLOW_FRAMES > 1:
+            pulse = 0.75 + 0.25 * math.sin(2 * math.pi * frame / BOSS_GLOW_FRAMES)
+        
         # Draw boss with special appearance
         # Outer glow
-        surf = pygame.Surface((int(self.radius * 2.5), int(self.radius * 2.5)), pygame.SRCALPHA)
-        center = int(self.radius * 1.25)
-        pygame.draw.circle(surf, (100, 255, 255, 40), (center, center), int(self.radius * 1.2))
-        pygame.draw.circle(surf, (150, 255, 255, 80), (center, center), int(self.radius))
+        surf = pygame.Surface((int(radius * 2.5), int(radius * 2.5)), pygame.SRCALPHA)
+        center = int(radius * 1.25)
+        pygame.draw.circle(surf, (100, 255, 255, int(40 * pulse)), (center, center), int(radius * 1.2))
+        pygame.draw.circle(surf, (150, 255, 255, int(80 * pulse)), (center, center), int(radius))
         # Main body
-        pygame.draw.circle(surf, (200, 255, 255, 200), (center, center), int(self.radius * 0.9))
+        pygame.draw.circle(surf, (200, 255, 255, 200), (center, center), int(radius * 0.9))
         # Core
-        pygame.draw.circle(surf, (255, 255, 255), (center, center), int(self.radius * 0.3))
+        pygame.draw.circle(surf, (255, 255, 255), (center, center), int(radius * 0.3))
         # Outline
-        pygame.draw.circle(surf, (255, 255, 255), (center, center), int(self.radius), 3)
-        
+        pygame.draw.circle(surf, (255, 255, 255), (center, center), int(radius), 3)
+        return surf
+    
+    def glow_frame(self):
+        """Index of the glow animation frame to show"""
+        if BOSS_GLOW_FRAMES <= 1:
+            return 0
+        return int(self.glow_time / BOSS_GLOW_PERIOD * BOSS_GLOW_FRAMES) % BOSS_GLOW_FRAMES
+            
+    def draw(self, screen):
+        surf = self.sprite(self.radius, self.glow_frame())
         screen.blit(surf, (int(self.position.x - self.radius * 1.25), int(self.position.y - self.radius * 1.25)))
+    
+    def hp_bar(self, font, bar_width, bar_height):
+        """HP bar with its caption underneath, redrawn only when hp changes"""
+        key = (self.hp, font, bar_width, bar_height)
+        if key != self.hp_bar_key:
+            text = font.render(f"BOSS {self.boss_number + 1}: {self.hp}/{self.max_hp} HP", True, (255, 255, 255))
+            width = max(bar_width, text.get_width())
+            surf = pygame.Surface((width, bar_height + 4 + text.get_height()), pygame.SRCALPHA)
+            bar_x = width // 2 - bar_width // 2
+            
+            # Background
+            pygame.draw.rect(surf, (50, 50, 50), (bar_x, 0, bar_width, bar_height))
+            
+            # HP bar
+            hp_percentage = max(0, self.hp) / self.max_hp
+            pygame.draw.rect(surf, (255, 50, 50), (bar_x, 0, bar_width * hp_percentage, bar_height))
+            
+            # Border
+            pygame.draw.rect(surf, (255, 255, 255), (bar_x, 0, bar_width, bar_height), 2)
+            
+            # Text
+            surf.blit(text, (width // 2 - text.get_width() // 2, bar_height + 4))
+            self.hp_bar_key = key
+            self.hp_bar_surface = surf
+        return self.hp_bar_surface
         
     def split(self):
         """Destroy boss and drop powerups"""
@@ -145,13 +343,13 @@ class BossAsteroid(CircleShape):
         
         # Drop 3 powerups with higher ring charge chance
         for _ in range(3):
-            kind = random.choice(["rapid_fire", "spread", "ring_charge", "ring_charge"])
-            direction = pygame.Vector2(1, 0).rotate(random.uniform(0, 360))
-            vel = direction * random.uniform(60, 120)
+            kind = drop_rng.choice(["rapid_fire", "spread", "ring_charge", "ring_charge"])
+            direction = pygame.Vector2(1, 0).rotate(drop_rng.uniform(0, 360))
+            vel = direction * drop_rng.uniform(60, 120)
             
             if kind == "ring_charge":
                 RingChargePowerUp(self.position.x, self.position.y, vel)
             else:
-                PowerUp(self.position.x, self.position.y, kind, vel)
+                PowerUp.spawn(self.position.x, self.position.y, kind, vel)
         
         self.kill()
\ No newline at end of file
@@ -1,7 +1,37 @@
+import itertools
+import math
 import pygame
 from constants import *
+from pool import Poolable
 
-class CircleShape(pygame.sprite.Sprite):
+# Stable identifiers that are never reused, unlike id() of recycled objects
+entity_ids = itertools.count(1)
+
+
+def sweep_time(x0, y0, x1, y1, cx, cy, reach):
+    """Time of impact of a point moving from (x0, y0) to (x1, y1) with a circle.
+
+    Returns the fraction of the move (0..1) at which the point first comes
+    within reach of (cx, cy), 0 if it starts inside, or None on a miss.
+    """
+    fx = x0 - cx
+    fy = y0 - cy
+    c = fx * fx + fy * fy - reach * reach
+    if c < 0:
+        return 0.0
+    dx = x1 - x0
+    dy = y1 - y0
+    a = dx * dx + dy * dy
+    if a == 0:
+        return None
+    b = fx * dx + fy * dy
+    disc = b * b - a * c
+    if b >= 0 or disc <= 0:
+        return None
+    t = (-b - math.sqrt(disc)) / a
+    return t if t < 1 else None
+
+class CircleShape(Poolable, pygame.sprite.Sprite):
     """Base class for circular game objects with collision detection"""
     
     def __init__(self, x, y, radius):
@@ -10,14 +40,35 @@ class CircleShape(pygame.sprite.Sprite):
         else:
             super().__init__()
 
+        self.entity_id = next(entity_ids)
         self.position = pygame.Vector2(x, y)
+        self.previous_position = pygame.Vector2(x, y)  # Position before the last simulation step
         self.velocity = pygame.Vector2(0, 0)
         self.radius = radius
 
+    def reset(self, x, y, radius):
+        """Reinitialise a recycled instance in place (see ObjectPool)"""
+        self.entity_id = next(entity_ids)
+        self.position.update(x, y)
+        self.previous_position.update(x, y)
+        self.velocity.update(0, 0)
+        self.radius = radius
+
     def crash_check(self, other):
         """Check if this object collides with another circular object"""
         return self.position.distance_to(other.position) < self.radius + other.radius
 
+    def sweep_check(self, other):
+        """Time of impact (0..1) of this object's last step against another, or None.
+
+        Sweeps from previous_position to position with the other object held
+        still, so fast movers cannot tunnel through small targets.
+        """
+        start = self.previous_position
+        end = self.position
+        return sweep_time(start.x, start.y, end.x, end.y,
+                          other.position.x, other.position.y, self.radius + other.radius)
+
     def draw(self, screen):
         """Override in subclasses to implement drawing"""
         pass
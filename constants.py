@@ -2,6 +2,34 @@ SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 STARTING_SCORE = 0
 
+# Simulation timing
+FIXED_TIMESTEP = 1 / 120  # Seconds per simulation step, independent of frame rate
+MAX_FRAME_TIME = 0.1  # Longest frame fed to the simulation (prevents catch-up spirals)
+RENDER_FPS_CAP = 144  # Upper bound on rendered frames per second (0 = uncapped)
+HEADLESS_FRAME_TIME = 1 / 60  # Simulated seconds per frame when running headless
+HEADLESS_DEFAULT_FRAMES = 3600  # Frames to run headless when --frames is not given
+
+# Adaptive effect quality
+EFFECT_TARGET_FRAME_TIME = 1 / 60  # Frame work time (s) the effect budget tries to hold
+EFFECT_BUDGET_WINDOW = 30  # Frames averaged before the quality level changes
+EFFECT_QUALITY_LEVELS = 4  # Quality steps, the top one is full detail
+EFFECT_DOWNGRADE_RATIO = 1.1  # Drop a level when frames average above target * this
+EFFECT_UPGRADE_RATIO = 0.7  # Raise a level when frames average below target * this
+
+# Dirty-rectangle rendering
+DIRTY_RECT_RENDERING = False  # Redraw and present only changed areas (also --dirty-rects)
+DIRTY_RECT_MARGIN = 6  # Padding (px) around each object's drawn area
+DIRTY_RECT_SCALE = 1.5  # Drawn extent of a circular object as a multiple of its radius
+DIRTY_RECT_MAX_COVERAGE = 0.5  # Fraction of the screen above which a full flip is cheaper
+DIRTY_BACKGROUND_INTERVAL = 0.25  # Seconds between redraws of the cached background layer
+
+# Performance overlay (F3)
+PERF_OVERLAY_HISTORY = 240  # Frames kept for the graph, percentiles and phase averages
+PERF_OVERLAY_REFRESH = 0.25  # Seconds between redraws of the overlay panel
+PERF_OVERLAY_WIDTH = 260  # Panel width (px), also the graph's frame capacity
+PERF_OVERLAY_FONT_SIZE = 18
+PERF_GRAPH_HEIGHT = 48  # Frame-time graph height (px)
+
 def set_resolution(width, height):
     """Update screen resolution and dependent constants"""
     global SCREEN_WIDTH, SCREEN_HEIGHT
@@ -26,11 +54,15 @@ ASTEROID_MIN_RADIUS = 20
 ASTEROID_KINDS = 3
 ASTEROID_SPAWN_RATE = 1  # seconds
 ASTEROID_MAX_RADIUS = ASTEROID_MIN_RADIUS * ASTEROID_KINDS
+ASTEROID_ROTATION_STEPS = 64  # Pre-rendered rotation angles per asteroid shape
+ASTEROID_SPRITE_CACHE_MB = 32  # Memory cap of the asteroid sprite cache
+ASTEROID_STORE_CAPACITY = 256  # Initial slots in the asteroid array store (grows as needed)
 ASTEROID_KILL_SCORE = 100
 SMALL_ASTEROID_SCORE = 500
 
 
 SHOT_RADIUS = 5
+SHOT_LIFETIME = 2.0  # Seconds before a missed shot is reaped (range = speed * lifetime)
 PLAYER_SHOT_SPEED = 500
 PLAYER_SHOT_COOLDOWN = 0.2
 PLAYER_SHOT_COOLDOWN_DEFAULT = PLAYER_SHOT_COOLDOWN
@@ -43,16 +75,21 @@ POWER_UP_DROP_CHANCE = 0.07
 POWERUP_RADIUS = 15 
 
 SCORE_FONT_SIZE = 24
+TEXT_CACHE_SIZE = 256  # Rendered strings kept by the shared text service
 
 # Boss asteroid settings
 BOSS_SPAWN_SCORE = 25000
 BOSS_RADIUS = ASTEROID_MAX_RADIUS * 1.5 * 1.5  # 1.5x larger again (2.25x total)
 BOSS_STARTING_HP = 100
+BOSS_GLOW_FRAMES = 1  # Cached frames of the boss glow pulse (1 = static glow)
+BOSS_GLOW_PERIOD = 1.5  # Seconds per glow pulse when BOSS_GLOW_FRAMES > 1
 BOSS_SPEED = 56  # 80% of asteroid speed (70 * 0.8 = 56, asteroids are 40-100 speed)
 BOSS_ASTEROID_SPAWN_MODIFIER = 0.75  # 75% spawn rate while boss alive
 BOSS_LIVES_REWARD = 2
 ICE_TRAIL_DURATION = 4.0
 ICE_TRAIL_DAMAGE_COOLDOWN = 0.5  # Damage player every 0.5s while touching
+ICE_TRAIL_ALPHA_BUCKETS = 16  # Fade levels of the cached ice trail stamps
+ICE_TRAIL_MERGED = True  # Draw and hit-test each boss's trail as one chain of capsules
 
 # Dash settings
 DASH_SPEED = 800
@@ -70,6 +107,13 @@ RING_CHARGE_1_BOSS_DAMAGE = 20
 RING_CHARGE_2_BOSS_DAMAGE = 60
 RING_CHARGE_3_BOSS_DAMAGE = 100
 RING_EXPANSION_SPEED = 1500  # pixels per second
+PARTICLE_ALPHA_LEVELS = 16  # Fade levels of cached ring blast particle stamps
+PARTICLE_ROTATION_STEPS = 24  # Rotation angles of cached ice crystal stamps
+RING_GLOW_RADIUS_STEP = 16  # Radius quantisation (px) of cached ring blast glows
+RING_GLOW_ALPHA_STEP = 4  # Alpha quantisation of cached ring blast glows
+RING_GLOW_CACHE_MAX_RADIUS = 256  # Larger glows are drawn clipped to the screen instead of cached
+RING_GLOW_CACHE_MB = 24  # Memory cap of the ring glow cache
+RING_LIGHTNING_GLOW_RADIUS = 4  # Radius (px) of the blurred halo stamps on lightning ring vertices
 
 # Shield settings
 SHIELD_MAX_HITS = 3
@@ -87,6 +131,27 @@ WEIRD_SHOT_EXPANSION_SPEED = 200  # How fast it expands
 WEIRD_SHOT_MAX_RADIUS = 60  # Maximum size
 WEIRD_SHOT_COOLDOWN = 2.0  # 2 second cooldown
 
+# Collision broadphase settings
+SPATIAL_HASH_CELL_SIZE = ASTEROID_MAX_RADIUS * 2  # Fits the largest regular asteroid
+SPATIAL_HASH_MAX_SPAN = 8  # Objects wider than this many cells skip bucketing
+COLLISION_BACKENDS = ("loop", "grid", "numpy")  # Bullet pass implementations, F2 cycles in game
+COLLISION_BACKEND = "grid"
+RING_WAVEFRONT_SLACK = 8  # Inward travel (px) per step an entity can make and still meet a ring wavefront
+
+# Entity reaper settings
+REAPER_MARGIN = ASTEROID_MAX_RADIUS * 2  # Off-screen distance before outbound entities despawn
+
+# Background settings
+STAR_COUNT = 175  # Stars in the parallax starfield, split 4:2:1 across the three layers
+STAR_ALPHA_LEVELS = 32  # Twinkle brightness levels in the star stamp atlas
+NEBULA_REGEN_INTERVAL = 2.0  # Seconds between nebula surface refreshes
+NEBULA_PREFETCH = 0.5  # Seconds ahead of its swap that a nebula starts regenerating
+NEBULA_WORKERS = 1  # Background threads generating nebula surfaces
+NEBULA_RENDERER = "field"  # "field" (NumPy noise texture) or "blobs" (circles placed with the noise extension)
+NEBULA_TEXTURE_SIZE = 48  # Noise texture resolution of the "field" renderer, its main quality knob
+NEBULA_NOISE_FRAMES = 32  # Time slices in the precomputed noise volume (loops)
+NEBULA_NOISE_SPEED = 1.0  # Noise volume slices scrolled through per second
+
 
 
 # Ship unlocks
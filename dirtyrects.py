@@ -0,0 +1,130 @@
+import pygame
+from constants import *
+from timestep import draw_interpolated
+
+
+def object_rect(obj, position):
+    """Screen area obj can touch when drawn with its center at position.
+
+    Objects with a draw_rect(position) method report their own extent;
+    image sprites use their rect, objects with bounds() their bounding
+    circle, and anything else a circle of DIRTY_RECT_SCALE times its radius.
+    """
+    custom = getattr(obj, "draw_rect", None)
+    if custom is not None:
+        return custom(position)
+    rect = getattr(obj, "rect", None)
+    if rect is not None:
+        return rect.inflate(DIRTY_RECT_MARGIN * 2, DIRTY_RECT_MARGIN * 2)
+    bounds = getattr(obj, "bounds", None)
+    if bounds is not None:
+        x, y, reach = bounds()
+    else:
+        x, y = position.x, position.y
+        reach = getattr(obj, "radius", 0) * DIRTY_RECT_SCALE
+    reach += DIRTY_RECT_MARGIN
+    return pygame.Rect(int(x - reach), int(y - reach), int(reach * 2) + 2, int(reach * 2) + 2)
+
+
+class DirtyRectRenderer:
+    """Draws a gameplay frame and presents only the screen areas that changed.
+
+    The background is rendered into a cached layer every
+    DIRTY_BACKGROUND_INTERVAL seconds instead of every frame. In between,
+    each area drawn last frame is erased by copying that part of the layer
+    back, and display.update() is given last frame's and this frame's
+    rects. Frames where the layer is refreshed, or where the dirty area
+    covers more than max_coverage of the screen, use a full flip instead.
+    When disabled, every frame is a plain fill, full redraw and flip.
+    """
+
+    def __init__(self, enabled=DIRTY_RECT_RENDERING, max_coverage=DIRTY_RECT_MAX_COVERAGE,
+                 background_interval=DIRTY_BACKGROUND_INTERVAL):
+        self.enabled = enabled
+        self.max_coverage = max_coverage
+        self.background_interval = background_interval
+        self.layer = None  # Cached background layer
+        self.layer_time = None  # Background time the layer was drawn at
+        self.previous_rects = []  # Areas drawn last frame
+        self.rects = []  # Areas drawn this frame
+        self.full_frame = True  # Whole screen was redrawn this frame
+
+        # Statistics for tuning the coverage threshold
+        self.partial_frames = 0
+        self.full_frames = 0
+
+    def invalidate(self):
+        """Force a full redraw next frame (after menus or a resolution change)"""
+        self.layer = None
+
+    def begin(self, screen, background):
+        """Start a frame: draw or restore the background under this frame's objects"""
+        self.rects = []
+        if not self.enabled:
+            screen.fill((0, 0, 0))
+            background.draw(screen)
+            self.full_frame = True
+            return
+
+        stale = (self.layer is None or self.layer.get_size() != screen.get_size()
+                 or background.time - self.layer_time >= self.background_interval)
+        if stale:
+            if self.layer is None or self.layer.get_size() != screen.get_size():
+                self.layer = pygame.Surface(screen.get_size()).convert()
+            self.layer.fill((0, 0, 0))
+            background.draw(self.layer)
+            self.layer_time = background.time
+        self.full_frame = stale or self._coverage(self.previous_rects) > self.max_coverage
+        if self.full_frame:
+            screen.blit(self.layer, (0, 0))
+        else:
+            screen.blits([(self.layer, rect, rect) for rect in self.previous_rects], doreturn=False)
+
+    def draw(self, obj, screen, alpha):
+        """Draw obj interpolated (see draw_interpolated) and record the area it covers"""
+        draw_interpolated(obj, screen, alpha)
+        if self.enabled:
+            previous = getattr(obj, "previous_position", None)
+            position = obj.position
+            if previous is not None:
+                position = previous.lerp(position, min(max(alpha, 0.0), 1.0))
+            self.mark(object_rect(obj, position))
+
+    def mark(self, rect):
+        """Record an area drawn this frame; returns rect so blits can be wrapped"""
+        if self.enabled:
+            self.rects.append(pygame.Rect(rect))
+        return rect
+
+    def present(self, screen):
+        """Show the frame with a full flip or an update of the dirty areas"""
+        if not self.enabled:
+            pygame.display.flip()
+            self.full_frames += 1
+            return
+
+        bounds = screen.get_rect()
+        current = [rect.clip(bounds) for rect in self.rects]
+        current = [rect for rect in current if rect]
+        dirty = self.previous_rects + current
+        if self.full_frame or self._coverage(dirty) > self.max_coverage:
+            pygame.display.flip()
+            self.full_frames += 1
+        else:
+            pygame.display.update(dirty)
+            self.partial_frames += 1
+        self.previous_rects = current
+
+    def _coverage(self, rects):
+        """Fraction of the layer the rects cover (overlaps counted twice)"""
+        width, height = self.layer.get_size()
+        return sum(rect.width * rect.height for rect in rects) / (width * height)
+
+    def stats(self):
+        """Summary of how often partial updates were used"""
+        total = self.partial_frames + self.full_frames
+        return {
+            "partial_frames": self.partial_frames,
+            "full_frames": self.full_frames,
+            "partial_ratio": round(self.partial_frames / total, 3) if total else 0.0,
+        }
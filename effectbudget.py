@@ -0,0 +1,50 @@
+from collections import deque
+from constants import *
+
+
+class EffectBudget:
+    """Adaptive quality level for cosmetic effects, driven by frame time.
+
+    The main loop records how long each frame took to produce (excluding
+    any frame-rate cap wait). Once per window the average is compared with
+    the target: a slow window drops one quality level and a comfortably
+    fast one raises it again. Effects ask scale() how many particles,
+    segments or layers to use at the current level.
+    """
+
+    def __init__(self, target_frame_time=EFFECT_TARGET_FRAME_TIME, window=EFFECT_BUDGET_WINDOW,
+                 levels=EFFECT_QUALITY_LEVELS):
+        self.target_frame_time = target_frame_time
+        self.levels = levels
+        self.level = levels - 1  # Start at full quality
+        self.frame_times = deque(maxlen=window)
+
+    @property
+    def quality(self):
+        """Current level as a fraction, 0.0 (lowest) to 1.0 (full)"""
+        return self.level / (self.levels - 1) if self.levels > 1 else 1.0
+
+    def record(self, frame_time):
+        """Add one frame's work time in seconds and adjust the level once per window"""
+        times = self.frame_times
+        times.append(frame_time)
+        if len(times) < times.maxlen:
+            return
+        average = sum(times) / len(times)
+        if average > self.target_frame_time * EFFECT_DOWNGRADE_RATIO and self.level > 0:
+            self.level -= 1
+        elif average < self.target_frame_time * EFFECT_UPGRADE_RATIO and self.level < self.levels - 1:
+            self.level += 1
+        times.clear()
+
+    def scale(self, count, minimum=1):
+        """count scaled to the current quality (a quarter of it at the lowest level)"""
+        return max(minimum, round(count * (0.25 + 0.75 * self.quality)))
+
+    def reset(self):
+        """Back to full quality with no history"""
+        self.level = self.levels - 1
+        self.frame_times.clear()
+
+
+budget = EffectBudget()  # Shared by every effect, fed by the main loop
@@ -0,0 +1,106 @@
+import math
+from collections import OrderedDict
+import pygame
+from constants import *
+
+
+class GlowCache:
+    """Translucent glow discs shared by every ring blast.
+
+    Discs up to max_radius are rendered once per (color, quantised radius,
+    quantised alpha) and kept in an LRU cache capped at max_megabytes, so
+    later rings of any element reuse them. Larger discs are never rendered
+    whole: only the part inside the screen's clip rect is drawn, into a
+    scratch layer that is reused from frame to frame.
+    """
+
+    def __init__(self, radius_step=RING_GLOW_RADIUS_STEP, alpha_step=RING_GLOW_ALPHA_STEP,
+                 max_radius=RING_GLOW_CACHE_MAX_RADIUS, max_megabytes=RING_GLOW_CACHE_MB):
+        self.radius_step = radius_step
+        self.alpha_step = alpha_step
+        self.max_radius = max_radius
+        self.max_bytes = int(max_megabytes * 1024 * 1024)
+        self.surfaces = OrderedDict()  # (color, radius, alpha) -> disc surface, oldest first
+        self.bytes = 0
+        self.scratch = None  # Screen-sized layer for glows too large to cache
+
+        # Statistics for tuning the quantisation steps and the memory cap
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.clipped = 0
+
+    def __len__(self):
+        return len(self.surfaces)
+
+    def draw(self, screen, center, radius, color, alpha):
+        """Blend a disc of color at alpha (0-255) centered on center onto screen"""
+        step = self.radius_step
+        radius = int(math.ceil(radius / step)) * step
+        alpha = min(255, int(round(alpha / self.alpha_step)) * self.alpha_step)
+        if radius <= 0 or alpha <= 0:
+            return
+        x, y = int(center[0]), int(center[1])
+        bounds = pygame.Rect(x - radius, y - radius, radius * 2, radius * 2)
+        visible = bounds.clip(screen.get_clip())
+        if not visible:
+            return
+
+        if radius <= self.max_radius:
+            screen.blit(self._disc(color, radius, alpha), bounds.topleft)
+        else:
+            self._draw_clipped(screen, visible, (x, y), radius, (*color, alpha))
+
+    def _disc(self, color, radius, alpha):
+        key = (color, radius, alpha)
+        surf = self.surfaces.get(key)
+        if surf is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surf
+
+        self.misses += 1
+        surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surf, (*color, alpha), (radius, radius), radius)
+        self.surfaces[key] = surf
+        self.bytes += surf.get_bytesize() * surf.get_width() * surf.get_height()
+        while self.bytes > self.max_bytes and len(self.surfaces) > 1:
+            _, old = self.surfaces.popitem(last=False)
+            self.bytes -= old.get_bytesize() * old.get_width() * old.get_height()
+            self.evictions += 1
+        return surf
+
+    def _draw_clipped(self, screen, visible, center, radius, rgba):
+        """Draw only the visible part of a large disc through the scratch layer"""
+        self.clipped += 1
+        size = screen.get_size()
+        if self.scratch is None or self.scratch.get_size() != size:
+            self.scratch = pygame.Surface(size, pygame.SRCALPHA)
+        scratch = self.scratch
+        scratch.fill((0, 0, 0, 0), visible)
+        scratch.set_clip(visible)
+        pygame.draw.circle(scratch, rgba, center, radius)
+        scratch.set_clip(None)
+        screen.blit(scratch, visible.topleft, visible)
+
+    def clear(self):
+        """Drop all cached discs and the scratch layer (statistics are kept)"""
+        self.surfaces.clear()
+        self.bytes = 0
+        self.scratch = None
+
+    def hit_ratio(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        """Summary of cache usage for logs and debug displays"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hit_ratio(), 3),
+            "evictions": self.evictions,
+            "clipped": self.clipped,
+            "surfaces": len(self.surfaces),
+            "megabytes": round(self.bytes / (1024 * 1024), 2),
+        }
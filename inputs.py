@@ -0,0 +1,157 @@
+import json
+import pygame
+
+# Keys polled every frame by Player.update, and their names in recordings
+HELD_KEYS = {
+    pygame.K_w: "w",
+    pygame.K_a: "a",
+    pygame.K_s: "s",
+    pygame.K_d: "d",
+    pygame.K_f: "f",
+    pygame.K_SPACE: "space",
+}
+
+# Keys acted on once per KEYDOWN by the gameplay loop
+PRESS_KEYS = {
+    pygame.K_r: "r",
+    pygame.K_LSHIFT: "lshift",
+}
+
+RECORDING_FORMAT = "pysteroids-input"
+RECORDING_VERSION = 1
+
+
+class InputFrame:
+    """Snapshot of the player's controls for one rendered frame.
+
+    Indexing with a pygame key constant works like the sequence returned by
+    pygame.key.get_pressed(), so it can stand in for live polling. The game
+    loop also flags frames where it emptied the fixed-step accumulator
+    (reset, after a pause) or switched collision backend (backend), so a
+    replay runs the same simulation steps.
+    """
+
+    def __init__(self, held=(), pressed=(), mouse_buttons=(False, False, False), mouse_pos=(0, 0), dt=0.0,
+                 reset=False, backend=None):
+        self.held = frozenset(held)
+        self.pressed = tuple(pressed)
+        self.mouse_buttons = tuple(mouse_buttons)
+        self.mouse_pos = tuple(mouse_pos)
+        self.dt = dt
+        self.reset = reset
+        self.backend = backend
+
+    def __getitem__(self, key):
+        return key in self.held
+
+    def to_dict(self):
+        """Compact JSON-friendly form used in recordings"""
+        data = {"dt": self.dt}
+        if self.held:
+            data["held"] = sorted(HELD_KEYS[key] for key in self.held)
+        if self.pressed:
+            data["pressed"] = [PRESS_KEYS[key] for key in self.pressed]
+        if any(self.mouse_buttons):
+            data["mouse"] = [int(button) for button in self.mouse_buttons]
+            data["pos"] = list(self.mouse_pos)
+        if self.reset:
+            data["reset"] = 1
+        if self.backend:
+            data["backend"] = self.backend
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        held_codes = {name: key for key, name in HELD_KEYS.items()}
+        press_codes = {name: key for key, name in PRESS_KEYS.items()}
+        return cls(
+            held=[held_codes[name] for name in data.get("held", ())],
+            pressed=[press_codes[name] for name in data.get("pressed", ())],
+            mouse_buttons=[bool(button) for button in data.get("mouse", (0, 0, 0))],
+            mouse_pos=data.get("pos", (0, 0)),
+            dt=data.get("dt", 0.0),
+            reset=bool(data.get("reset", 0)),
+            backend=data.get("backend"),
+        )
+
+
+def capture_input(events=(), dt=0.0):
+    """Build an InputFrame from the live keyboard, mouse and this frame's events"""
+    keys = pygame.key.get_pressed()
+    held = [key for key in HELD_KEYS if keys[key]]
+    pressed = [event.key for event in events
+               if event.type == pygame.KEYDOWN and event.key in PRESS_KEYS]
+    mouse_buttons = pygame.mouse.get_pressed()
+    mouse_pos = pygame.mouse.get_pos() if any(mouse_buttons) else (0, 0)
+    return InputFrame(held, pressed, mouse_buttons, mouse_pos, dt)
+
+
+class LiveInput:
+    """Input source that reads the real keyboard and mouse"""
+
+    def poll(self, events, dt):
+        return capture_input(events, dt)
+
+    def close(self):
+        pass
+
+
+class InputRecorder:
+    """Input source that passes live input through while writing it to a file.
+
+    Each frame is written when the next one is polled (or on close), so the
+    reset and backend flags the game loop sets while handling that frame's
+    events are recorded with it.
+    """
+
+    def __init__(self, path, header, source=None):
+        self.source = source or LiveInput()
+        self.file = open(path, "w")
+        self.frames = 0
+        self.pending = None  # Last polled frame, not yet written
+        header = dict(header, format=RECORDING_FORMAT, version=RECORDING_VERSION)
+        self.file.write(json.dumps(header) + "\n")
+
+    def poll(self, events, dt):
+        self.flush()
+        frame = self.pending = self.source.poll(events, dt)
+        self.frames += 1
+        return frame
+
+    def flush(self):
+        """Write the pending frame"""
+        if self.pending is not None:
+            self.file.write(json.dumps(self.pending.to_dict(), separators=(",", ":")) + "\n")
+            self.pending = None
+
+    def close(self):
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+
+class InputReplay:
+    """Input source that plays back a recording frame by frame"""
+
+    def __init__(self, path):
+        with open(path) as f:
+            self.header = json.loads(f.readline())
+            if self.header.get("format") != RECORDING_FORMAT:
+                raise ValueError(f"{path} is not a Pysteroids input recording")
+            self.frames = [InputFrame.from_dict(json.loads(line)) for line in f if line.strip()]
+        self.position = 0
+
+    @property
+    def finished(self):
+        return self.position >= len(self.frames)
+
+    def poll(self, events, dt):
+        """Next recorded frame, or None once the recording is exhausted"""
+        if self.finished:
+            return None
+        frame = self.frames[self.position]
+        self.position += 1
+        return frame
+
+    def close(self):
+        pass
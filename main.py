@@ -1,15 +1,16 @@
 import pygame
+import argparse
 import math
-import random
 import sys
 import os
+import time
 from constants import *
 import constants as const
 from player import Player
 from asteroid import Asteroid
 from asteroidfield import AsteroidField
 from circleshape import *
-from shot import Shot
+from shot import Shot, WeirdShot
 from background import Background
 from menu import Menu
 from pygame import mixer
@@ -17,6 +18,17 @@ from powerup import PowerUp
 from bossasteroid import BossAsteroid, IceTrail
 from ringblast import RingBlast, RingChargeManager, RingChargePowerUp
 from game_states import load_game_data, save_game_data, check_unlocks
+from spatialhash import SpatialHash
+from reaper import EntityReaper
+from narrowphase import circle_arrays, segment_arrays, swept_candidate_lists
+from pool import ObjectPool
+from timestep import FixedTimestep, store_previous_positions
+from inputs import LiveInput, InputRecorder, InputReplay
+from effectbudget import budget
+from text import text_service
+from dirtyrects import DirtyRectRenderer
+from perfoverlay import PerfOverlay
+import rng
 
 def resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
@@ -27,42 +39,15 @@ def resource_path(relative_path):
         base_path = os.path.abspath(".")
     return os.path.join(base_path, relative_path)
 
-pygame.init()
-mixer.init()
-# Set 32 channels and reserve specific ones for priority sounds
-pygame.mixer.set_num_channels(32)
-
-# Reserve dedicated channels for continuous/priority sounds
-laser_channel = pygame.mixer.Channel(0)      # Laser - highest priority
-music_channel = pygame.mixer.Channel(1)      # Reserved (not used, but kept free)
-boss_channel = pygame.mixer.Channel(2)       # Boss sounds - high priority
-# Channels 3-31 available for sound effects (asteroids, power-ups, etc.)
-
+# Audio handles, filled in by init_audio() (left empty when running headless)
+laser_channel = None
+music_channel = None
+boss_channel = None
 asteroid_sounds = {}
-try:
-    asteroid_sounds["asteroid_large"] = pygame.mixer.Sound(resource_path("assets/ogg/asteroid_large.ogg"))
-    asteroid_sounds["asteroid_small"] = pygame.mixer.Sound(resource_path("assets/ogg/asteroid_small.ogg"))
-    asteroid_sounds["asteroid_medium"] = pygame.mixer.Sound(resource_path("assets/ogg/asteroid_medium.ogg"))
-    asteroid_sounds["bossteroid"] = pygame.mixer.Sound(resource_path("assets/ogg/bossteroid.ogg"))
-    # Set volumes
-    asteroid_sounds["bossteroid"].set_volume(1.0)
-    asteroid_sounds["asteroid_large"].set_volume(0.4)
-    asteroid_sounds["asteroid_medium"].set_volume(0.25)
-    asteroid_sounds["asteroid_small"].set_volume(0.15)
-except pygame.error as e:
-    pass
-
-try:
-    laser_sound_1 = pygame.mixer.Sound(resource_path("assets/ogg/laser.ogg"))
-    laser_sound_1.set_volume(0.20)  # Slightly quieter so it doesn't drown out asteroids
-    rapid_fire_sound = pygame.mixer.Sound(resource_path("assets/ogg/rapid_fire.ogg"))
-    rapid_fire_sound.set_volume(0.20)
-    laser_sound = laser_sound_1
-    shotgun_sound = pygame.mixer.Sound(resource_path("assets/ogg/shotgun.ogg"))
-    shotgun_sound.set_volume(0.70)
-except pygame.error as e:
-    laser_sound = None
-    laser_channel = None
+laser_sound = None
+rapid_fire_sound = None
+shotgun_sound = None
+click_sound = None
 
 background_music = [
     resource_path("assets/ogg/Sci-Fi 1 Loop.ogg"),
@@ -77,7 +62,6 @@ background_music = [
 background_playlist = list(background_music)
 
 MUSIC_END = pygame.USEREVENT + 1
-pygame.mixer.music.set_endevent(MUSIC_END)
 
 def play_next(loop=False):
     global background_playlist
@@ -94,7 +78,54 @@ def play_next(loop=False):
     except pygame.error as e:
         pass
 
-play_next(loop=True) # starts music loop with assets
+def init_audio():
+    """Initialise the mixer, load sound effects and start the music loop"""
+    global laser_channel, music_channel, boss_channel
+    global laser_sound, rapid_fire_sound, shotgun_sound, click_sound
+
+    mixer.init()
+    # Set 32 channels and reserve specific ones for priority sounds
+    pygame.mixer.set_num_channels(32)
+
+    # Reserve dedicated channels for continuous/priority sounds
+    laser_channel = pygame.mixer.Channel(0)      # Laser - highest priority
+    music_channel = pygame.mixer.Channel(1)      # Reserved (not used, but kept free)
+    boss_channel = pygame.mixer.Channel(2)       # Boss sounds - high priority
+    # Channels 3-31 available for sound effects (asteroids, power-ups, etc.)
+
+    try:
+        asteroid_sounds["asteroid_large"] = pygame.mixer.Sound(resource_path("assets/ogg/asteroid_large.ogg"))
+        asteroid_sounds["asteroid_small"] = pygame.mixer.Sound(resource_path("assets/ogg/asteroid_small.ogg"))
+        asteroid_sounds["asteroid_medium"] = pygame.mixer.Sound(resource_path("assets/ogg/asteroid_medium.ogg"))
+        asteroid_sounds["bossteroid"] = pygame.mixer.Sound(resource_path("assets/ogg/bossteroid.ogg"))
+        # Set volumes
+        asteroid_sounds["bossteroid"].set_volume(1.0)
+        asteroid_sounds["asteroid_large"].set_volume(0.4)
+        asteroid_sounds["asteroid_medium"].set_volume(0.25)
+        asteroid_sounds["asteroid_small"].set_volume(0.15)
+    except pygame.error as e:
+        pass
+
+    try:
+        laser_sound_1 = pygame.mixer.Sound(resource_path("assets/ogg/laser.ogg"))
+        laser_sound_1.set_volume(0.20)  # Slightly quieter so it doesn't drown out asteroids
+        rapid_fire_sound = pygame.mixer.Sound(resource_path("assets/ogg/rapid_fire.ogg"))
+        rapid_fire_sound.set_volume(0.20)
+        laser_sound = laser_sound_1
+        shotgun_sound = pygame.mixer.Sound(resource_path("assets/ogg/shotgun.ogg"))
+        shotgun_sound.set_volume(0.70)
+    except pygame.error as e:
+        laser_sound = None
+        laser_channel = None
+
+    try:
+        click_sound = pygame.mixer.Sound(resource_path("assets/game_start.mp3"))
+    except pygame.error as e:
+        click_sound = None
+
+    pygame.mixer.music.set_endevent(MUSIC_END)
+    play_next(loop=True) # starts music loop with assets
+
 
 asteroids = pygame.sprite.Group()
 updatable = pygame.sprite.Group()
@@ -106,16 +137,59 @@ ring_blasts = pygame.sprite.Group()
 boss_asteroids = pygame.sprite.Group()
 
 Player.containers = updatable, drawable
-Asteroid.containers = (asteroids, updatable, drawable)
+# Asteroids are advanced by Asteroid.store and drawn by Asteroid.draw_batch,
+# not through updatable and drawable
+Asteroid.containers = (asteroids,)
 AsteroidField.containers = (updatable)
 bullets = pygame.sprite.Group()
 Shot.containers = (bullets, updatable, drawable)
+WeirdShot.containers = (bullets, updatable, drawable)  # Swept against asteroids like any bullet
 PowerUp.containers = (powerups, updatable, drawable)
 RingChargePowerUp.containers = (ring_charge_powerups, updatable, drawable)
 IceTrail.containers = (ice_trails, updatable, drawable)
 RingBlast.containers = (ring_blasts, updatable, drawable)
 BossAsteroid.containers = (boss_asteroids, asteroids, updatable, drawable)
 
+# Recycle short-lived entities instead of reallocating them
+Shot.pool = ObjectPool(Shot)
+Asteroid.pool = ObjectPool(Asteroid)
+PowerUp.pool = ObjectPool(PowerUp)
+pools = {"shots": Shot.pool, "asteroids": Asteroid.pool, "powerups": PowerUp.pool}
+
+# Collision broadphase grids, rebuilt every frame after entities move
+asteroid_grid = SpatialHash()
+pickup_grid = SpatialHash()
+trail_grid = SpatialHash()
+
+
+def bullet_hit_candidates(backend, bullet_list):
+    """Yield each bullet with the asteroids its last step swept through, earliest first.
+
+    "loop" is a brute-force scan, "grid" queries the spatial hash and "numpy"
+    runs the batched narrowphase against the whole field. All three sweep the
+    bullet from previous_position to position so fast shots cannot tunnel.
+    """
+    if backend == "numpy":
+        targets = list(asteroids)
+        starts, ends, bullet_radii = segment_arrays(bullet_list)
+        target_centers, target_radii = circle_arrays(targets)
+        lists = swept_candidate_lists(starts, ends, bullet_radii, target_centers, target_radii)
+        for bullet, indices in zip(bullet_list, lists):
+            yield bullet, [targets[i] for i in indices]
+    elif backend == "grid":
+        for bullet in bullet_list:
+            yield bullet, asteroid_grid.query_swept(bullet)
+    else:
+        for bullet in bullet_list:
+            # Re-listed per bullet so asteroids split this frame are seen
+            hits = []
+            for asteroid in list(asteroids):
+                t = bullet.sweep_check(asteroid)
+                if t is not None:
+                    hits.append((t, asteroid))
+            hits.sort(key=lambda hit: hit[0])
+            yield bullet, [asteroid for t, asteroid in hits]
+
 
 def reset_game():
     """reset game state"""
@@ -128,18 +202,84 @@ def reset_game():
     ice_trails.empty()
     ring_blasts.empty()
     boss_asteroids.empty()
-
-try:
-    click_sound = pygame.mixer.Sound(resource_path("assets/game_start.mp3"))
-except pygame.error as e:
-    click_sound = None
-
-def main():
+    Asteroid.store.clear()
+    Asteroid.sprite_cache.clear()
+    budget.reset()
+    for pool in pools.values():
+        pool.clear()
+
+def parse_resolution(value):
+    """Parse a WIDTHxHEIGHT resolution argument"""
+    try:
+        width, height = (int(part) for part in value.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"resolution must look like 1280x720, got {value!r}")
+    if width <= 0 or height <= 0:
+        raise argparse.ArgumentTypeError(f"resolution must be positive, got {value!r}")
+    return width, height
+
+
+def parse_args(argv=None):
+    """Parse command-line flags"""
+    parser = argparse.ArgumentParser(description="Pysteroids - a modern take on Asteroids")
+    parser.add_argument("--headless", action="store_true",
+                        help="run the gameplay loop without window, menus or audio and print timings")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="seed for random number generation")
+    parser.add_argument("--frames", type=int, default=None,
+                        help=f"stop after this many frames (headless default: {HEADLESS_DEFAULT_FRAMES})")
+    parser.add_argument("--ship", choices=list(SHIP_STATS), default=None,
+                        help="ship to fly instead of the one selected in the save file")
+    parser.add_argument("--resolution", type=parse_resolution, default=None,
+                        help="screen size as WIDTHxHEIGHT, e.g. 1920x1080")
+    parser.add_argument("--record", metavar="PATH", default=None,
+                        help="record the first game's input to PATH for later replay")
+    parser.add_argument("--replay", metavar="PATH", default=None,
+                        help="replay input recorded with --record (uses its seed, ship and resolution)")
+    parser.add_argument("--dirty-rects", action="store_true", default=DIRTY_RECT_RENDERING,
+                        help="only redraw and present the parts of the screen that changed")
+    return parser.parse_args(argv)
+
+
+def main(options=None):
+    if options is None:
+        options = parse_args([])
+    headless = options.headless
+    
+    # A replay restores the settings the recording was made with
+    replay = InputReplay(options.replay) if options.replay else None
+    if replay:
+        options.seed = replay.header.get("seed")
+        options.ship = replay.header.get("ship")
+        options.resolution = tuple(replay.header["resolution"])
+    elif options.record and options.seed is None:
+        # Recordings are only replayable from a known seed
+        options.seed = int.from_bytes(os.urandom(4), "little")
+    # Replays play back a single game, so they skip the menus like headless runs
+    use_menus = not headless and replay is None
+    
+    if headless:
+        # SDL dummy drivers need to be chosen before pygame initialises
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+    pygame.init()
+    if not headless:
+        init_audio()
+    
+    if options.seed is not None:
+        rng.seed(options.seed)
+    if options.resolution:
+        const.set_resolution(*options.resolution)
+    max_frames = options.frames
+    if max_frames is None and headless:
+        max_frames = HEADLESS_DEFAULT_FRAMES
+    
     screen = pygame.display.set_mode((const.SCREEN_WIDTH, const.SCREEN_HEIGHT))
     pygame.display.set_caption("Asteroids")
 
-    menu = Menu(screen, click_sound, MUSIC_END, play_next)
+    menu = None if headless else Menu(screen, click_sound, MUSIC_END, play_next)
     clock = pygame.time.Clock()
+    perf = PerfOverlay()
 
     # Assign sounds
     Asteroid.sounds = asteroid_sounds
@@ -150,37 +290,64 @@ def main():
     Player.rapid_fire_sound = rapid_fire_sound
     Player.shotgun_sound = shotgun_sound
     
-    # Set sound references in menu for live volume updates
-    menu.set_sound_references(laser_sound, rapid_fire_sound, shotgun_sound, asteroid_sounds)
-    
-    # Apply initial volume settings from menu
-    menu.apply_volumes(laser_sound, rapid_fire_sound, shotgun_sound, asteroid_sounds, click_sound)
+    if menu:
+        # Set sound references in menu for live volume updates
+        menu.set_sound_references(laser_sound, rapid_fire_sound, shotgun_sound, asteroid_sounds)
+        
+        # Apply initial volume settings from menu
+        menu.apply_volumes(laser_sound, rapid_fire_sound, shotgun_sound, asteroid_sounds, click_sound)
     
     # Load save data
     save_data = load_game_data()
+    
+    # Headless runs and replays never touch the save file
+    if not use_menus:
+        save_data = {
+            "highest_score": 0,
+            "unlocked_ships": list(SHIP_UNLOCKS),
+            "current_ship": options.ship or save_data['current_ship'],
+        }
+    frame_count = 0
+    run_start = time.perf_counter()
+    input_source = replay or LiveInput()
+    recorder = None
 
     # Main game loop - restarts when returning from menu
     game_running = True
     while game_running:
-        # Create initial background for menu
-        initial_background = Background()
-        
-        # Show initial menu and get selected resolution
-        selected_resolution = menu.show_initial_menu(initial_background)
-        
-        # Apply volume settings after returning from menu (user may have changed them)
-        menu.apply_volumes(laser_sound, rapid_fire_sound, shotgun_sound, asteroid_sounds, click_sound)
-        
-        # Update resolution if changed
-        if selected_resolution and selected_resolution != (const.SCREEN_WIDTH, const.SCREEN_HEIGHT):
-            const.set_resolution(selected_resolution[0], selected_resolution[1])
-            # Create new screen with updated resolution
-            screen = pygame.display.set_mode((const.SCREEN_WIDTH, const.SCREEN_HEIGHT))
-            menu.screen = screen  # Update menu's screen reference
-        
-        # Reload save data to get current ship (may have changed in unlockables menu)
-        save_data = load_game_data()
-        selected_ship = save_data['current_ship']
+        if use_menus:
+            # Create initial background for menu
+            initial_background = Background()
+            
+            # Show initial menu and get selected resolution
+            selected_resolution = menu.show_initial_menu(initial_background)
+            
+            # Apply volume settings after returning from menu (user may have changed them)
+            menu.apply_volumes(laser_sound, rapid_fire_sound, shotgun_sound, asteroid_sounds, click_sound)
+            
+            # Update resolution if changed
+            if selected_resolution and selected_resolution != (const.SCREEN_WIDTH, const.SCREEN_HEIGHT):
+                const.set_resolution(selected_resolution[0], selected_resolution[1])
+                # Create new screen with updated resolution
+                screen = pygame.display.set_mode((const.SCREEN_WIDTH, const.SCREEN_HEIGHT))
+                menu.screen = screen  # Update menu's screen reference
+            
+            # Reload save data to get current ship (may have changed in unlockables menu)
+            save_data = load_game_data()
+        selected_ship = options.ship or save_data['current_ship']
+
+        if replay or (options.record and recorder is None):
+            # Recorded and replayed games start from the same RNG state
+            rng.seed(options.seed)
+        if options.record and recorder is None:
+            # Only the first game is recorded
+            recorder = InputRecorder(options.record, {
+                "seed": options.seed,
+                "ship": selected_ship,
+                "resolution": [const.SCREEN_WIDTH, const.SCREEN_HEIGHT],
+                "backend": COLLISION_BACKEND,
+            })
+            input_source = recorder
 
         # Reset everything for new game
         reset_game()
@@ -196,9 +363,10 @@ def main():
         player = Player(const.SCREEN_WIDTH // 2, const.SCREEN_HEIGHT // 2, ship_type=selected_ship)
         player.lives = PLAYER_LIVES
         background = Background()
+        renderer = DirtyRectRenderer(enabled=options.dirty_rects)
 
         # HUD
-        font = pygame.font.Font(None, SCORE_FONT_SIZE)
+        font = text_service.font(SCORE_FONT_SIZE)
         score = STARTING_SCORE
         next_bonus = BONUS_PLAYER_LIFE_SCORE
         lives_gained = 0  # Track total lives gained for scroll direction
@@ -212,196 +380,299 @@ def main():
         ring_manager = RingChargeManager()
         next_ring_charge_score = RING_CHARGE_SCORE
         
+        # Bullet collision implementation, cycled with F2 for A/B timing
+        collision_backend = replay.header.get("backend", COLLISION_BACKEND) if replay else COLLISION_BACKEND
+        
+        # Despawns missed shots and asteroids that drifted away
+        reaper = EntityReaper()
+        
         # Dash tracking (reset player dash state)
         player.dash_cooldown = 0.0
         player.dash_active = False
 
-        dt = 0.0
+        frame_dt = 0.0
+        timestep = FixedTimestep()
         invincible_timer = 0.0
 
         playing = True
         while playing:  # Gameplay loop
-            for event in pygame.event.get():
+            perf.begin_frame()
+            events = pygame.event.get()
+            frame = input_source.poll(events, frame_dt)
+            if frame is None:
+                # Replay exhausted
+                playing = False
+                game_running = False
+                continue
+            if replay:
+                frame_dt = frame.dt
+                # Repeat the pauses and backend switches the recording made
+                if frame.reset:
+                    timestep.reset()
+                if frame.backend:
+                    collision_backend = frame.backend
+                    print(f"Collision backend: {collision_backend}")
+            Player.input_state = frame
+            
+            for event in events:
                 if event.type == pygame.QUIT:
                     playing = False
                     game_running = False
                 elif event.type == MUSIC_END:
                     play_next(loop=True)
                 elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
+                    if event.key == pygame.K_ESCAPE and use_menus:
                         # Pause menu - pass background
                         menu.show_pause_menu(background)
                         # Apply volume settings after returning from pause menu
                         menu.apply_volumes(laser_sound, rapid_fire_sound, shotgun_sound, asteroid_sounds, click_sound)
                         # Update screen reference in case resolution changed
                         screen = menu.screen
+                        renderer.invalidate()
                         # Flush the clock after unpausing to prevent time jump
                         clock.tick()  # Discard accumulated time
+                        timestep.reset()
+                        frame.reset = True  # Recorded so replays reset at the same frame
                         # Skip to next frame with fresh dt
                         continue
-                    elif event.key == pygame.K_r:
-                        # Fire ring blast if we have charges
-                        charge_level = ring_manager.use_charges()
-                        if charge_level > 0:
-                            RingBlast(player.position.x, player.position.y, charge_level)
-                            next_ring_charge_score = score + RING_CHARGE_SCORE
-                    elif event.key == pygame.K_LSHIFT:
-                        # Activate dash if available
-                        if player.dash_cooldown <= 0.0 and not player.dash_active:
-                            player.dash_active = True
-                            player.dash_timer = DASH_DURATION
-                            player.dash_cooldown = DASH_COOLDOWN
-                            # Dash in the direction the ship is facing (forward)
-                            player.dash_direction = pygame.Vector2(0, 1).rotate(player.rotation)
-
-            keys = pygame.key.get_pressed()
+                    elif event.key == pygame.K_F2 and not replay:
+                        # Cycle bullet collision backend (replays follow the recording instead)
+                        backend_index = COLLISION_BACKENDS.index(collision_backend)
+                        collision_backend = COLLISION_BACKENDS[(backend_index + 1) % len(COLLISION_BACKENDS)]
+                        frame.backend = collision_backend
+                        print(f"Collision backend: {collision_backend}")
+                    elif event.key == pygame.K_F3:
+                        perf.toggle()
+
+            # Gameplay keys come from the input frame so they can be recorded and replayed
+            for key in frame.pressed:
+                if key == pygame.K_r:
+                    # Fire ring blast if we have charges
+                    charge_level = ring_manager.use_charges()
+                    if charge_level > 0:
+                        RingBlast(player.position.x, player.position.y, charge_level)
+                        next_ring_charge_score = score + RING_CHARGE_SCORE
+                elif key == pygame.K_LSHIFT:
+                    # Activate dash if available
+                    if player.dash_cooldown <= 0.0 and not player.dash_active:
+                        player.dash_active = True
+                        player.dash_timer = DASH_DURATION
+                        player.dash_cooldown = DASH_COOLDOWN
+                        # Dash in the direction the ship is facing (forward)
+                        player.dash_direction = pygame.Vector2(0, 1).rotate(player.rotation)
+            perf.lap("events")
             
-            # Boss spawning - spawn all bosses due based on score with robustness
-            spawn_attempts = 0
-            max_spawn_attempts = 5  # Prevent infinite loops
-            while score >= next_boss_score and spawn_attempts < max_spawn_attempts:
-                spawn_attempts += 1
-                try:
-                    # Validate boss spawn parameters
-                    if bosses_spawned < 0:
-                        bosses_spawned = 0
+            # Run the simulation in fixed steps; drawing interpolates between them
+            timestep.advance(frame_dt)
+            for dt in timestep.steps():
+                # Interpolation source for moving entities
+                store_previous_positions(bullets, boss_asteroids, [player])
+                
+                # Boss spawning - spawn all bosses due based on score with robustness
+                spawn_attempts = 0
+                max_spawn_attempts = 5  # Prevent infinite loops
+                while score >= next_boss_score and spawn_attempts < max_spawn_attempts:
+                    spawn_attempts += 1
+                    try:
+                        # Validate boss spawn parameters
+                        if bosses_spawned < 0:
+                            bosses_spawned = 0
                     
-                    # Limit total number of concurrent bosses for performance
-                    max_concurrent_bosses = 3
-                    if len(boss_asteroids) >= max_concurrent_bosses:
-                        next_boss_score += BOSS_SPAWN_SCORE  # Still increment to prevent infinite spawning
-                        break
+                        # Limit total number of concurrent bosses for performance
+                        max_concurrent_bosses = 3
+                        if len(boss_asteroids) >= max_concurrent_bosses:
+                            next_boss_score += BOSS_SPAWN_SCORE  # Still increment to prevent infinite spawning
+                            break
                     
-                    # Validate constants
-                    if BOSS_SPAWN_SCORE <= 0:
-                        break
+                        # Validate constants
+                        if BOSS_SPAWN_SCORE <= 0:
+                            break
                     
-                    # Create boss with error handling
-                    boss = BossAsteroid(bosses_spawned)
-                    if boss and hasattr(boss, 'position'):  # Verify boss was created successfully
-                        bosses_spawned += 1
-                        next_boss_score += BOSS_SPAWN_SCORE
+                        # Create boss with error handling
+                        boss = BossAsteroid(bosses_spawned)
+                        if boss and hasattr(boss, 'position'):  # Verify boss was created successfully
+                            bosses_spawned += 1
+                            next_boss_score += BOSS_SPAWN_SCORE
                         
-                        # Play boss spawn sound safely on dedicated channel
-                        try:
-                            if asteroid_sounds and asteroid_sounds.get("bossteroid"):
-                                boss_channel.stop()  # Stop any current boss sound
-                                boss_channel.play(asteroid_sounds["bossteroid"])
-                        except Exception as e:
-                            pass
-                        
-                        # Modify asteroid spawn rate when first boss spawns
-                        if bosses_spawned == 1 and hasattr(asteroid_field, 'spawn_rate'):
+                            # Play boss spawn sound safely on dedicated channel
                             try:
-                                if BOSS_ASTEROID_SPAWN_MODIFIER > 0 and BOSS_ASTEROID_SPAWN_MODIFIER < 2:
-                                    asteroid_field.spawn_rate = asteroid_field.spawn_rate * BOSS_ASTEROID_SPAWN_MODIFIER
+                                if asteroid_sounds and asteroid_sounds.get("bossteroid"):
+                                    boss_channel.stop()  # Stop any current boss sound
+                                    boss_channel.play(asteroid_sounds["bossteroid"])
                             except Exception as e:
                                 pass
-                    else:
+                        
+                            # Modify asteroid spawn rate when first boss spawns
+                            if bosses_spawned == 1 and hasattr(asteroid_field, 'spawn_rate'):
+                                try:
+                                    if BOSS_ASTEROID_SPAWN_MODIFIER > 0 and BOSS_ASTEROID_SPAWN_MODIFIER < 2:
+                                        asteroid_field.spawn_rate = asteroid_field.spawn_rate * BOSS_ASTEROID_SPAWN_MODIFIER
+                                except Exception as e:
+                                    pass
+                        else:
+                            next_boss_score += BOSS_SPAWN_SCORE  # Skip this spawn threshold
+                            break
+                        
+                    except Exception as e:
                         next_boss_score += BOSS_SPAWN_SCORE  # Skip this spawn threshold
                         break
-                        
-                except Exception as e:
-                    next_boss_score += BOSS_SPAWN_SCORE  # Skip this spawn threshold
-                    break
             
-            # Track boss defeats - check if any bosses were killed this frame with validation
-            try:
-                current_boss_count = len(boss_asteroids) if boss_asteroids else 0
-                expected_alive = max(0, bosses_spawned - bosses_defeated)
+                # Track boss defeats - check if any bosses were killed this frame with validation
+                try:
+                    current_boss_count = len(boss_asteroids) if boss_asteroids else 0
+                    expected_alive = max(0, bosses_spawned - bosses_defeated)
                 
-                if current_boss_count < expected_alive:
-                    # One or more bosses were defeated
-                    num_defeated = expected_alive - current_boss_count
+                    if current_boss_count < expected_alive:
+                        # One or more bosses were defeated
+                        num_defeated = expected_alive - current_boss_count
                     
-                    # Validate defeat count is reasonable
-                    if num_defeated > 0 and num_defeated <= 10:  # Sanity check
-                        bosses_defeated += num_defeated
+                        # Validate defeat count is reasonable
+                        if num_defeated > 0 and num_defeated <= 10:  # Sanity check
+                            bosses_defeated += num_defeated
                         
-                        # Award lives safely
-                        if BOSS_LIVES_REWARD > 0 and BOSS_LIVES_REWARD <= 5:  # Reasonable reward
-                            lives_reward = BOSS_LIVES_REWARD * num_defeated
-                            player.lives += lives_reward
-                            lives_gained += lives_reward
+                            # Award lives safely
+                            if BOSS_LIVES_REWARD > 0 and BOSS_LIVES_REWARD <= 5:  # Reasonable reward
+                                lives_reward = BOSS_LIVES_REWARD * num_defeated
+                                player.lives += lives_reward
+                                lives_gained += lives_reward
                             
-                            # Update background scroll direction safely
-                            try:
-                                background.set_scroll_direction(lives_gained)
-                            except Exception as e:
-                                pass
-                    else:
-                        # Reset tracking to prevent issues
-                        bosses_defeated = bosses_spawned - current_boss_count
+                                # Update background scroll direction safely
+                                try:
+                                    background.set_scroll_direction(lives_gained)
+                                except Exception as e:
+                                    pass
+                        else:
+                            # Reset tracking to prevent issues
+                            bosses_defeated = bosses_spawned - current_boss_count
                 
-                # Restore normal asteroid spawn rate when all bosses are defeated
-                if (bosses_spawned > 0 and current_boss_count == 0 and 
-                    hasattr(asteroid_field, 'spawn_rate') and 
-                    asteroid_field.spawn_rate < ASTEROID_SPAWN_RATE):
-                    try:
-                        asteroid_field.spawn_rate = ASTEROID_SPAWN_RATE
-                    except Exception as e:
-                        pass
+                    # Restore normal asteroid spawn rate when all bosses are defeated
+                    if (bosses_spawned > 0 and current_boss_count == 0 and 
+                        hasattr(asteroid_field, 'spawn_rate') and 
+                        asteroid_field.spawn_rate < ASTEROID_SPAWN_RATE):
+                        try:
+                            asteroid_field.spawn_rate = ASTEROID_SPAWN_RATE
+                        except Exception as e:
+                            pass
                         
-            except Exception as e:
-                pass
+                except Exception as e:
+                    pass
+            
+                # Ring charge accumulation - drop ring charge powerups at score thresholds
+                while score >= next_ring_charge_score:
+                    # Drop a ring charge powerup at player position
+                    angle = rng.stream("drops").uniform(0, 360)
+                    dir_vec = pygame.Vector2(1, 0).rotate(angle)
+                    speed = 100.0
+                    vel = dir_vec * speed
+                    RingChargePowerUp(player.position.x, player.position.y, vel)
+                    next_ring_charge_score += RING_CHARGE_SCORE
+                perf.lap("boss bookkeeping")
+            
+                # Entities killed during the previous step become reusable
+                for pool in pools.values():
+                    pool.recycle()
             
-            # Ring charge accumulation - drop ring charge powerups at score thresholds
-            while score >= next_ring_charge_score:
-                # Drop a ring charge powerup at player position
-                angle = random.uniform(0, 360)
-                dir_vec = pygame.Vector2(1, 0).rotate(angle)
-                speed = 100.0
-                vel = dir_vec * speed
-                RingChargePowerUp(player.position.x, player.position.y, vel)
-                next_ring_charge_score += RING_CHARGE_SCORE
+                Asteroid.store.step(dt)
+                updatable.update(dt)
             
-            updatable.update(dt)
+                # Update ring blast cooldown
+                ring_manager.update(dt)
             
-            # Update ring blast cooldown
-            ring_manager.update(dt)
+                # Despawn expired shots and asteroids that left the screen
+                reaper.update(bullets, asteroids)
+                perf.lap("update")
             
-            # Handle regular powerup collection
-            for pu in list(powerups):
-                if player.crash_check(pu):
-                    print(f"Collecting {pu.kind} powerup")
-                    player.add_powerup(pu.kind)
-                    pu.kill()
-                    print(f"Powerup killed, remaining powerups: {len(powerups)}")
+                # Rebuild collision grids now that everything has moved
+                asteroid_grid.rebuild(asteroids)
+                pickup_grid.rebuild(powerups, ring_charge_powerups)
+                trail_grid.rebuild(ice_trails)
+                perf.lap("broadphase")
             
-            # Handle ring charge powerup collection
-            for rc in list(ring_charge_powerups):
-                if player.crash_check(rc):
-                    ring_manager.add_charge()
-                    rc.kill()
+                # Handle powerup collection (regular powerups first, then ring charges)
+                for pu in pickup_grid.query_swept(player):
+                    if pu.kind == "ring_charge":
+                        ring_manager.add_charge()
+                        pu.kill()
+                    else:
+                        print(f"Collecting {pu.kind} powerup")
+                        player.add_powerup(pu.kind)
+                        pu.kill()
+                        print(f"Powerup killed, remaining powerups: {len(powerups)}")
             
-            background.update(dt)
-
-            # Respawn invincibility timer
-            invincible_timer = max(0.0, invincible_timer - dt)
-
-            # Player vs asteroid collisions if not invincible and not dash-invincible and not stealthed
-            is_dash_invincible = player.is_invincible_dash() if hasattr(player, 'is_invincible_dash') else False
-            is_invisible = player.is_invisible() if hasattr(player, 'is_invisible') else False
-            if invincible_timer <= 0.0 and not is_dash_invincible and not is_invisible:
-                for asteroid in asteroids:
-                    if player.crash_check(asteroid):
-                        # Check if shield absorbed the damage
-                        damage_taken = True
-                        if hasattr(player, 'take_damage'):
-                            damage_taken = player.take_damage()
+
+                perf.lap("collide pickups")
+                
+                # Respawn invincibility timer
+                invincible_timer = max(0.0, invincible_timer - dt)
+
+                # Player vs asteroid collisions if not invincible and not dash-invincible and not stealthed
+                is_dash_invincible = player.is_invincible_dash() if hasattr(player, 'is_invincible_dash') else False
+                is_invisible = player.is_invisible() if hasattr(player, 'is_invisible') else False
+                vulnerable = invincible_timer <= 0.0 and not is_dash_invincible and not is_invisible
+                if vulnerable:
+                    for asteroid in asteroid_grid.query_swept(player):
+                        if asteroid.alive():
+                            # Check if shield absorbed the damage
+                            damage_taken = True
+                            if hasattr(player, 'take_damage'):
+                                damage_taken = player.take_damage()
+                        
+                            if damage_taken:
+                                lives_left = player.lives - 1
+                                if lives_left < 0:
+                                    if not use_menus:
+                                        game_running = False
+                                    else:
+                                        menu.show_game_over_menu(background)
+                                        # Apply volume settings after game over
+                                        menu.apply_volumes(laser_sound, rapid_fire_sound, shotgun_sound, asteroid_sounds, click_sound)
+                                        # Update screen reference in case resolution changed
+                                        screen = menu.screen
+                                    playing = False  # Exit to restart
+                                    break
+                                else:
+                                    # Respawn in center with remaining lives and invincibility
+                                    player.kill()
+                                    player = Player(const.SCREEN_WIDTH // 2, const.SCREEN_HEIGHT // 2)
+                                    player.lives = lives_left
+                                    # Reassign class-level sound references
+                                    Player.laser_sound = laser_sound
+                                    Player.laser_channel = laser_channel
+                                    Player.rapid_fire_sound = rapid_fire_sound
+                                    Player.shotgun_sound = shotgun_sound
+                                    invincible_timer = 1.5
+                                    # Reset ring charges on death
+                                    ring_manager.reset()
+                                    next_ring_charge_score = score + RING_CHARGE_SCORE
+                            break
+
+                perf.lap("collide asteroids")
+
+                if vulnerable:
+                    # Ice trail damage, swept so a dashing player cannot skip over a trail
+                    # Grid entries are bounding circles, merged trails confirm against the capsule
+                    touching = [trail for trail in trail_grid.query_swept(player) if trail.sweep_check(player) is not None]
+                    for trail in touching:
+                        if trail.can_damage():
+                            # Check if shield absorbed the damage
+                            damage_taken = True
+                            if hasattr(player, 'take_damage'):
+                                damage_taken = player.take_damage()
                         
-                        if damage_taken:
-                            lives_left = player.lives - 1
-                            if lives_left < 0:
-                                menu.show_game_over_menu(background)
-                                # Apply volume settings after game over
-                                menu.apply_volumes(laser_sound, rapid_fire_sound, shotgun_sound, asteroid_sounds, click_sound)
-                                # Update screen reference in case resolution changed
-                                screen = menu.screen
-                                playing = False  # Exit to restart
+                            if damage_taken:
+                                lives_left = player.lives - 1
+                                if lives_left < 0:
+                                    if not use_menus:
+                                        game_running = False
+                                    else:
+                                        menu.show_game_over_menu(background)
+                                        # Apply volume settings after game over
+                                        menu.apply_volumes(laser_sound, rapid_fire_sound, shotgun_sound, asteroid_sounds, click_sound)
+                                        # Update screen reference in case resolution changed
+                                        screen = menu.screen
+                                    playing = False
                                 break
                             else:
-                                # Respawn in center with remaining lives and invincibility
                                 player.kill()
                                 player = Player(const.SCREEN_WIDTH // 2, const.SCREEN_HEIGHT // 2)
                                 player.lives = lives_left
@@ -414,81 +685,52 @@ def main():
                                 # Reset ring charges on death
                                 ring_manager.reset()
                                 next_ring_charge_score = score + RING_CHARGE_SCORE
-                        break
-                
-                # Ice trail damage
-                for trail in ice_trails:
-                    if player.crash_check(trail) and trail.can_damage():
-                        # Check if shield absorbed the damage
-                        damage_taken = True
-                        if hasattr(player, 'take_damage'):
-                            damage_taken = player.take_damage()
-                        
-                        if damage_taken:
-                            lives_left = player.lives - 1
-                            if lives_left < 0:
-                                menu.show_game_over_menu(background)
-                                # Apply volume settings after game over
-                                menu.apply_volumes(laser_sound, rapid_fire_sound, shotgun_sound, asteroid_sounds, click_sound)
-                                # Update screen reference in case resolution changed
-                                screen = menu.screen
-                                playing = False
                             break
-                        else:
-                            player.kill()
-                            player = Player(const.SCREEN_WIDTH // 2, const.SCREEN_HEIGHT // 2)
-                            player.lives = lives_left
-                            # Reassign class-level sound references
-                            Player.laser_sound = laser_sound
-                            Player.laser_channel = laser_channel
-                            Player.rapid_fire_sound = rapid_fire_sound
-                            Player.shotgun_sound = shotgun_sound
-                            invincible_timer = 1.5
-                            # Reset ring charges on death
-                            ring_manager.reset()
-                            next_ring_charge_score = score + RING_CHARGE_SCORE
-                        break
 
-            # Bullet hits -> score and split asteroid
-            for bullet in list(bullets):
-                hit = False
-                for asteroid in list(asteroids):
-                    if bullet.crash_check(asteroid):
-                        bullet.kill()
-                        # Check if it's a boss
-                        if asteroid in boss_asteroids:
-                            asteroid.take_damage(1)
-                            hit = True
-                            break
-                        else:
-                            radius = getattr(asteroid, "radius", ASTEROID_MIN_RADIUS)
-                            if radius <= ASTEROID_MIN_RADIUS:
-                                score += SMALL_ASTEROID_SCORE
+                perf.lap("collide trails")
+                
+                # Bullet hits -> score and split asteroid
+                # With grid/numpy, asteroids split this frame are skipped and their children join next frame
+                for bullet, candidates in bullet_hit_candidates(collision_backend, list(bullets)):
+                    hit = False
+                    for asteroid in candidates:
+                        if asteroid.alive():
+                            bullet.kill()
+                            # Check if it's a boss
+                            if asteroid in boss_asteroids:
+                                asteroid.take_damage(1)
+                                hit = True
+                                break
                             else:
-                                score += ASTEROID_KILL_SCORE
-                            asteroid.split()
-                            hit = True
-                            break
-                if hit:
-                    # Bonus lives on score thresholds
-                    while score >= next_bonus:
-                        player.lives += 1
-                        lives_gained += 1  # Track lives gained
-                        background.set_scroll_direction(lives_gained)  # Update scroll direction
-                        next_bonus += BONUS_PLAYER_LIFE_SCORE
+                                radius = getattr(asteroid, "radius", ASTEROID_MIN_RADIUS)
+                                if radius <= ASTEROID_MIN_RADIUS:
+                                    score += SMALL_ASTEROID_SCORE
+                                else:
+                                    score += ASTEROID_KILL_SCORE
+                                asteroid.split()
+                                hit = True
+                                break
+                    if hit:
+                        # Bonus lives on score thresholds
+                        while score >= next_bonus:
+                            player.lives += 1
+                            lives_gained += 1  # Track lives gained
+                            background.set_scroll_direction(lives_gained)  # Update scroll direction
+                            next_bonus += BONUS_PLAYER_LIFE_SCORE
                     
-                    # Check for ship unlocks
-                    new_unlocks = check_unlocks(score, save_data)
-                    if new_unlocks:
-                        # Could show a notification here
-                        for ship in new_unlocks:
-                            print(f"New ship unlocked: {ship}!")
+                        # Check for ship unlocks
+                        new_unlocks = check_unlocks(score, save_data)
+                        if new_unlocks:
+                            # Could show a notification here
+                            for ship in new_unlocks:
+                                print(f"New ship unlocked: {ship}!")
             
-            # Ring blast collisions
-            for ring in ring_blasts:
-                # Damage asteroids
-                for asteroid in list(asteroids):
-                    if ring.crash_check(asteroid) and not ring.has_hit(asteroid):
+                perf.lap("collide bullets")
+                
+                # Ring blast collisions
+                for ring in ring_blasts:
+                    # Damage asteroids the wavefront reached this step
+                    for asteroid in ring.wavefront_targets(asteroid_grid):
                         ring.mark_hit(asteroid)
                         # Check if it's a boss
                         if asteroid in boss_asteroids:
@@ -501,22 +743,30 @@ def main():
                             else:
                                 score += ASTEROID_KILL_SCORE
                             asteroid.split()
-                            
+                        
                             # Bonus lives on score thresholds
                             while score >= next_bonus:
                                 player.lives += 1
                                 lives_gained += 1
                                 background.set_scroll_direction(lives_gained)
                                 next_bonus += BONUS_PLAYER_LIFE_SCORE
-                            
+                        
                             # Check for ship unlocks
                             new_unlocks = check_unlocks(score, save_data)
                             if new_unlocks:
                                 for ship in new_unlocks:
                                     print(f"New ship unlocked: {ship}!")
+                perf.lap("collide rings")
+                
+                if not playing:
+                    break
+
+            # Background is cosmetic and animates on real frame time
+            background.update(frame_dt)
+            alpha = timestep.alpha
 
-            screen.fill((0, 0, 0))
-            background.draw(screen)
+            renderer.begin(screen, background)
+            perf.lap("background")
 
             # Flicker player while invincible
             blink_on = True
@@ -524,10 +774,12 @@ def main():
                 blink_period_ms = 120
                 blink_on = ((pygame.time.get_ticks() // blink_period_ms) % 2) == 0
 
+            for rect in Asteroid.draw_batch(screen, asteroids, alpha):
+                renderer.mark(rect)
             for obj in drawable:
                 if obj is player and invincible_timer > 0.0 and not blink_on:
                     continue
-                obj.draw(screen)
+                renderer.draw(obj, screen, alpha)
 
             # Halo around player while invincible
             if invincible_timer > 0.0:
@@ -544,15 +796,17 @@ def main():
                     center = halo_size // 2
                     pygame.draw.circle(halo_surf, (180, 140, 255, 60), (center, center), int(r * 1.6), 2)
                     pygame.draw.circle(halo_surf, (180, 140, 255, 30), (center, center), int(r * 1.1), 0)
-                    screen.blit(halo_surf, (px - center, py - center))
-
-            # HUD
-            score_surf = font.render(f"Score: {score}", True, (200, 200, 220))
-            lives_surf = font.render(f"Lives: {player.lives}", True, (200, 200, 220))
-            bosses_surf = font.render(f"Bosses: {bosses_defeated}", True, (255, 200, 100))
-            screen.blit(score_surf, (10, 10))
-            screen.blit(lives_surf, (10, 10 + score_surf.get_height() + 4))
-            screen.blit(bosses_surf, (10, 10 + score_surf.get_height() + lives_surf.get_height() + 8))
+                    renderer.mark(screen.blit(halo_surf, (px - center, py - center)))
+
+            perf.lap("sprites")
+
+            # HUD (values that change every frame are composed from cached glyphs)
+            score_surf = text_service.render(font, f"Score: {score}", (200, 200, 220))
+            lives_surf = text_service.render(font, f"Lives: {player.lives}", (200, 200, 220))
+            bosses_surf = text_service.render(font, f"Bosses: {bosses_defeated}", (255, 200, 100))
+            renderer.mark(screen.blit(score_surf, (10, 10)))
+            renderer.mark(screen.blit(lives_surf, (10, 10 + score_surf.get_height() + 4)))
+            renderer.mark(screen.blit(bosses_surf, (10, 10 + score_surf.get_height() + lives_surf.get_height() + 8)))
             
             # Dash cooldown indicator
             if player.dash_cooldown > 0:
@@ -561,8 +815,11 @@ def main():
             else:
                 dash_text = "Dash: READY"
                 dash_color = (100, 255, 100)
-            dash_surf = font.render(dash_text, True, dash_color)
-            screen.blit(dash_surf, (10, 10 + score_surf.get_height() + lives_surf.get_height() + bosses_surf.get_height() + 12))
+            if player.dash_cooldown > 0:
+                dash_surf = text_service.compose(font, dash_text, dash_color)
+            else:
+                dash_surf = text_service.render(font, dash_text, dash_color)
+            renderer.mark(screen.blit(dash_surf, (10, 10 + score_surf.get_height() + lives_surf.get_height() + bosses_surf.get_height() + 12)))
             
             # Ring charge indicator
             current_charges = ring_manager.get_charges()
@@ -580,17 +837,27 @@ def main():
                 ring_text = f"Ring: 0/3"
                 ring_color = (150, 150, 150)
             
-            ring_surf = font.render(ring_text, True, ring_color)
-            screen.blit(ring_surf, (10, 10 + score_surf.get_height() + lives_surf.get_height() + bosses_surf.get_height() + dash_surf.get_height() + 16))
+            if ring_cooldown > 0:
+                ring_surf = text_service.compose(font, ring_text, ring_color)
+            else:
+                ring_surf = text_service.render(font, ring_text, ring_color)
+            renderer.mark(screen.blit(ring_surf, (10, 10 + score_surf.get_height() + lives_surf.get_height() + bosses_surf.get_height() + dash_surf.get_height() + 16)))
             
             # Powerup timers display (for debugging)
             y_offset = 10 + score_surf.get_height() + lives_surf.get_height() + bosses_surf.get_height() + dash_surf.get_height() + ring_surf.get_height() + 20
+            
+            # Effect quality indicator, only shown while the budget has scaled effects down
+            if budget.level < budget.levels - 1:
+                fx_surf = text_service.render(font, f"FX quality: {budget.level + 1}/{budget.levels}", (180, 180, 180))
+                renderer.mark(screen.blit(fx_surf, (10, y_offset)))
+                y_offset += fx_surf.get_height() + 4
+            
             for powerup_name, timer in player.powerups.items():
                 if timer > 0:
                     powerup_color = (255, 100, 100) if powerup_name == "rapid_fire" else (100, 100, 255)
                     powerup_text = f"{powerup_name}: {timer:.1f}s"
-                    powerup_surf = font.render(powerup_text, True, powerup_color)
-                    screen.blit(powerup_surf, (10, y_offset))
+                    powerup_surf = text_service.compose(font, powerup_text, powerup_color)
+                    renderer.mark(screen.blit(powerup_surf, (10, y_offset)))
                     y_offset += powerup_surf.get_height() + 4
             
             # Boss HP bar(s) at top center - show all active bosses
@@ -600,38 +867,72 @@ def main():
                 bar_spacing = 30
                 
                 for idx, boss in enumerate(boss_asteroids):
-                    bar_x = const.SCREEN_WIDTH // 2 - bar_width // 2
+                    # Bar and caption are cached on the boss until its hp changes
+                    bar_surf = boss.hp_bar(font, bar_width, bar_height)
                     bar_y = 10 + idx * bar_spacing
-                    
-                    # Background
-                    pygame.draw.rect(screen, (50, 50, 50), (bar_x, bar_y, bar_width, bar_height))
-                    
-                    # HP bar
-                    hp_percentage = boss.hp / boss.max_hp
-                    pygame.draw.rect(screen, (255, 50, 50), (bar_x, bar_y, bar_width * hp_percentage, bar_height))
-                    
-                    # Border
-                    pygame.draw.rect(screen, (255, 255, 255), (bar_x, bar_y, bar_width, bar_height), 2)
-                    
-                    # Text
-                    boss_text = f"BOSS {boss.boss_number + 1}: {boss.hp}/{boss.max_hp} HP"
-                    boss_surf = font.render(boss_text, True, (255, 255, 255))
-                    text_x = const.SCREEN_WIDTH // 2 - boss_surf.get_width() // 2
-                    text_y = bar_y + bar_height + 4
-                    screen.blit(boss_surf, (text_x, text_y))
-
-            pygame.display.flip()
-            dt = clock.tick(60) / 1000.0
-            # Cap dt to prevent huge jumps after pause or lag
-            dt = min(dt, 0.1)  # Max 100ms per frame
+                    renderer.mark(screen.blit(bar_surf, (const.SCREEN_WIDTH // 2 - bar_surf.get_width() // 2, bar_y)))
+
+            
+            # Performance overlay (F3)
+            if perf.visible:
+                counts = {
+                    "asteroids": len(asteroids),
+                    "bullets": len(bullets),
+                    "powerups": len(powerups) + len(ring_charge_powerups),
+                    "ice_trails": len(ice_trails),
+                    "ring_blasts": len(ring_blasts),
+                    "particles": sum(len(ring.particles) for ring in ring_blasts),
+                }
+                extra = [f"FX quality: {budget.level + 1}/{budget.levels}", f"Collisions: {collision_backend}"]
+                renderer.mark(perf.draw(screen, counts, extra))
+            perf.lap("hud")
+
+            renderer.present(screen)
+            perf.lap("present")
+            frame_count += 1
+            if max_frames is not None and frame_count >= max_frames:
+                playing = False
+                game_running = False
+            
+            if headless:
+                # Run flat out but simulate a steady frame rate so runs are comparable
+                clock.tick()
+                frame_dt = HEADLESS_FRAME_TIME
+            else:
+                # Frame time feeds the fixed-step accumulator, which caps long frames
+                frame_dt = clock.tick(RENDER_FPS_CAP) / 1000.0
+            # Work time before any cap delay drives the effect quality level
+            budget.record(clock.get_rawtime() / 1000.0)
+            perf.end_frame(clock.get_time() / 1000.0)
+        
+        print(f"Session entity stats: {reaper.stats()}")
+        for name, pool in pools.items():
+            print(f"Pool {name}: {pool.stats()}")
+        print(f"Asteroid sprite cache: {Asteroid.sprite_cache.stats()}")
+        print(f"Ring glow cache: {RingBlast.glow_cache.stats()}")
+        print(f"Text cache: {text_service.stats()}")
+        print(f"Dirty-rect renderer: {renderer.stats()}")
+        
+        if recorder and input_source is recorder:
+            recorder.close()
+            print(f"Recorded {recorder.frames} frames to {options.record}")
+            input_source = LiveInput()
         
         # After game ends, update high score
-        if score > save_data['highest_score']:
+        if use_menus and score > save_data['highest_score']:
             save_data['highest_score'] = score
             save_game_data(save_data)
 
+    if not use_menus:
+        elapsed = time.perf_counter() - run_start
+        fps = frame_count / elapsed if elapsed > 0 else 0.0
+        label = "Headless run" if headless else "Replay"
+        print(f"{label}: {frame_count} frames in {elapsed:.2f}s ({fps:.1f} frames/sec)")
+        print(f"Final state: score={score} lives={player.lives} asteroids={len(asteroids)} "
+              f"bullets={len(bullets)} bosses={len(boss_asteroids)} bosses_defeated={bosses_defeated}")
+
     pygame.quit()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(parse_args())
\ No newline at end of file
@@ -1,22 +1,25 @@
 import pygame
 import math
+import numpy as np
 from background import Background
+from text import text_service
 
 class Menu:
     def __init__(self, screen, click_sound=None, music_end_event=None, play_next_func=None):
         self.screen = screen
         
         # Fonts
-        self.font = pygame.font.Font(None, 48)
-        self.small_font = pygame.font.Font(None, 20)
-        self.medium_font = pygame.font.Font(None, 32)
-        self.large_font = pygame.font.Font(None, 64)
-        self.title_font = pygame.font.Font(None, 120)
+        self.font = text_service.font(48)
+        self.small_font = text_service.font(20)
+        self.medium_font = text_service.font(32)
+        self.large_font = text_service.font(64)
+        self.title_font = text_service.font(120)
         
         # Menu state
         self.menu_rect = pygame.Rect(400, 200, 480, 400)
         self.selected_resolution = (1280, 720)
         self.title_time = 0
+        self.title_banner = None  # (halo, text) surfaces baked on first draw
         
         # Volume settings (0.0 to 1.0)
         self.shot_volume = 0.5
@@ -50,43 +53,13 @@ class Menu:
         center_x = screen.get_width() // 2
         title_y = 80
         
-        title_text = "PYSTEROIDS"
-        
-        # Create multiple layers for neon glow effect (softer colors)
-        # Outer glow layers (muted cyan/magenta)
-        glow_colors = [
-            (180, 100, 200, int(30 * pulse)),  # Muted purple outer glow
-            (100, 180, 220, int(45 * pulse)),  # Muted cyan mid glow
-            (120, 160, 200, int(70 * pulse))   # Soft blue inner glow
-        ]
-        
-        for i, (r, g, b, alpha) in enumerate(glow_colors):
-            offset = (len(glow_colors) - i) * 3
-            glow_surf = self.title_font.render(title_text, True, (r, g, b))
-            glow_surf.set_alpha(alpha)
-            
-            # Create expanded glow by rendering multiple times with offsets
-            for dx in range(-offset, offset + 1, 2):
-                for dy in range(-offset, offset + 1, 2):
-                    glow_rect = glow_surf.get_rect(center=(center_x + dx, title_y + dy))
-                    screen.blit(glow_surf, glow_rect)
-        
-        # Main title with softer gradient effect (muted purple to cyan)
-        # Top half - softer cyan
-        main_surf_top = self.title_font.render(title_text, True, (120, 180, 220))
-        main_rect = main_surf_top.get_rect(center=(center_x, title_y))
-        
-        # Bottom half - softer purple
-        main_surf_bottom = self.title_font.render(title_text, True, (170, 120, 200))
-        
-        # Draw bottom half
-        screen.blit(main_surf_bottom, main_rect)
-        
-        # Clip and draw top half to create gradient
-        clip_rect = pygame.Rect(main_rect.x, main_rect.y, main_rect.width, main_rect.height // 2)
-        screen.set_clip(clip_rect)
-        screen.blit(main_surf_top, main_rect)
-        screen.set_clip(None)
+        # Glow halo and gradient text are baked once; only the halo's opacity pulses
+        if self.title_banner is None:
+            self.title_banner = self._render_title_banner("PYSTEROIDS")
+        halo_surf, main_surf = self.title_banner
+        halo_surf.set_alpha(int(255 * pulse))
+        screen.blit(halo_surf, halo_surf.get_rect(center=(center_x, title_y)))
+        screen.blit(main_surf, main_surf.get_rect(center=(center_x, title_y)))
         
         # Add gentle sparkle particles around title (slower, softer)
         for i in range(5):
@@ -104,12 +77,58 @@ class Menu:
             sparkle_color = (base_brightness, base_brightness + 20, base_brightness + 40)
             pygame.draw.circle(screen, sparkle_color, (sparkle_x, sparkle_y), sparkle_size)
 
+    def _render_title_banner(self, title_text):
+        """Bake the title's glow halo and gradient text, returns (halo, text) surfaces.
+
+        The halo reproduces the old per-frame effect (each glow layer blitted
+        on a grid of offsets) at full pulse, computed once with NumPy.
+        """
+        text_surf = self.title_font.render(title_text, True, (255, 255, 255))
+        width, height = text_surf.get_size()
+        coverage = pygame.surfarray.array_alpha(text_surf) / 255.0
+        
+        # Create multiple layers for neon glow effect (softer colors)
+        # Outer glow layers (muted cyan/magenta)
+        glow_colors = [
+            (180, 100, 200, 30),  # Muted purple outer glow
+            (100, 180, 220, 45),  # Muted cyan mid glow
+            (120, 160, 200, 70)   # Soft blue inner glow
+        ]
+        pad = len(glow_colors) * 3
+        size = (width + pad * 2, height + pad * 2)
+        halo_rgb = np.zeros(size + (3,))
+        halo_alpha = np.zeros(size)
+        for i, (r, g, b, alpha) in enumerate(glow_colors):
+            offset = (len(glow_colors) - i) * 3
+            # Expanded glow: every offset copy lets through (1 - alpha * coverage)
+            transparency = np.ones(size)
+            for dx in range(-offset, offset + 1, 2):
+                for dy in range(-offset, offset + 1, 2):
+                    transparency[pad + dx:pad + dx + width, pad + dy:pad + dy + height] *= 1 - alpha / 255 * coverage
+            layer_alpha = 1 - transparency
+            
+            # Composite this layer over the ones below it
+            combined = layer_alpha + halo_alpha * (1 - layer_alpha)
+            weight = np.divide(layer_alpha, combined, out=np.zeros(size), where=combined > 0)
+            halo_rgb = halo_rgb * (1 - weight[..., None]) + np.array((r, g, b)) * weight[..., None]
+            halo_alpha = combined
+        
+        halo_surf = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.surfarray.pixels3d(halo_surf)[...] = halo_rgb.astype(np.uint8)
+        pygame.surfarray.pixels_alpha(halo_surf)[...] = (halo_alpha * 255).astype(np.uint8)
+        
+        # Main title with softer gradient effect: muted cyan top half over a purple bottom half
+        main_surf = self.title_font.render(title_text, True, (170, 120, 200))
+        top_half = pygame.Rect(0, 0, width, height // 2)
+        main_surf.fill((0, 0, 0, 0), top_half)
+        main_surf.blit(self.title_font.render(title_text, True, (120, 180, 220)), (0, 0), top_half,
+                       special_flags=pygame.BLEND_RGBA_MAX)
+        return halo_surf, main_surf
+
     def _init_menu_background(self):
         """Initialize a menu background with slower, dimmer effects"""
         self.menu_background = Background()
-        for star in self.menu_background.stars:
-            star.alpha = int(star.alpha * 0.5)
-            star.twinkle_speed *= 0.3
+        self.menu_background.stars.scale(alpha=0.5, twinkle_speed=0.3)
         for nebula in self.menu_background.nebulae:
             nebula.alpha = int(nebula.alpha * 0.6)
             nebula.drift_speed *= 0.2
@@ -257,7 +276,7 @@ class Menu:
                     res_y_start = 250
                     for i, res in enumerate(resolutions):
                         res_text = f"{res[0]} x {res[1]}"
-                        res_surf = self.large_font.render(res_text, True, (255, 255, 255))
+                        res_surf = text_service.render(self.large_font, res_text, (255, 255, 255))
                         res_rect = res_surf.get_rect(center=(center_x, res_y_start + i * 100))
                         
                         if res_rect.inflate(40, 20).collidepoint(mouse_pos):
@@ -272,7 +291,7 @@ class Menu:
                             break
                     
                     # Back button
-                    back_text = self.font.render("Back", True, (255, 255, 255))
+                    back_text = text_service.render(self.font, "Back", (255, 255, 255))
                     back_rect = back_text.get_rect(center=(center_x, 500))
                     if back_rect.inflate(40, 20).collidepoint(mouse_pos):
                         self._play_click()
@@ -286,12 +305,12 @@ class Menu:
             self._draw_overlay(200)
             
             # Title
-            title = self.large_font.render("DISPLAY", True, (100, 200, 255))
+            title = text_service.render(self.large_font, "DISPLAY", (100, 200, 255))
             title_rect = title.get_rect(center=(self.screen.get_width() // 2, 100))
             self.screen.blit(title, title_rect)
             
             # Resolution label
-            res_label = self.font.render("Resolution:", True, (200, 200, 200))
+            res_label = text_service.render(self.font, "Resolution:", (200, 200, 200))
             res_label_rect = res_label.get_rect(center=(self.screen.get_width() // 2, 180))
             self.screen.blit(res_label, res_label_rect)
             
@@ -304,7 +323,7 @@ class Menu:
                 res_text = f"{res[0]} x {res[1]}"
                 color = (100, 255, 100) if i == selected_res_index else (200, 200, 200)
                 
-                res_surf = self.large_font.render(res_text, True, color)
+                res_surf = text_service.render(self.large_font, res_text, color)
                 res_rect = res_surf.get_rect(center=(center_x, res_y_start + i * 100))
                 
                 # Hover highlight
@@ -319,14 +338,14 @@ class Menu:
                 self._draw_asteroid_icon(asteroid_x, asteroid_y, size=20, selected=(i == selected_res_index))
             
             # Back button
-            back_text = self.font.render("Back", True, (255, 255, 255))
+            back_text = text_service.render(self.font, "Back", (255, 255, 255))
             back_rect = back_text.get_rect(center=(center_x, 500))
             if back_rect.inflate(40, 20).collidepoint(mouse_pos):
                 pygame.draw.rect(self.screen, (100, 100, 100), back_rect.inflate(40, 20), border_radius=10)
             self.screen.blit(back_text, back_rect)
             
             # Instructions
-            instruction = self.small_font.render("Press ESC to return", True, (150, 150, 150))
+            instruction = text_service.render(self.small_font, "Press ESC to return", (150, 150, 150))
             instruction_rect = instruction.get_rect(center=(center_x, 580))
             self.screen.blit(instruction, instruction_rect)
             
@@ -353,7 +372,7 @@ class Menu:
                 elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     mouse_pos = pygame.mouse.get_pos()
                     center_x = self.screen.get_width() // 2
-                    back_text = self.font.render("Back", True, (255, 255, 255))
+                    back_text = text_service.render(self.font, "Back", (255, 255, 255))
                     back_rect = back_text.get_rect(center=(center_x, 600))
                     if back_rect.inflate(40, 20).collidepoint(mouse_pos):
                         self._play_click()
@@ -367,7 +386,7 @@ class Menu:
             self._draw_overlay(180)
             
             # Title
-            title = self.large_font.render("CONTROLS", True, (100, 200, 255))
+            title = text_service.render(self.large_font, "CONTROLS", (100, 200, 255))
             title_rect = title.get_rect(center=(self.screen.get_width() // 2, 80))
             self.screen.blit(title, title_rect)
             
@@ -386,15 +405,15 @@ class Menu:
             
             y_offset = controls_y_start
             for key, description in controls:
-                key_text = self.medium_font.render(key, True, (100, 255, 100))
+                key_text = text_service.render(self.medium_font, key, (100, 255, 100))
                 key_rect = key_text.get_rect(midright=(left_x - 20, y_offset))
                 self.screen.blit(key_text, key_rect)
                 
-                separator = self.medium_font.render("-", True, (150, 150, 150))
+                separator = text_service.render(self.medium_font, "-", (150, 150, 150))
                 sep_rect = separator.get_rect(center=(left_x, y_offset))
                 self.screen.blit(separator, sep_rect)
                 
-                desc_text = self.medium_font.render(description, True, (200, 200, 200))
+                desc_text = text_service.render(self.medium_font, description, (200, 200, 200))
                 desc_rect = desc_text.get_rect(midleft=(left_x + 20, y_offset))
                 self.screen.blit(desc_text, desc_rect)
                 
@@ -404,7 +423,7 @@ class Menu:
             right_x = self.screen.get_width() * 2 // 3
             tips_y_start = 200
             
-            tips_title = self.font.render("TIPS", True, (255, 200, 100))
+            tips_title = text_service.render(self.font, "TIPS", (255, 200, 100))
             tips_title_rect = tips_title.get_rect(center=(right_x, tips_y_start - 40))
             self.screen.blit(tips_title, tips_title_rect)
             
@@ -426,7 +445,7 @@ class Menu:
             tips_y = tips_y_start
             for tip in tips:
                 if tip:
-                    tip_text = self.small_font.render(tip, True, (200, 200, 220))
+                    tip_text = text_service.render(self.small_font, tip, (200, 200, 220))
                     tip_rect = tip_text.get_rect(center=(right_x, tips_y))
                     self.screen.blit(tip_text, tip_rect)
                 tips_y += 30
@@ -434,13 +453,13 @@ class Menu:
             # Back button
             center_x = self.screen.get_width() // 2
             mouse_pos = pygame.mouse.get_pos()
-            back_text = self.font.render("Back", True, (255, 255, 255))
+            back_text = text_service.render(self.font, "Back", (255, 255, 255))
             back_rect = back_text.get_rect(center=(center_x, 600))
             if back_rect.inflate(40, 20).collidepoint(mouse_pos):
                 pygame.draw.rect(self.screen, (100, 100, 100), back_rect.inflate(40, 20), border_radius=10)
             self.screen.blit(back_text, back_rect)
             
-            instruction = self.small_font.render("Press ESC to return", True, (150, 150, 150))
+            instruction = text_service.render(self.small_font, "Press ESC to return", (150, 150, 150))
             instruction_rect = instruction.get_rect(center=(center_x, 650))
             self.screen.blit(instruction, instruction_rect)
             
@@ -463,21 +482,21 @@ class Menu:
                     center_x = self.screen.get_width() // 2
                     
                     # Display button
-                    display_text = self.font.render("Display", True, (255, 255, 255))
+                    display_text = text_service.render(self.font, "Display", (255, 255, 255))
                     display_rect = display_text.get_rect(center=(center_x, 250))
                     if display_rect.inflate(40, 20).collidepoint(mouse_pos):
                         self._play_click()
                         self._show_display_settings()
                     
                     # Sound button
-                    sound_text = self.font.render("Sound", True, (255, 255, 255))
+                    sound_text = text_service.render(self.font, "Sound", (255, 255, 255))
                     sound_rect = sound_text.get_rect(center=(center_x, 350))
                     if sound_rect.inflate(40, 20).collidepoint(mouse_pos):
                         self._play_click()
                         self._show_sound_settings()
                     
                     # Back button
-                    back_text = self.font.render("Back", True, (255, 255, 255))
+                    back_text = text_service.render(self.font, "Back", (255, 255, 255))
                     back_rect = back_text.get_rect(center=(center_x, 450))
                     if back_rect.inflate(40, 20).collidepoint(mouse_pos):
                         self._play_click()
@@ -491,7 +510,7 @@ class Menu:
             self._draw_overlay(200)
             
             # Title
-            title = self.large_font.render("SETTINGS", True, (100, 200, 255))
+            title = text_service.render(self.large_font, "SETTINGS", (100, 200, 255))
             title_rect = title.get_rect(center=(self.screen.get_width() // 2, 100))
             self.screen.blit(title, title_rect)
             
@@ -500,28 +519,28 @@ class Menu:
             mouse_pos = pygame.mouse.get_pos()
             
             # Display button
-            display_text = self.font.render("Display", True, (255, 255, 255))
+            display_text = text_service.render(self.font, "Display", (255, 255, 255))
             display_rect = display_text.get_rect(center=(center_x, 250))
             if display_rect.inflate(40, 20).collidepoint(mouse_pos):
                 pygame.draw.rect(self.screen, (100, 100, 100), display_rect.inflate(40, 20), border_radius=10)
             self.screen.blit(display_text, display_rect)
             
             # Sound button
-            sound_text = self.font.render("Sound", True, (255, 255, 255))
+            sound_text = text_service.render(self.font, "Sound", (255, 255, 255))
             sound_rect = sound_text.get_rect(center=(center_x, 350))
             if sound_rect.inflate(40, 20).collidepoint(mouse_pos):
                 pygame.draw.rect(self.screen, (100, 100, 100), sound_rect.inflate(40, 20), border_radius=10)
             self.screen.blit(sound_text, sound_rect)
             
             # Back button
-            back_text = self.font.render("Back", True, (255, 255, 255))
+            back_text = text_service.render(self.font, "Back", (255, 255, 255))
             back_rect = back_text.get_rect(center=(center_x, 450))
             if back_rect.inflate(40, 20).collidepoint(mouse_pos):
                 pygame.draw.rect(self.screen, (100, 100, 100), back_rect.inflate(40, 20), border_radius=10)
             self.screen.blit(back_text, back_rect)
             
             # Instructions
-            instruction = self.small_font.render("Press ESC to return", True, (150, 150, 150))
+            instruction = text_service.render(self.small_font, "Press ESC to return", (150, 150, 150))
             instruction_rect = instruction.get_rect(center=(center_x, 530))
             self.screen.blit(instruction, instruction_rect)
             
@@ -564,7 +583,7 @@ class Menu:
                             break
                     
                     # Back button
-                    back_text = self.font.render("Back", True, (255, 255, 255))
+                    back_text = text_service.render(self.font, "Back", (255, 255, 255))
                     back_rect = back_text.get_rect(center=(center_x, 550))
                     if back_rect.inflate(40, 20).collidepoint(mouse_pos):
                         self._play_click()
@@ -588,7 +607,7 @@ class Menu:
             self._draw_overlay(200)
             
             # Title
-            title = self.large_font.render("SOUND", True, (100, 200, 255))
+            title = text_service.render(self.large_font, "SOUND", (100, 200, 255))
             title_rect = title.get_rect(center=(self.screen.get_width() // 2, 80))
             self.screen.blit(title, title_rect)
             
@@ -600,14 +619,14 @@ class Menu:
             # Back button
             center_x = self.screen.get_width() // 2
             mouse_pos = pygame.mouse.get_pos()
-            back_text = self.font.render("Back", True, (255, 255, 255))
+            back_text = text_service.render(self.font, "Back", (255, 255, 255))
             back_rect = back_text.get_rect(center=(center_x, 550))
             if back_rect.inflate(40, 20).collidepoint(mouse_pos):
                 pygame.draw.rect(self.screen, (100, 100, 100), back_rect.inflate(40, 20), border_radius=10)
             self.screen.blit(back_text, back_rect)
             
             # Instructions
-            instruction = self.small_font.render("Press ESC to return", True, (150, 150, 150))
+            instruction = text_service.render(self.small_font, "Press ESC to return", (150, 150, 150))
             instruction_rect = instruction.get_rect(center=(center_x, 630))
             self.screen.blit(instruction, instruction_rect)
             
@@ -630,7 +649,7 @@ class Menu:
         center_x = self.screen.get_width() // 2
         
         # Label
-        label_text = self.medium_font.render(label, True, (200, 200, 200))
+        label_text = text_service.render(self.medium_font, label, (200, 200, 200))
         label_rect = label_text.get_rect(center=(center_x, y_pos - 40))
         self.screen.blit(label_text, label_rect)
         
@@ -650,7 +669,7 @@ class Menu:
         pygame.draw.circle(self.screen, (100, 180, 235), (handle_x, y_pos), 12)
         
         # Volume percentage
-        volume_text = self.small_font.render(f"{int(volume * 100)}%", True, (150, 150, 150))
+        volume_text = text_service.render(self.small_font, f"{int(volume * 100)}%", (150, 150, 150))
         volume_rect = volume_text.get_rect(center=(center_x + 200, y_pos))
         self.screen.blit(volume_text, volume_rect)
 
@@ -686,7 +705,7 @@ class Menu:
                     center_x = self.screen.get_width() // 2
                     
                     for i, button_text in enumerate(buttons):
-                        button_surf = self.font.render(button_text, True, (255, 255, 255))
+                        button_surf = text_service.render(self.font, button_text, (255, 255, 255))
                         button_rect = button_surf.get_rect(center=(center_x, self.menu_rect.top + y_start + i * 70))
                         
                         if button_rect.collidepoint(mouse_pos):
@@ -724,7 +743,7 @@ class Menu:
             
             # Game over text
             if menu_type == "game_over":
-                game_over_text = self.font.render("Game Over", True, (255, 0, 0))
+                game_over_text = text_service.render(self.font, "Game Over", (255, 0, 0))
                 text_rect = game_over_text.get_rect(center=(menu_rect.centerx, menu_rect.top + 50))
                 self.screen.blit(game_over_text, text_rect)
             
@@ -733,7 +752,7 @@ class Menu:
             mouse_pos = pygame.mouse.get_pos()
             
             for i, button_text in enumerate(buttons):
-                button_surf = self.font.render(button_text, True, (255, 255, 255))
+                button_surf = text_service.render(self.font, button_text, (255, 255, 255))
                 button_rect = button_surf.get_rect(center=(center_x, self.menu_rect.top + y_start + i * 70))
                 
                 # Hover effect
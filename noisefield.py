@@ -0,0 +1,42 @@
+import numpy as np
+
+
+def _smooth_resample(lattice, axis, length):
+    """Stretch a periodic lattice to length samples along axis with smoothstep interpolation"""
+    cells = lattice.shape[axis]
+    position = np.arange(length) * (cells / length)
+    index = position.astype(int)
+    weight = position - index
+    weight = weight * weight * (3 - 2 * weight)
+
+    shape = [1] * lattice.ndim
+    shape[axis] = length
+    weight = weight.reshape(shape)
+    low = np.take(lattice, index, axis=axis)
+    high = np.take(lattice, (index + 1) % cells, axis=axis)
+    return low + (high - low) * weight
+
+
+def fractal_noise(shape, base_cells=4, octaves=4, persistence=0.5, generator=None):
+    """Tileable fractal value noise in [0, 1] with the given array shape.
+
+    Each octave is a grid of random lattice values, base_cells * 2**octave
+    cells along every axis (capped at the axis length), stretched to the
+    full shape with separable smoothstep interpolation. Octaves are summed
+    with amplitudes persistence**octave and normalised. Wraps on every axis,
+    so the result can be scrolled or looped without seams.
+    """
+    if generator is None:
+        generator = np.random.default_rng()
+    total = np.zeros(shape)
+    amplitude = 1.0
+    norm = 0.0
+    for octave in range(octaves):
+        cells = [max(1, min(length, base_cells * 2 ** octave)) for length in shape]
+        field = generator.random(cells)
+        for axis, length in enumerate(shape):
+            field = _smooth_resample(field, axis, length)
+        total += field * amplitude
+        norm += amplitude
+        amplitude *= persistence
+    return total / norm
@@ -0,0 +1,239 @@
+import math
+import numpy as np
+import pygame
+import rng
+from constants import *
+
+particle_rng = rng.numpy_stream("particles")  # Cosmetic only, never affects gameplay
+
+# Element color constants
+ICE_PRIMARY = (150, 220, 255)
+ICE_SECONDARY = (200, 240, 255)
+ICE_HIGHLIGHT = (200, 240, 255)
+FIRE_CORE = (255, 255, 200)
+LIGHTNING_PRIMARY = (255, 255, 200)
+LIGHTNING_SECONDARY = (200, 180, 255)
+LIGHTNING_GLOW = (200, 150, 255)
+
+# Ember colours are picked from small palettes so their stamps can be cached
+FIRE_PALETTE = [(255, g, b) for g, b in ((150, 0), (167, 17), (183, 33), (200, 50))]
+FIRE_SECONDARY_PALETTE = [(255, g, 0) for g in (100, 117, 133, 150)]
+
+stamps = {}  # (shape, size, tint, rotation bucket, alpha) -> pre-rendered particle
+
+
+def _alpha_level(alpha):
+    """Quantise alphas (0-255 array) to the stamp cache's PARTICLE_ALPHA_LEVELS"""
+    levels = PARTICLE_ALPHA_LEVELS - 1
+    return (np.clip(alpha, 0, 255) * levels + 127) // 255 * 255 // levels
+
+
+def crystal_stamp(size, rotation_bucket, alpha):
+    """Cached ice crystal shard; the surface is centred on the particle"""
+    key = ("crystal", size, 0, rotation_bucket, alpha)
+    surf = stamps.get(key)
+    if surf is None:
+        crystal_length = size * 3
+        rotation = rotation_bucket * 360 / PARTICLE_ROTATION_STEPS
+        offset = crystal_length + 5
+        points = []
+        for i in range(3):
+            rad = math.radians((i * 120) + rotation)
+            dist = crystal_length if i == 0 else crystal_length * 0.3
+            points.append((offset + math.cos(rad) * dist, offset + math.sin(rad) * dist))
+        surf = pygame.Surface((int(crystal_length * 2 + 10), int(crystal_length * 2 + 10)), pygame.SRCALPHA)
+        pygame.draw.polygon(surf, (*ICE_SECONDARY, alpha // 2), points)
+        pygame.draw.polygon(surf, (*ICE_PRIMARY, alpha), points)
+        stamps[key] = surf
+    return surf
+
+
+def ember_stamp(size, tint, alpha):
+    """Cached fire ember; alpha already includes the flicker"""
+    key = ("ember", size, tint, 0, alpha)
+    surf = stamps.get(key)
+    if surf is None:
+        surf_size = int(size * 4 + 10)
+        surf = pygame.Surface((surf_size, surf_size), pygame.SRCALPHA)
+        center = surf_size // 2
+        pygame.draw.circle(surf, (*FIRE_SECONDARY_PALETTE[tint], int(alpha * 0.3)), (center, center), int(size * 2))
+        pygame.draw.circle(surf, (*FIRE_PALETTE[tint], int(alpha * 0.6)), (center, center), int(size * 1.2))
+        pygame.draw.circle(surf, (*FIRE_CORE, alpha), (center, center), int(size * 0.6))
+        stamps[key] = surf
+    return surf
+
+
+def glow_stamp(radius, color=LIGHTNING_GLOW):
+    """Cached soft dot for glow passes, blurred by scaling a disc down and back up"""
+    key = ("glow", radius, color, 0, 255)
+    surf = stamps.get(key)
+    if surf is None:
+        size = radius * 4
+        disc = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(disc, (*color, 160), (size // 2, size // 2), radius)
+        small = pygame.transform.smoothscale(disc, (max(1, size // 4), max(1, size // 4)))
+        surf = pygame.transform.smoothscale(small, (size, size))
+        stamps[key] = surf
+    return surf
+
+
+class ParticleBatch:
+    """Elemental particles of one element type stored as NumPy arrays.
+
+    Replaces per-particle objects: spawning, decay, drag and jitter are
+    vector operations over the whole batch, dead particles are compacted
+    away after each update, and drawing goes through cached stamps and a
+    single Surface.blits call (lightning arcs are drawn as polylines).
+    """
+    fields = ("x", "y", "vx", "vy", "life", "decay", "size", "rotation",
+              "rotation_speed", "age", "flicker", "arc_length", "tint")
+
+    def __init__(self, element):
+        self.element = element
+        for name in self.fields:
+            setattr(self, name, np.empty(0))
+
+    def __len__(self):
+        return len(self.life)
+
+    def bounds(self, margin):
+        """Rect around every particle padded by margin, or None when empty"""
+        if not len(self):
+            return None
+        left, top = int(self.x.min()) - margin, int(self.y.min()) - margin
+        return pygame.Rect(left, top, int(self.x.max()) + margin - left + 1, int(self.y.max()) + margin - top + 1)
+
+    def spawn(self, center_x, center_y, radius, count):
+        """Add count particles at random angles on a circle's edge"""
+        if count <= 0:
+            return
+        angle = particle_rng.uniform(0, 360, count)
+        rad = np.radians(angle)
+        new = {
+            "x": center_x + np.cos(rad) * radius,
+            "y": center_y + np.sin(rad) * radius,
+            "life": np.ones(count),
+            "age": np.zeros(count),
+            "rotation": np.zeros(count),
+            "rotation_speed": np.zeros(count),
+            "flicker": np.ones(count),
+            "arc_length": np.zeros(count),
+            "tint": np.zeros(count),
+        }
+
+        if self.element == "ice":
+            new["decay"] = particle_rng.uniform(3.5, 5.0, count)
+            new["size"] = particle_rng.uniform(2, 5, count)
+            heading = angle + particle_rng.uniform(-15, 15, count)
+            speed = particle_rng.uniform(80, 150, count)
+            new["rotation"] = particle_rng.uniform(0, 360, count)
+            new["rotation_speed"] = particle_rng.uniform(-300, 300, count)
+        elif self.element == "fire":
+            new["tint"] = particle_rng.integers(0, len(FIRE_PALETTE), count).astype(float)
+            new["decay"] = particle_rng.uniform(2.5, 4.0, count)
+            new["size"] = particle_rng.uniform(2, 6, count)
+            heading = angle + particle_rng.uniform(-30, 30, count)
+            speed = particle_rng.uniform(40, 80, count)
+            new["flicker"] = particle_rng.uniform(0.7, 1.0, count)
+        else:  # lightning
+            new["tint"] = particle_rng.integers(200, 256, count).astype(float)
+            new["decay"] = particle_rng.uniform(5.0, 8.0, count)
+            new["size"] = particle_rng.uniform(1, 3, count)
+            speed = particle_rng.uniform(100, 200, count)
+            heading = angle + particle_rng.uniform(-45, 45, count)
+            new["rotation"] = particle_rng.uniform(0, 360, count)
+            new["rotation_speed"] = particle_rng.uniform(-500, 500, count)
+            new["flicker"] = (particle_rng.random(count) > 0.4).astype(float)
+            new["arc_length"] = particle_rng.uniform(8, 15, count)
+
+        heading = np.radians(heading)
+        new["vx"] = np.cos(heading) * speed
+        new["vy"] = np.sin(heading) * speed
+        if self.element == "fire":
+            # Embers drift upwards
+            new["vy"] -= particle_rng.uniform(30, 60, count)
+
+        for name in self.fields:
+            setattr(self, name, np.concatenate((getattr(self, name), new[name])))
+
+    def update(self, dt):
+        """Advance every particle, then drop the ones that faded out"""
+        if not len(self):
+            return
+        self.age += dt
+        self.life -= self.decay * dt
+        self.x += self.vx * dt
+        self.y += self.vy * dt
+        self.rotation += self.rotation_speed * dt
+
+        if self.element == "fire":
+            # Fire slows down and flickers
+            self.vx *= 0.96
+            self.vy *= 0.96
+            self.flicker = 0.7 + 0.3 * np.sin(self.age * 15)
+        elif self.element == "lightning":
+            # Lightning changes direction erratically
+            jolt = particle_rng.random(len(self)) < 0.3
+            turn = np.radians(particle_rng.uniform(-30, 30, int(np.count_nonzero(jolt))))
+            cos, sin = np.cos(turn), np.sin(turn)
+            vx, vy = self.vx[jolt], self.vy[jolt]
+            self.vx[jolt] = vx * cos - vy * sin
+            self.vy[jolt] = vx * sin + vy * cos
+
+        alive = self.life > 0
+        if not alive.all():
+            for name in self.fields:
+                setattr(self, name, getattr(self, name)[alive])
+
+    def draw(self, screen):
+        if not len(self):
+            return
+        alpha = (255 * self.life).astype(int)
+        if self.element == "ice":
+            self._draw_crystals(screen, alpha)
+        elif self.element == "fire":
+            self._draw_embers(screen, alpha)
+        else:
+            self._draw_arcs(screen)
+
+    def _draw_crystals(self, screen, alpha):
+        sizes = (np.round(self.size * 2) / 2).tolist()
+        buckets = (np.round(self.rotation * PARTICLE_ROTATION_STEPS / 360) % PARTICLE_ROTATION_STEPS).astype(int).tolist()
+        alphas = _alpha_level(alpha).tolist()
+        blits = []
+        for x, y, size, bucket, level in zip(self.x.tolist(), self.y.tolist(), sizes, buckets, alphas):
+            offset = size * 3 + 5
+            blits.append((crystal_stamp(size, bucket, level), (int(x - offset), int(y - offset))))
+        screen.blits(blits, doreturn=False)
+
+    def _draw_embers(self, screen, alpha):
+        sizes = (np.round(self.size * 2) / 2).tolist()
+        alphas = _alpha_level(alpha * self.flicker).tolist()
+        blits = []
+        for x, y, size, tint, level in zip(self.x.tolist(), self.y.tolist(), sizes,
+                                           self.tint.astype(int).tolist(), alphas):
+            half = int(size * 4 + 10) // 2
+            blits.append((ember_stamp(size, tint, level), (int(x - half), int(y - half))))
+        screen.blits(blits, doreturn=False)
+
+    def _draw_arcs(self, screen):
+        """Draw lightning arcs as jagged polylines with a glow and a core pass"""
+        count = len(self)
+        visible = (self.flicker > 0) | (particle_rng.random(count) > 0.3)
+        rad = np.radians(self.rotation)
+        dx, dy = np.cos(rad), np.sin(rad)
+        length = self.arc_length
+
+        # Two jittered midpoints per arc, offset perpendicular to the arc
+        t = np.array([0.0, 1 / 3, 2 / 3, 1.0])
+        jitter = particle_rng.uniform(-0.3, 0.3, (count, 4)) * length[:, None]
+        jitter[:, [0, 3]] = 0
+        along = t[None, :] * length[:, None]
+        xs = self.x[:, None] + dx[:, None] * along - dy[:, None] * jitter
+        ys = self.y[:, None] + dy[:, None] * along + dx[:, None] * jitter
+        points = np.stack((xs, ys), axis=2).astype(int)
+
+        for arc, tint, shown in zip(points.tolist(), self.tint.astype(int).tolist(), visible.tolist()):
+            if shown:
+                pygame.draw.lines(screen, LIGHTNING_SECONDARY, False, arc, 3)
+                pygame.draw.lines(screen, (255, 255, tint), False, arc, 1)
@@ -0,0 +1,129 @@
+import time
+from collections import deque
+import numpy as np
+import pygame
+from constants import *
+from text import text_service
+
+
+class PerfOverlay:
+    """Frame timing breakdown drawn over the game, toggled with F3.
+
+    The main loop calls begin_frame() at the top of each frame and
+    lap(phase) after each phase; a lap charges the time since the previous
+    lap to that phase, summing repeats within a frame (fixed simulation
+    steps). end_frame() stores the frame's total time and laps. The panel
+    (FPS, frame-time graph, percentiles, average per-phase times and entity
+    counts) is re-rendered every PERF_OVERLAY_REFRESH seconds and blitted
+    as one surface in between.
+    """
+
+    def __init__(self, history=PERF_OVERLAY_HISTORY, refresh=PERF_OVERLAY_REFRESH):
+        self.visible = False
+        self.refresh = refresh
+        self.frame_times = deque(maxlen=history)  # Seconds between frames
+        self.phase_history = deque(maxlen=history)  # Per-frame {phase: seconds}
+        self.phases = {}  # Laps of the frame in progress
+        self.last_lap = time.perf_counter()
+        self.panel = None
+        self.panel_age = refresh  # Rebuild on first draw
+
+    def toggle(self):
+        self.visible = not self.visible
+        self.panel = None
+
+    def begin_frame(self):
+        self.phases = {}
+        self.last_lap = time.perf_counter()
+
+    def lap(self, phase):
+        """Charge the time since the previous lap to phase"""
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + now - self.last_lap
+        self.last_lap = now
+
+    def end_frame(self, frame_time):
+        """Store the finished frame: its full duration in seconds and its laps"""
+        self.frame_times.append(frame_time)
+        self.phase_history.append(self.phases)
+        self.panel_age += frame_time
+
+    def percentiles(self):
+        """p50, p95 and p99 frame time in milliseconds"""
+        if not self.frame_times:
+            return 0.0, 0.0, 0.0
+        return tuple(np.percentile(np.array(self.frame_times) * 1000, (50, 95, 99)))
+
+    def phase_averages(self):
+        """Mean milliseconds per frame for each phase, in first-seen order"""
+        totals = {}
+        for phases in self.phase_history:
+            for phase, seconds in phases.items():
+                totals[phase] = totals.get(phase, 0.0) + seconds
+        frames = max(len(self.phase_history), 1)
+        return {phase: seconds * 1000 / frames for phase, seconds in totals.items()}
+
+    def draw(self, screen, counts, extra=()):
+        """Blit the panel at the top right and return the area drawn (None when hidden).
+
+        counts maps sprite group names to sizes, extra is a list of
+        additional "label: value" lines.
+        """
+        if not self.visible:
+            return None
+        if self.panel is None or self.panel_age >= self.refresh:
+            self.panel = self._render_panel(counts, extra)
+            self.panel_age = 0.0
+        return screen.blit(self.panel, (screen.get_width() - self.panel.get_width() - 10, 50))
+
+    def _render_panel(self, counts, extra):
+        font = text_service.font(PERF_OVERLAY_FONT_SIZE)
+        white, grey, yellow = (230, 230, 230), (160, 160, 170), (255, 220, 120)
+        p50, p95, p99 = self.percentiles()
+        mean = sum(self.frame_times) / len(self.frame_times) if self.frame_times else 0.0
+        fps = 1 / mean if mean > 0 else 0.0
+
+        # Headings never change, so they come from the render() cache;
+        # readings change every refresh and are composed from glyphs
+        render, compose = text_service.render, text_service.compose
+        lines = [(f"FPS {fps:.0f}   frame {mean * 1000:.1f} ms", white, compose),
+                 (f"p50 {p50:.1f}  p95 {p95:.1f}  p99 {p99:.1f} ms", white, compose)]
+        graph_index = len(lines)
+        lines.append(None)  # Frame-time graph goes here
+        lines.append(("Phases (ms/frame)", yellow, render))
+        lines += [(f"  {phase}: {ms:.2f}", grey, compose) for phase, ms in self.phase_averages().items()]
+        lines.append(("Entities", yellow, render))
+        lines += [(f"  {name}: {count}", grey, compose) for name, count in counts.items()]
+        lines += [(line, grey, compose) for line in extra]
+
+        line_height = font.get_linesize()
+        width = PERF_OVERLAY_WIDTH
+        height = 8 + line_height * (len(lines) - 1) + PERF_GRAPH_HEIGHT + 8
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        y = 4
+        for i, line in enumerate(lines):
+            if i == graph_index:
+                self._draw_graph(panel, pygame.Rect(6, y + 2, width - 12, PERF_GRAPH_HEIGHT - 4))
+                y += PERF_GRAPH_HEIGHT
+                continue
+            text, color, draw_text = line
+            panel.blit(draw_text(font, text, color), (6, y))
+            y += line_height
+        return panel
+
+    def _draw_graph(self, panel, area):
+        """Frame times as a bar graph; the line marks the effect budget's target"""
+        pygame.draw.rect(panel, (40, 40, 50, 200), area)
+        if not self.frame_times:
+            return
+        scale = area.height / (EFFECT_TARGET_FRAME_TIME * 2)  # Graph tops out at twice the target
+        target_y = area.bottom - int(EFFECT_TARGET_FRAME_TIME * scale)
+        times = list(self.frame_times)[-area.width:]
+        x = area.right - len(times)
+        for frame_time in times:
+            bar = min(area.height, int(frame_time * scale))
+            color = (120, 220, 120) if frame_time <= EFFECT_TARGET_FRAME_TIME else (240, 110, 90)
+            pygame.draw.line(panel, color, (x, area.bottom - 1), (x, area.bottom - bar))
+            x += 1
+        pygame.draw.line(panel, (200, 200, 200), (area.left, target_y), (area.right - 1, target_y))
@@ -3,6 +3,7 @@ import math
 from circleshape import *
 from constants import *
 from shot import Shot, WeirdShot
+from inputs import capture_input
 
 class Player(CircleShape):
     # Class-level sound references
@@ -10,6 +11,8 @@ class Player(CircleShape):
     laser_channel = None
     rapid_fire_sound = None
     shotgun_sound = None
+    # InputFrame for the current frame (set in main.py); live input when None
+    input_state = None
 
     def __init__(self, x, y, ship_type="default"):
         super().__init__(x, y, PLAYER_RADIUS)
@@ -58,8 +61,8 @@ class Player(CircleShape):
         return RAPID_FIRE_COOLDOWN if self.powerups["rapid_fire"] > 0.0 else self.base_fire_delay
 
     def update(self, dt):
-        keys = pygame.key.get_pressed()
-        mouse_buttons = pygame.mouse.get_pressed()
+        keys = self.input_state or capture_input()
+        mouse_buttons = keys.mouse_buttons
         self.shot_timer += dt
 
         # Update dash state
@@ -111,7 +114,7 @@ class Player(CircleShape):
         
         # Mouse aiming and firing
         if mouse_buttons[0]:
-            mouse_x, mouse_y = pygame.mouse.get_pos()
+            mouse_x, mouse_y = keys.mouse_pos
             dx = mouse_x - self.position.x
             dy = mouse_y - self.position.y
             self.rotation = -math.degrees(math.atan2(dx, dy))
@@ -183,8 +186,9 @@ class Player(CircleShape):
         shot_speed = self.ship_stats.get("shot_speed", PLAYER_SHOT_SPEED)
         for angle in angles:
             forward = pygame.Vector2(0, 1).rotate(angle)
-            shot = Shot(*(self.position + forward * self.radius))
-            shot.velocity = forward * shot_speed
+            shot = Shot.spawn(self.position.x + forward.x * self.radius,
+                              self.position.y + forward.y * self.radius)
+            shot.velocity.update(forward.x * shot_speed, forward.y * shot_speed)
 
     def activate_special_ability(self):
         """Activate ship-specific special ability with F key"""
@@ -270,6 +274,15 @@ class Player(CircleShape):
         # Draw main ship with color
         pygame.draw.polygon(screen, self.color, self.get_shape_points(), 2)
     
+    def draw_rect(self, position):
+        """Screen area the ship, shield, invincibility halo and dash trail can cover"""
+        reach = self.radius * 2 + DIRTY_RECT_MARGIN
+        rect = pygame.Rect(int(position.x - reach), int(position.y - reach), int(reach * 2) + 2, int(reach * 2) + 2)
+        if self.dash_active:
+            trail_end = position - self.dash_direction * 90
+            rect.union_ip(rect.move(int(trail_end.x - position.x), int(trail_end.y - position.y)))
+        return rect
+    
     def get_shape_points(self):
         """Get the points for the ship shape based on ship type"""
         if self.shape == "triangle":
@@ -0,0 +1,90 @@
+class ObjectPool:
+    """Recycles dead sprites instead of letting them be garbage collected.
+
+    Instances returned by acquire() are either freshly constructed or a
+    previously released instance that has been reset() with the same
+    arguments and re-added to its containers. Released instances only become
+    reusable after recycle() is called, so nothing killed during a simulation
+    step can come back to life while that step is still iterating over it.
+    """
+
+    def __init__(self, cls, max_size=None):
+        self.cls = cls
+        self.max_size = max_size
+        self.free = []
+        self.pending = []
+
+        # Statistics for sizing pools per scenario
+        self.created = 0
+        self.reused = 0
+        self.live = 0
+        self.high_water = 0
+
+    def acquire(self, *args, **kwargs):
+        """Get a live instance initialised with the given constructor arguments"""
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args, **kwargs)
+            obj.add(obj.containers)
+            self.reused += 1
+        else:
+            obj = self.cls(*args, **kwargs)
+            self.created += 1
+        self.live += 1
+        self.high_water = max(self.high_water, self.live)
+        return obj
+
+    def release(self, obj):
+        """Take back an instance that has just been killed"""
+        self.live = max(0, self.live - 1)
+        if self.max_size is None or len(self.free) + len(self.pending) < self.max_size:
+            self.pending.append(obj)
+
+    def recycle(self):
+        """Make everything released since the last call available for reuse"""
+        if self.pending:
+            self.free.extend(self.pending)
+            self.pending.clear()
+
+    def clear(self):
+        """Drop all pooled instances and reset the live count (e.g. on game reset)"""
+        self.free.clear()
+        self.pending.clear()
+        self.live = 0
+
+    def reuse_ratio(self):
+        """Fraction of acquisitions served from the pool"""
+        total = self.created + self.reused
+        return self.reused / total if total else 0.0
+
+    def stats(self):
+        """Summary of pool usage for logs and debug displays"""
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "reuse_ratio": round(self.reuse_ratio(), 3),
+            "high_water": self.high_water,
+            "free": len(self.free) + len(self.pending),
+        }
+
+
+class Poolable:
+    """Mixin for sprites that can be recycled through an ObjectPool.
+
+    Subclasses implement reset() with the same signature as __init__ and
+    create instances through spawn(). When a class has no pool assigned,
+    spawn() simply constructs a new instance.
+    """
+    pool = None  # ObjectPool, set in main.py
+
+    @classmethod
+    def spawn(cls, *args, **kwargs):
+        if cls.pool is not None:
+            return cls.pool.acquire(*args, **kwargs)
+        return cls(*args, **kwargs)
+
+    def kill(self):
+        was_alive = self.alive()
+        super().kill()
+        if was_alive and self.pool is not None:
+            self.pool.release(self)
@@ -1,14 +1,16 @@
-import random
 import math
 import pygame
 from constants import *
+from pool import Poolable
 
-class PowerUp(pygame.sprite.Sprite):
+class PowerUp(Poolable, pygame.sprite.Sprite):
     containers = () # set in main.py
+    images = {}  # Built once per kind and shared by every instance
+
     def __init__(self, x, y, kind, velocity=None):
         super().__init__(*self.containers)
         self.kind = kind # power-up type
-        self.image = self.__build_image(kind)
+        self.image = self.__get_image(kind)
         self.rect = self.image.get_rect(center=(int(x), int(y)))
         self.position = pygame.Vector2(x, y)  # For crash_check compatibility
         self.pos = self.position  # 
@@ -17,6 +19,22 @@ class PowerUp(pygame.sprite.Sprite):
         self.t = 0.0
         self.drift_time = 0.0  # Track time drifting across screen
 
+    def reset(self, x, y, kind, velocity=None):
+        """Reinitialise a pooled power-up in place"""
+        self.kind = kind
+        self.image = self.__get_image(kind)
+        self.rect = self.image.get_rect(center=(int(x), int(y)))
+        self.position.update(x, y)
+        self.pos = self.position
+        self.vel.update(velocity if velocity else (0, 0))
+        self.t = 0.0
+        self.drift_time = 0.0
+
+    def __get_image(self, kind):
+        if kind not in PowerUp.images:
+            PowerUp.images[kind] = self.__build_image(kind)
+        return PowerUp.images[kind]
+
     def __build_image(self, kind):
         # Color scheme based on power-up type
         if kind == "rapid_fire":
@@ -0,0 +1,84 @@
+import constants as const
+from constants import *
+from narrowphase import motion_arrays
+
+
+class EntityReaper:
+    """Despawns shots and asteroids that can no longer affect play.
+
+    Shots are reaped once they outlive SHOT_LIFETIME or leave the screen, and
+    asteroids once they are past the off-screen margin and still heading
+    away. Per-step and running counts let long sessions confirm the entity
+    population stays bounded.
+    """
+
+    def __init__(self, margin=REAPER_MARGIN, shot_lifetime=SHOT_LIFETIME):
+        self.margin = margin
+        self.shot_lifetime = shot_lifetime
+
+        # Counters for the most recent simulation step
+        self.reaped_shots = 0
+        self.reaped_asteroids = 0
+
+        # Session totals
+        self.total_reaped_shots = 0
+        self.total_reaped_asteroids = 0
+        self.steps = 0
+        self.population = 0
+        self.peak_population = 0
+
+    def is_outbound(self, obj):
+        """Returns True if obj is fully past the margin and moving further out"""
+        reach = self.margin + getattr(obj, "radius", 0)
+        x, y = obj.position.x, obj.position.y
+        vx, vy = obj.velocity.x, obj.velocity.y
+        return ((x < -reach and vx <= 0) or
+                (x > const.SCREEN_WIDTH + reach and vx >= 0) or
+                (y < -reach and vy <= 0) or
+                (y > const.SCREEN_HEIGHT + reach and vy >= 0))
+
+    def outbound(self, objs):
+        """Boolean array, is_outbound for every object in objs in one vectorized pass"""
+        centers, velocities, radii = motion_arrays(objs)
+        reach = self.margin + radii
+        x, y = centers[:, 0], centers[:, 1]
+        vx, vy = velocities[:, 0], velocities[:, 1]
+        return (((x < -reach) & (vx <= 0)) |
+                ((x > const.SCREEN_WIDTH + reach) & (vx >= 0)) |
+                ((y < -reach) & (vy <= 0)) |
+                ((y > const.SCREEN_HEIGHT + reach) & (vy >= 0)))
+
+    def update(self, bullets, asteroids):
+        """Reap expired shots and outbound asteroids, returns number reaped this step"""
+        self.reaped_shots = 0
+        self.reaped_asteroids = 0
+
+        shots = bullets.sprites()
+        for shot, outbound in zip(shots, self.outbound(shots).tolist()):
+            if getattr(shot, "age", 0.0) >= self.shot_lifetime or outbound:
+                shot.kill()
+                self.reaped_shots += 1
+
+        # Positions are gathered in bulk, store-backed asteroids straight from their arrays
+        roids = asteroids.sprites()
+        for asteroid, outbound in zip(roids, self.outbound(roids).tolist()):
+            if outbound:
+                asteroid.kill()
+                self.reaped_asteroids += 1
+
+        self.total_reaped_shots += self.reaped_shots
+        self.total_reaped_asteroids += self.reaped_asteroids
+        self.steps += 1
+        self.population = len(bullets) + len(asteroids)
+        self.peak_population = max(self.peak_population, self.population)
+        return self.reaped_shots + self.reaped_asteroids
+
+    def stats(self):
+        """Summary of reaping activity for logs and debug displays"""
+        return {
+            "steps": self.steps,
+            "reaped_shots": self.total_reaped_shots,
+            "reaped_asteroids": self.total_reaped_asteroids,
+            "population": self.population,
+            "peak_population": self.peak_population,
+        }
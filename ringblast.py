@@ -1,185 +1,33 @@
 import pygame
-import random
 import math
+import numpy as np
+import rng
 from circleshape import CircleShape
 from constants import *
+from particles import ParticleBatch, glow_stamp, ICE_HIGHLIGHT, LIGHTNING_PRIMARY, LIGHTNING_GLOW
+from effectbudget import budget
+from glowcache import GlowCache
 
-# Element color constants
-ICE_PRIMARY = (150, 220, 255)
-ICE_SECONDARY = (200, 240, 255)
-ICE_HIGHLIGHT = (200, 240, 255)
-FIRE_CORE = (255, 255, 200)
-LIGHTNING_PRIMARY = (255, 255, 200)
-LIGHTNING_SECONDARY = (200, 180, 255)
-LIGHTNING_GLOW = (200, 150, 255)
-
-class NovaParticle:
-    """Elemental particle for ring blast visual effects"""
-    def __init__(self, x, y, angle, element_type, ring_radius):
-        self.pos = pygame.Vector2(x, y)
-        self.angle = angle
-        self.element = element_type
-        self.life = 1.0
-        self.age = 0.0
-        
-        # Element-specific initialization
-        if element_type == "ice":
-            self._init_ice(angle)
-        elif element_type == "fire":
-            self._init_fire(angle)
-        else:  # lightning
-            self._init_lightning(angle)
-    
-    def _init_ice(self, angle):
-        """Initialize ice particle properties"""
-        self.color = ICE_PRIMARY
-        self.secondary_color = ICE_SECONDARY
-        self.decay_rate = random.uniform(3.5, 5.0)
-        self.size = random.uniform(2, 5)
-        perp_angle = angle + random.uniform(-15, 15)
-        speed = random.uniform(80, 150)
-        self.velocity = pygame.Vector2.from_polar((speed, perp_angle))
-        self.rotation = random.uniform(0, 360)
-        self.rotation_speed = random.uniform(-300, 300)
-        self.shape = "crystal"
-    
-    def _init_fire(self, angle):
-        """Initialize fire particle properties"""
-        self.color = (255, random.randint(150, 200), random.randint(0, 50))
-        self.secondary_color = (255, random.randint(100, 150), 0)
-        self.decay_rate = random.uniform(2.5, 4.0)
-        self.size = random.uniform(2, 6)
-        drift_angle = angle + random.uniform(-30, 30)
-        speed = random.uniform(40, 80)
-        self.velocity = pygame.Vector2.from_polar((speed, drift_angle))
-        self.velocity.y -= random.uniform(30, 60)
-        self.rotation = 0
-        self.rotation_speed = 0
-        self.shape = "ember"
-        self.flicker = random.uniform(0.7, 1.0)
-    
-    def _init_lightning(self, angle):
-        """Initialize lightning particle properties"""
-        self.color = (255, 255, random.randint(200, 255))
-        self.secondary_color = LIGHTNING_SECONDARY
-        self.decay_rate = random.uniform(5.0, 8.0)
-        self.size = random.uniform(1, 3)
-        speed = random.uniform(100, 200)
-        self.velocity = pygame.Vector2.from_polar((speed, angle + random.uniform(-45, 45)))
-        self.rotation = random.uniform(0, 360)
-        self.rotation_speed = random.uniform(-500, 500)
-        self.shape = "arc"
-        self.flicker = random.random() > 0.4
-        self.arc_length = random.uniform(8, 15)
-    
-    def update(self, dt):
-        """Update particle position and life"""
-        self.age += dt
-        self.life -= self.decay_rate * dt
-        self.pos += self.velocity * dt
-        self.rotation += self.rotation_speed * dt
-        
-        # Element-specific updates
-        if self.element == "fire":
-            # Fire slows down and flickers
-            self.velocity *= 0.96
-            self.flicker = 0.7 + 0.3 * math.sin(self.age * 15)
-        elif self.element == "lightning":
-            # Lightning changes direction erratically
-            if random.random() < 0.3:
-                self.velocity.rotate_ip(random.uniform(-30, 30))
-        
-        return self.life > 0
-    
-    def draw(self, screen):
-        """Draw particle based on element type"""
-        if self.life <= 0:
-            return
-        
-        alpha = int(255 * self.life)
-        
-        if self.shape == "crystal":
-            self._draw_crystal(screen, alpha)
-        elif self.shape == "ember":
-            self._draw_ember(screen, alpha)
-        elif self.shape == "arc":
-            self._draw_arc(screen, alpha)
-    
-    def _draw_crystal(self, screen, alpha):
-        """Draw ice crystal shard"""
-        crystal_length = self.size * 3
-        points = []
-        for i in range(3):
-            angle_offset = (i * 120) + self.rotation
-            rad = math.radians(angle_offset)
-            dist = crystal_length if i == 0 else crystal_length * 0.3
-            px = self.pos.x + math.cos(rad) * dist
-            py = self.pos.y + math.sin(rad) * dist
-            points.append((int(px), int(py)))
-        
-        if len(points) >= 3:
-            surf = pygame.Surface((int(crystal_length * 2 + 10), int(crystal_length * 2 + 10)), pygame.SRCALPHA)
-            offset = pygame.Vector2(crystal_length + 5, crystal_length + 5)
-            local_points = [(p[0] - self.pos.x + offset.x, p[1] - self.pos.y + offset.y) for p in points]
-            
-            pygame.draw.polygon(surf, (*self.secondary_color, alpha // 2), local_points)
-            pygame.draw.polygon(surf, (*self.color, alpha), local_points)
-            
-            screen.blit(surf, (int(self.pos.x - offset.x), int(self.pos.y - offset.y)))
-    
-    def _draw_ember(self, screen, alpha):
-        """Draw fire ember"""
-        surf_size = int(self.size * 4 + 10)
-        surf = pygame.Surface((surf_size, surf_size), pygame.SRCALPHA)
-        center = surf_size // 2
-        
-        pygame.draw.circle(surf, (*self.secondary_color, int(alpha * 0.3 * self.flicker)), (center, center), int(self.size * 2))
-        pygame.draw.circle(surf, (*self.color, int(alpha * 0.6 * self.flicker)), (center, center), int(self.size * 1.2))
-        pygame.draw.circle(surf, (255, 255, 200, int(alpha * self.flicker)), (center, center), int(self.size * 0.6))
-        
-        screen.blit(surf, (int(self.pos.x - surf_size // 2), int(self.pos.y - surf_size // 2)))
-    
-    def _draw_arc(self, screen, alpha):
-        """Draw lightning arc"""
-        if self.flicker or random.random() > 0.3:
-            end_rad = math.radians(self.rotation)
-            end_pos = self.pos + pygame.Vector2(math.cos(end_rad), math.sin(end_rad)) * self.arc_length
-            
-            # Create jagged line
-            points = [self.pos]
-            for i in range(1, 3):
-                t = i / 3
-                mid = self.pos.lerp(end_pos, t)
-                offset = random.uniform(-self.arc_length * 0.3, self.arc_length * 0.3)
-                perp = pygame.Vector2(math.cos(end_rad + math.pi/2), math.sin(end_rad + math.pi/2)) * offset
-                points.append(mid + perp)
-            points.append(end_pos)
-            
-            # Draw glow and core
-            for i in range(len(points) - 1):
-                pygame.draw.line(screen, (*self.secondary_color, alpha // 2), 
-                               (int(points[i].x), int(points[i].y)),
-                               (int(points[i + 1].x), int(points[i + 1].y)), 3)
-            for i in range(len(points) - 1):
-                pygame.draw.line(screen, (*self.color, alpha), 
-                               (int(points[i].x), int(points[i].y)),
-                               (int(points[i + 1].x), int(points[i + 1].y)), 1)
-
+particle_rng = rng.numpy_stream("particles")  # Cosmetic only, never affects gameplay
+ring_directions = {}  # Segment count -> (cos, sin) of each lightning ring vertex angle
 
 class RingBlast(CircleShape):
     """Expanding ring that damages asteroids and boss"""
     containers = None
+    glow_cache = GlowCache()  # Shared by every ring and element
     
     def __init__(self, x, y, charge_level):
         super().__init__(x, y, 0)
         
         self.charge_level = charge_level
         self.current_radius = 0
+        self.previous_radius = 0  # Radius before the last update, inner edge of the swept band
         self.age = 0.0
-        self.particles = []
+        self.particles = None  # ParticleBatch for this ring's element
         self.particle_spawn_timer = 0.0
         self.particle_spawn_interval = 0.016
         self.hit_objects = set()
+        self.seen_entity_id = self.entity_id  # Everything older was in the grid when the ring formed
         
         # Element configs: (max_radius, boss_damage, color, element, particles_per_spawn)
         configs = {
@@ -190,6 +38,7 @@ class RingBlast(CircleShape):
         
         config = configs.get(charge_level, configs[1])
         self.max_radius, self.boss_damage, self.color, self.element, self.particles_per_spawn = config
+        self.particles = ParticleBatch(self.element)
         
         if RingBlast.containers:
             for container in RingBlast.containers:
@@ -202,19 +51,12 @@ class RingBlast(CircleShape):
             return
         
         # Spawn particles around the ring circumference
-        for _ in range(self.particles_per_spawn):
-            angle = random.uniform(0, 360)
-            rad = math.radians(angle)
-            
-            # Position on ring edge
-            px = self.position.x + math.cos(rad) * self.current_radius
-            py = self.position.y + math.sin(rad) * self.current_radius
-            
-            particle = NovaParticle(px, py, angle, self.element, self.current_radius)
-            self.particles.append(particle)
+        count = budget.scale(self.particles_per_spawn)
+        self.particles.spawn(self.position.x, self.position.y, self.current_radius, count)
     
     def update(self, dt):
         # Expand the ring
+        self.previous_radius = self.current_radius
         self.current_radius += RING_EXPANSION_SPEED * dt
         self.radius = self.current_radius
         self.age += dt
@@ -226,7 +68,7 @@ class RingBlast(CircleShape):
             self.particle_spawn_timer = 0.0
         
         # Update particles
-        self.particles = [p for p in self.particles if p.update(dt)]
+        self.particles.update(dt)
         
         # Kill when fully expanded
         if self.current_radius >= self.max_radius:
@@ -235,21 +77,15 @@ class RingBlast(CircleShape):
     
     def draw(self, screen):
         # Draw particles first
-        for particle in self.particles:
-            particle.draw(screen)
+        self.particles.draw(screen)
         
         if self.current_radius <= 0:
             return
         
-        # Draw glow
+        # Draw glow (skipped at the lowest effect quality)
         alpha = int(100 * (1 - self.current_radius / self.max_radius))
-        if alpha > 0:
-            glow_size = int(self.current_radius * 2 + 40)
-            glow_surface = pygame.Surface((glow_size, glow_size), pygame.SRCALPHA)
-            glow_center = int(self.current_radius + 20)
-            pygame.draw.circle(glow_surface, (*self.color, alpha), (glow_center, glow_center), glow_center)
-            screen.blit(glow_surface, (int(self.position.x - self.current_radius - 20), 
-                                      int(self.position.y - self.current_radius - 20)))
+        if alpha > 0 and budget.level > 0:
+            self.glow_cache.draw(screen, self.position, self.current_radius + 20, self.color, alpha)
         
         # Element-specific rendering
         if self.element == "ice":
@@ -284,37 +120,67 @@ class RingBlast(CircleShape):
                                  radius, line_width)
     
     def _draw_lightning_ring(self, screen):
-        """Draw electric lightning ring"""
-        num_segments = 48
-        points = []
-        for i in range(num_segments):
-            angle = (i / num_segments) * math.pi * 2
-            jitter = random.uniform(-5, 5) if random.random() > 0.7 else 0
-            radius = self.current_radius + jitter
-            px = self.position.x + math.cos(angle) * radius
-            py = self.position.y + math.sin(angle) * radius
-            points.append((int(px), int(py)))
+        """Draw electric lightning ring as one jittered polyline over a glow of cached stamps"""
+        num_segments = budget.scale(48, minimum=16)
+        directions = ring_directions.get(num_segments)
+        if directions is None:
+            angles = np.linspace(0, math.pi * 2, num_segments, endpoint=False)
+            directions = ring_directions[num_segments] = np.stack((np.cos(angles), np.sin(angles)), axis=1)
+        
+        # Roughly one vertex in three is pushed in or out by up to 5px
+        jitter = particle_rng.uniform(-5, 5, num_segments)
+        jitter[particle_rng.random(num_segments) <= 0.7] = 0
+        vertices = directions * (self.current_radius + jitter)[:, None] + (self.position.x, self.position.y)
+        points = vertices.astype(int).tolist()
         
-        for i in range(len(points)):
-            next_i = (i + 1) % len(points)
-            pygame.draw.line(screen, LIGHTNING_GLOW, points[i], points[next_i], 4)
-            pygame.draw.line(screen, LIGHTNING_PRIMARY, points[i], points[next_i], 2)
+        # Soft halo from a cached blurred stamp at each vertex, then glow and core polylines
+        if budget.level > 0:
+            stamp = glow_stamp(RING_LIGHTNING_GLOW_RADIUS)
+            half = stamp.get_width() // 2
+            screen.blits([(stamp, (x - half, y - half)) for x, y in points], doreturn=False)
+        pygame.draw.lines(screen, LIGHTNING_GLOW, True, points, 4)
+        pygame.draw.lines(screen, LIGHTNING_PRIMARY, True, points, 2)
         
         # Random lightning bolts
-        if random.random() > 0.7:
-            angle1 = random.uniform(0, math.pi * 2)
-            angle2 = angle1 + random.uniform(-math.pi / 3, math.pi / 3)
+        if particle_rng.random() > 0.7:
+            angle1 = particle_rng.uniform(0, math.pi * 2)
+            angle2 = angle1 + particle_rng.uniform(-math.pi / 3, math.pi / 3)
             p1 = self.position + pygame.Vector2(math.cos(angle1), math.sin(angle1)) * self.current_radius
             p2 = self.position + pygame.Vector2(math.cos(angle2), math.sin(angle2)) * self.current_radius
             pygame.draw.line(screen, (255, 255, 255, 200), (int(p1.x), int(p1.y)), (int(p2.x), int(p2.y)), 1)
     
+    def draw_rect(self, position):
+        """Screen area covered by the ring, its glow and its particles"""
+        reach = self.current_radius + 20 + RING_GLOW_RADIUS_STEP + DIRTY_RECT_MARGIN
+        rect = pygame.Rect(int(position.x - reach), int(position.y - reach), int(reach * 2) + 2, int(reach * 2) + 2)
+        # Particle stamps and arcs reach less than 35px from their center
+        particles = self.particles.bounds(35 + DIRTY_RECT_MARGIN)
+        return rect.union(particles) if particles else rect
+    
+    def wavefront_targets(self, grid):
+        """Live objects in a SpatialHash the ring reached since the last check.
+
+        Queries the annulus swept since the previous update (padded by
+        RING_WAVEFRONT_SLACK for objects moving inward), plus anything that
+        appeared inside the disk since the last check, such as asteroids
+        split by the ring itself. Objects already hit are skipped.
+        """
+        inner = self.previous_radius - RING_WAVEFRONT_SLACK
+        targets = grid.query_annulus(self.position, inner, self.current_radius)
+        found = set(targets)
+        for obj in grid.newer_than(self.seen_entity_id):
+            if obj not in found and self.crash_check(obj):
+                targets.append(obj)
+        self.seen_entity_id = max(self.seen_entity_id, grid.newest_id)
+        return [obj for obj in targets if obj.alive() and not self.has_hit(obj)]
+
     def has_hit(self, obj):
         """Check if we've already hit this object"""
-        return id(obj) in self.hit_objects
+        return obj.entity_id in self.hit_objects
     
     def mark_hit(self, obj):
         """Mark an object as hit"""
-        self.hit_objects.add(id(obj))
+        self.hit_objects.add(obj.entity_id)
 
 
 class RingChargeManager:
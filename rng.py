@@ -0,0 +1,64 @@
+import random
+import zlib
+import numpy as np
+
+
+class RngRegistry:
+    """Named random streams derived from a single master seed.
+
+    Each subsystem draws from its own stream, so consuming more or fewer
+    numbers in one (e.g. extra particles on a faster machine) never shifts
+    the sequence seen by another. Gameplay streams cover spawns, splits and
+    drops; cosmetic streams cover particles, asteroid shapes and the
+    background. Reseeding updates existing streams in place, so modules can
+    keep module-level references to them.
+    """
+
+    def __init__(self, seed=None):
+        self.master_seed = seed
+        self.streams = {}
+        self.numpy_streams = {}
+
+    def _derive(self, name):
+        """Per-stream seed, or None for OS entropy when unseeded"""
+        if self.master_seed is None:
+            return None
+        return (self.master_seed * 1000003) ^ zlib.crc32(name.encode("utf-8"))
+
+    def stream(self, name):
+        """Get (creating if needed) the random.Random stream called name"""
+        if name not in self.streams:
+            self.streams[name] = random.Random(self._derive(name))
+        return self.streams[name]
+
+    def numpy_stream(self, name):
+        """Get (creating if needed) the NumPy Generator stream called name"""
+        if name not in self.numpy_streams:
+            self.numpy_streams[name] = np.random.Generator(np.random.PCG64(self._derive(name)))
+        return self.numpy_streams[name]
+
+    def seed(self, seed):
+        """Reseed every stream from a new master seed (None for OS entropy)"""
+        self.master_seed = seed
+        for name, stream in self.streams.items():
+            stream.seed(self._derive(name))
+        for name, generator in self.numpy_streams.items():
+            generator.bit_generator.state = np.random.PCG64(self._derive(name)).state
+
+
+registry = RngRegistry()
+
+
+def stream(name):
+    """Shortcut for registry.stream(name)"""
+    return registry.stream(name)
+
+
+def numpy_stream(name):
+    """Shortcut for registry.numpy_stream(name)"""
+    return registry.numpy_stream(name)
+
+
+def seed(value):
+    """Reseed all streams from one master seed"""
+    registry.seed(value)
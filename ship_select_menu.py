@@ -1,13 +1,14 @@
 import pygame
 from constants import *
 from game_states import load_game_data, save_game_data
+from text import text_service
 
 
 class ShipSelectMenu:
     def __init__(self, menu_background=None, click_sound=None, mode="select"):
-        self.font = pygame.font.Font(None, 48)
-        self.small_font = pygame.font.Font(None, 24)
-        self.medium_font = pygame.font.Font(None, 32)
+        self.font = text_service.font(48)
+        self.small_font = text_service.font(24)
+        self.medium_font = text_service.font(32)
         self.save_data = load_game_data()
         self.selected_index = 0
         self.ships = list(SHIP_UNLOCKS.keys())
@@ -102,7 +103,7 @@ class ShipSelectMenu:
 
         # Title
         title_text = "UNLOCKABLES" if self.mode == "browse" else "SELECT YOUR SHIP"
-        title = self.font.render(title_text, True, (100, 200, 255))
+        title = text_service.render(self.font, title_text, (100, 200, 255))
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 50))
         screen.blit(title, title_rect)
 
@@ -149,20 +150,20 @@ class ShipSelectMenu:
 
                 # Ship Name
                 name_color = (100, 255, 100) if is_current else (255, 255, 100) if is_selected else (255, 255, 255) if is_unlocked else (100, 100, 100)
-                name_text = self.font.render(ship.upper(), True, name_color)
+                name_text = text_service.render(self.font, ship.upper(), name_color)
                 name_x = start_x + 20
                 name_y = y_offset + 15
                 screen.blit(name_text, (name_x, name_y))
 
                 # Current ship indicator
                 if is_current:
-                    equipped_text = self.small_font.render("(EQUIPPED)", True, (100, 255, 100))
+                    equipped_text = text_service.render(self.small_font, "(EQUIPPED)", (100, 255, 100))
                     screen.blit(equipped_text, (name_x + name_text.get_width() + 20, name_y + 10))
 
                 if not is_unlocked:
                     # Locked status
                     required = SHIP_UNLOCKS[ship]
-                    lock_text = self.medium_font.render(f"Locked - Score {required} to unlock", True, (150, 150, 150))
+                    lock_text = text_service.render(self.medium_font, f"Locked - Score {required} to unlock", (150, 150, 150))
                     screen.blit(lock_text, (name_x, y_offset + panel_height - 35))
                     
                     # Lock icon
@@ -194,7 +195,7 @@ class ShipSelectMenu:
                     stat_offset = 0
                     for stat_key, stat_label in stat_names.items():
                         # Stat label
-                        label_text = self.small_font.render(f"{stat_label}:", True, (200, 200, 200))
+                        label_text = text_service.render(self.small_font, f"{stat_label}:", (200, 200, 200))
                         screen.blit(label_text, (stats_x + stat_offset, stats_y))
                         
                         # Stat bar (visual representation)
@@ -233,16 +234,16 @@ class ShipSelectMenu:
         # Scroll indicators
         if self.scroll_offset > 0:
             # Up arrow
-            arrow_text = self.medium_font.render("▲ Scroll Up", True, (150, 150, 200))
+            arrow_text = text_service.render(self.medium_font, "▲ Scroll Up", (150, 150, 200))
             screen.blit(arrow_text, (SCREEN_WIDTH // 2 - arrow_text.get_width() // 2, 105))
         
         if self.scroll_offset < max_scroll:
             # Down arrow
-            arrow_text = self.medium_font.render("▼ Scroll Down", True, (150, 150, 200))
+            arrow_text = text_service.render(self.medium_font, "▼ Scroll Down", (150, 150, 200))
             screen.blit(arrow_text, (SCREEN_WIDTH // 2 - arrow_text.get_width() // 2, SCREEN_HEIGHT - 130))
 
         # Back button
-        back_text = self.medium_font.render("Back (ESC)", True, (200, 200, 200))
+        back_text = text_service.render(self.medium_font, "Back (ESC)", (200, 200, 200))
         back_rect = back_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
         
         button_rect = back_rect.inflate(40, 20)
@@ -5,12 +5,18 @@ from constants import *
 class Shot(CircleShape):
     def __init__(self, x, y):
         super().__init__(x, y, SHOT_RADIUS)
+        self.age = 0.0  # Seconds alive, reaped after SHOT_LIFETIME
+
+    def reset(self, x, y):
+        super().reset(x, y, SHOT_RADIUS)
+        self.age = 0.0
 
     def draw(self, screen):
         pygame.draw.circle(screen, (255, 0, 0), (int(self.position.x), int(self.position.y)), self.radius)
 
     def update(self, dt):
         self.position += self.velocity * dt
+        self.age += dt
 
 
 class WeirdShot(CircleShape):
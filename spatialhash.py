@@ -0,0 +1,245 @@
+import math
+import numpy as np
+from constants import *
+from circleshape import sweep_time
+from narrowphase import circle_arrays
+
+
+class SpatialHash:
+    """Uniform grid broadphase for circular game objects.
+
+    The grid is rebuilt once per frame from one or more sprite groups. Each
+    object is snapshotted (position and radius) at insert time and bucketed
+    into every cell its bounding square touches, so queries only test
+    objects in nearby cells instead of the whole group.
+    """
+
+    def __init__(self, cell_size=SPATIAL_HASH_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.entries = []  # (obj, x, y, radius) in insertion order
+        self.oversized = []  # Entry indices too large to bucket efficiently
+        self.max_radius = 0  # Largest radius inserted since the last clear
+        self.newest_id = 0  # Highest entity_id inserted since the last clear
+
+    def __len__(self):
+        return len(self.entries)
+
+    def clear(self):
+        """Remove every object from the grid"""
+        self.cells.clear()
+        self.entries.clear()
+        self.oversized.clear()
+        self.max_radius = 0
+        self.newest_id = 0
+
+    def rebuild(self, *groups):
+        """Clear the grid and insert every sprite from the given groups.
+
+        Equivalent to insert() on each sprite in turn, but done in bulk:
+        centers and radii are gathered with narrowphase.circle_arrays (so
+        store-backed asteroids are read straight from their arrays) and the
+        cell buckets are built with one sort instead of per-object loops.
+        """
+        self.clear()
+        objs = [obj for group in groups for obj in group]
+        if not objs:
+            return
+        centers, radii = circle_arrays(objs)
+        for i, obj in enumerate(objs):
+            bounds = getattr(obj, "bounds", None)
+            if bounds is not None:
+                centers[i, 0], centers[i, 1], radii[i] = bounds()
+        self.entries.extend(zip(objs, centers[:, 0].tolist(), centers[:, 1].tolist(), radii.tolist()))
+        self.max_radius = max(float(radii.max()), 0)
+        self.newest_id = max(getattr(obj, "entity_id", 0) for obj in objs)
+
+        # Huge objects (growing rings etc.) would touch hundreds of cells
+        oversized = radii > self.cell_size * SPATIAL_HASH_MAX_SPAN
+        self.oversized.extend(np.flatnonzero(oversized).tolist())
+        index = np.flatnonzero(~oversized)
+        if len(index) == 0:
+            return
+
+        # One (entry, cell) pair per cell each bounding square touches, as in _cell_range
+        reach = radii[index, None]
+        low = np.floor((centers[index] - reach) / self.cell_size).astype(np.int64)
+        span = np.floor((centers[index] + reach) / self.cell_size).astype(np.int64) - low + 1
+        counts = span[:, 0] * span[:, 1]
+        owner = np.repeat(np.arange(len(index)), counts)
+        offset = np.arange(len(owner)) - np.repeat(np.cumsum(counts) - counts, counts)
+        cell_x = low[owner, 0] + offset // span[owner, 1]
+        cell_y = low[owner, 1] + offset % span[owner, 1]
+
+        # Group pairs by cell, keeping insertion order inside each bucket
+        order = np.lexsort((owner, cell_y, cell_x))
+        cell_x = cell_x[order]
+        cell_y = cell_y[order]
+        members = index[owner[order]]
+        starts = np.flatnonzero(np.r_[True, (cell_x[1:] != cell_x[:-1]) | (cell_y[1:] != cell_y[:-1])])
+        buckets = np.split(members, starts[1:])
+        self.cells.update(zip(zip(cell_x[starts].tolist(), cell_y[starts].tolist()),
+                              (bucket.tolist() for bucket in buckets)))
+
+    def _cell_range(self, x, y, radius):
+        """Inclusive cell coordinate range covered by a circle's bounding square"""
+        size = self.cell_size
+        return (int(math.floor((x - radius) / size)), int(math.floor((y - radius) / size)),
+                int(math.floor((x + radius) / size)), int(math.floor((y + radius) / size)))
+
+    def insert(self, obj):
+        """Add a circular object (anything with position and radius) to the grid.
+
+        Objects with a bounds() method (x, y, radius) are bucketed by that
+        bounding circle instead.
+        """
+        bounds = getattr(obj, "bounds", None)
+        if bounds is None:
+            x, y = obj.position.x, obj.position.y
+            radius = getattr(obj, "radius", 0)
+        else:
+            x, y, radius = bounds()
+        index = len(self.entries)
+        self.entries.append((obj, x, y, radius))
+        if radius > self.max_radius:
+            self.max_radius = radius
+        entity_id = getattr(obj, "entity_id", 0)
+        if entity_id > self.newest_id:
+            self.newest_id = entity_id
+
+        # Huge objects (growing rings etc.) would touch hundreds of cells
+        if radius > self.cell_size * SPATIAL_HASH_MAX_SPAN:
+            self.oversized.append(index)
+            return
+
+        cells = self.cells
+        min_cx, min_cy, max_cx, max_cy = self._cell_range(x, y, radius)
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [index]
+                else:
+                    bucket.append(index)
+
+    def candidates(self, x, y, radius):
+        """Indices of entries sharing a cell with the circle, in insertion order"""
+        cells = self.cells
+        found = set(self.oversized)
+        min_cx, min_cy, max_cx, max_cy = self._cell_range(x, y, radius)
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.update(bucket)
+        return sorted(found)
+
+    def query(self, position, radius, exclude=None):
+        """Objects overlapping the circle at position, in insertion order.
+
+        Uses the same strict test as CircleShape.crash_check, so results match
+        a brute-force scan over the original groups.
+        """
+        x, y = position.x, position.y
+        entries = self.entries
+        hits = []
+        for index in self.candidates(x, y, radius):
+            obj, ox, oy, oradius = entries[index]
+            if obj is exclude:
+                continue
+            reach = radius + oradius
+            dx = ox - x
+            dy = oy - y
+            if dx * dx + dy * dy < reach * reach:
+                hits.append(obj)
+        return hits
+
+    def query_circle(self, obj):
+        """Objects overlapping another circular object (never includes obj itself)"""
+        return self.query(obj.position, getattr(obj, "radius", 0), exclude=obj)
+
+    def query_annulus(self, position, inner, outer):
+        """Objects overlapping the circle of radius outer whose centers are at least inner away.
+
+        Only cells that can hold such a center are visited, so a growing
+        ring costs the band it swept rather than the whole disk. When the
+        band covers more cells than are occupied, the occupied cells are
+        walked instead. Results are in insertion order and use the same
+        strict test as CircleShape.crash_check.
+        """
+        x, y = position.x, position.y
+        size = self.cell_size
+        reach = outer + self.max_radius  # Furthest a qualifying center can be
+        inner_sq = max(inner, 0) ** 2
+        reach_sq = reach * reach
+        min_cx, min_cy, max_cx, max_cy = self._cell_range(x, y, reach)
+        if (max_cx - min_cx + 1) * (max_cy - min_cy + 1) > len(self.cells):
+            keys = self.cells.keys()
+        else:
+            keys = [(cx, cy) for cx in range(min_cx, max_cx + 1) for cy in range(min_cy, max_cy + 1)]
+
+        found = set(self.oversized)
+        cells = self.cells
+        for key in keys:
+            bucket = cells.get(key)
+            if not bucket:
+                continue
+            left = key[0] * size
+            top = key[1] * size
+            # Nearest and farthest points of the cell from the ring center
+            near_x = max(left - x, 0, x - left - size)
+            near_y = max(top - y, 0, y - top - size)
+            far_x = max(abs(x - left), abs(x - left - size))
+            far_y = max(abs(y - top), abs(y - top - size))
+            if near_x * near_x + near_y * near_y < reach_sq and far_x * far_x + far_y * far_y >= inner_sq:
+                found.update(bucket)
+
+        entries = self.entries
+        hits = []
+        for index in sorted(found):
+            obj, ox, oy, oradius = entries[index]
+            dx = ox - x
+            dy = oy - y
+            dist_sq = dx * dx + dy * dy
+            limit = outer + oradius
+            if inner_sq <= dist_sq < limit * limit:
+                hits.append(obj)
+        return hits
+
+    def newer_than(self, entity_id):
+        """Objects whose entity_id is above the given watermark, in insertion order.
+
+        Relies on sprite groups keeping insertion order: anything spawned or
+        recycled after the watermark was taken sits at the tail of the entries.
+        """
+        entries = self.entries
+        start = len(entries)
+        while start > 0 and getattr(entries[start - 1][0], "entity_id", 0) > entity_id:
+            start -= 1
+        return [entry[0] for entry in entries[start:]]
+
+    def query_swept(self, obj):
+        """Objects hit by obj's last step, earliest time of impact first.
+
+        Sweeps obj from previous_position to position (see
+        CircleShape.sweep_check). Candidates come from the cells around the
+        bounding circle of the swept segment; ties keep insertion order.
+        """
+        start = obj.previous_position
+        end = obj.position
+        if start == end:
+            return self.query_circle(obj)
+        radius = getattr(obj, "radius", 0)
+        x0, y0, x1, y1 = start.x, start.y, end.x, end.y
+        half_length = math.hypot(x1 - x0, y1 - y0) / 2
+        entries = self.entries
+        hits = []
+        for index in self.candidates((x0 + x1) / 2, (y0 + y1) / 2, half_length + radius):
+            other, ox, oy, oradius = entries[index]
+            if other is obj:
+                continue
+            t = sweep_time(x0, y0, x1, y1, ox, oy, radius + oradius)
+            if t is not None:
+                hits.append((t, other))
+        hits.sort(key=lambda hit: hit[0])
+        return [other for t, other in hits]
@@ -0,0 +1,93 @@
+from collections import OrderedDict
+from constants import *
+
+
+class RotationSpriteCache:
+    """LRU cache of pre-rendered sprites at quantised rotation angles.
+
+    Each shape (identified by a hashable key) is rendered lazily into a
+    surface per angle bucket the first time that bucket is drawn. Least
+    recently used surfaces are evicted once the cache exceeds its memory
+    cap, and every surface of a shape can be dropped when the shape dies.
+    """
+
+    def __init__(self, angle_steps=ASTEROID_ROTATION_STEPS, max_megabytes=ASTEROID_SPRITE_CACHE_MB):
+        self.angle_steps = angle_steps
+        self.max_bytes = int(max_megabytes * 1024 * 1024)
+        self.surfaces = OrderedDict()  # (shape_key, bucket) -> surface, oldest first
+        self.buckets = {}  # shape_key -> set of cached buckets
+        self.bytes = 0
+
+        # Statistics for tuning angle_steps and the memory cap
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.surfaces)
+
+    def bucket(self, angle):
+        """Nearest angle bucket for a rotation in degrees"""
+        return round(angle * self.angle_steps / 360) % self.angle_steps
+
+    def bucket_angle(self, bucket):
+        """Rotation in degrees that a bucket is rendered at"""
+        return bucket * 360 / self.angle_steps
+
+    def get(self, shape_key, angle, render):
+        """Surface for shape_key at the bucket nearest angle.
+
+        On a miss render(angle) is called with the bucket's angle and must
+        return the surface to cache.
+        """
+        key = (shape_key, self.bucket(angle))
+        surf = self.surfaces.get(key)
+        if surf is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surf
+
+        self.misses += 1
+        surf = render(self.bucket_angle(key[1]))
+        self.surfaces[key] = surf
+        self.buckets.setdefault(shape_key, set()).add(key[1])
+        self.bytes += surf.get_bytesize() * surf.get_width() * surf.get_height()
+        while self.bytes > self.max_bytes and len(self.surfaces) > 1:
+            self._evict_oldest()
+        return surf
+
+    def _evict_oldest(self):
+        (shape_key, bucket), surf = self.surfaces.popitem(last=False)
+        self.bytes -= surf.get_bytesize() * surf.get_width() * surf.get_height()
+        self.evictions += 1
+        buckets = self.buckets[shape_key]
+        buckets.discard(bucket)
+        if not buckets:
+            del self.buckets[shape_key]
+
+    def discard(self, shape_key):
+        """Drop every cached surface of a shape that will not be drawn again"""
+        for bucket in self.buckets.pop(shape_key, ()):
+            surf = self.surfaces.pop((shape_key, bucket))
+            self.bytes -= surf.get_bytesize() * surf.get_width() * surf.get_height()
+
+    def clear(self):
+        """Drop all cached surfaces (statistics are kept)"""
+        self.surfaces.clear()
+        self.buckets.clear()
+        self.bytes = 0
+
+    def hit_ratio(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        """Summary of cache usage for logs and debug displays"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hit_ratio(), 3),
+            "evictions": self.evictions,
+            "surfaces": len(self.surfaces),
+            "megabytes": round(self.bytes / (1024 * 1024), 2),
+        }
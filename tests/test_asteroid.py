@@ -0,0 +1,18 @@
+"""Pooled asteroids must come back indistinguishable from new ones."""
+import rng
+from asteroid import Asteroid
+
+
+def test_reset_redraws_vertex_count():
+    rng.seed(3)
+    asteroid = Asteroid(100, 100, 40)
+    counts = set()
+    for _ in range(40):
+        asteroid.kill()
+        asteroid.reset(200, 200, 40)
+        counts.add(asteroid.num_vertices)
+        assert len(asteroid.vertices) == asteroid.num_vertices
+    assert len(counts) > 1
+    asteroid.kill()
+    Asteroid.store.clear()
+
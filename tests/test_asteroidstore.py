@@ -0,0 +1,46 @@
+"""Asteroid vector properties are live views of their AsteroidStore slot."""
+import pygame
+
+from asteroid import Asteroid
+
+
+def test_in_place_updates_write_through():
+    asteroid = Asteroid(100, 100, 40)
+    asteroid.velocity = pygame.Vector2(10, 0)
+    asteroid.velocity *= 2
+    asteroid.position.x += 5
+    asteroid.previous_position.update(1, 2)
+    store = Asteroid.store
+    assert tuple(store.velocity[asteroid.slot]) == (20, 0)
+    assert tuple(store.position[asteroid.slot]) == (105, 100)
+    assert tuple(store.previous_position[asteroid.slot]) == (1, 2)
+
+    # Arithmetic results are detached copies
+    doubled = asteroid.position * 2
+    doubled.x = 0
+    assert tuple(store.position[asteroid.slot]) == (105, 100)
+    asteroid.kill()
+    store.clear()
+
+
+def test_views_survive_store_growth():
+    asteroid = Asteroid(100, 100, 40)
+    position = asteroid.position
+    store = Asteroid.store
+    store._grow(store.capacity * 2)
+    position += (1, 1)
+    assert tuple(store.position[asteroid.slot]) == (101, 101)
+    asteroid.kill()
+    store.clear()
+
+
+def test_killed_asteroid_detaches_state():
+    asteroid = Asteroid(100, 100, 40)
+    slot = asteroid.slot
+    asteroid.kill()
+    other = Asteroid(0, 0, 20)
+    assert other.slot == slot
+    asteroid.position.x = 500
+    assert tuple(Asteroid.store.position[slot]) == (0, 0)
+    other.kill()
+    Asteroid.store.clear()
@@ -0,0 +1,97 @@
+"""Merged ice trail chains must hit where the per-trail circles did."""
+import random
+
+import pygame
+import pytest
+
+import bossasteroid
+import rng
+from bossasteroid import BossAsteroid, IceTrail
+from circleshape import CircleShape
+from constants import *
+
+DT = 1 / 60
+OVERHANG = 1.0  # Pixels the capsules may reach past the circles between trails
+
+
+def boss_chains(seed, seconds=30, every=1.5):
+    """Snapshots of a boss's live trails as it crosses and bounces around the screen"""
+    rng.seed(seed)
+    trails = pygame.sprite.Group()
+    IceTrail.containers = (trails,)
+    try:
+        boss = BossAsteroid(0)
+        for frame in range(int(seconds / DT)):
+            boss.update(DT)
+            trails.update(DT)
+            if frame % int(every / DT) == 0 and len(trails) > 1:
+                yield trails.sprites()
+    finally:
+        IceTrail.containers = ()
+
+
+def probes(trails, probe_rng, count=400):
+    """Player-sized circles scattered around the chain"""
+    spread = trails[0].radius + PLAYER_RADIUS * 2
+    for _ in range(count):
+        anchor = probe_rng.choice(trails).position
+        yield CircleShape(anchor.x + probe_rng.uniform(-spread, spread),
+                          anchor.y + probe_rng.uniform(-spread, spread), PLAYER_RADIUS)
+
+
+def circle_hit(trails, probe, slack=0.0):
+    return any(trail.position.distance_to(probe.position) < trail.radius + probe.radius + slack
+               for trail in trails)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_merged_footprint_matches_circles(seed, monkeypatch):
+    monkeypatch.setattr(bossasteroid, "ICE_TRAIL_MERGED", True)
+    probe_rng = random.Random(seed)
+    for trails in boss_chains(seed):
+        for probe in probes(trails, probe_rng):
+            merged = any(trail.crash_check(probe) for trail in trails)
+            # Never misses a hit the circles had, only fills the slivers between them
+            if circle_hit(trails, probe):
+                assert merged
+            if merged:
+                assert circle_hit(trails, probe, OVERHANG)
+
+
+@pytest.mark.parametrize("merged", [False, True])
+def test_sweep_check_agrees_with_crash_check(merged, monkeypatch):
+    monkeypatch.setattr(bossasteroid, "ICE_TRAIL_MERGED", merged)
+    probe_rng = random.Random(7)
+    for trails in boss_chains(7):
+        for probe in probes(trails, probe_rng, count=200):
+            end = pygame.Vector2(probe.position)
+            probe.previous_position = end - pygame.Vector2(probe_rng.uniform(-300, 300),
+                                                           probe_rng.uniform(-300, 300))
+            for trail in trails:
+                t = trail.sweep_check(probe)
+                if trail.crash_check(probe):
+                    assert t is not None
+                if t is not None:
+                    # The swept circle first touches the trail at the reported time
+                    probe.position = probe.previous_position.lerp(end, min(t + 1e-6, 1.0))
+                    assert trail.crash_check(probe)
+                    if t > 1e-6:
+                        probe.position = probe.previous_position.lerp(end, t - 1e-6)
+                        assert not trail.crash_check(probe)
+                    probe.position = pygame.Vector2(end)
+
+
+def test_sweep_crosses_capsule_side(monkeypatch):
+    monkeypatch.setattr(bossasteroid, "ICE_TRAIL_MERGED", True)
+    trails = pygame.sprite.Group()
+    monkeypatch.setattr(IceTrail, "containers", (trails,))
+    older = IceTrail(0, 0, 50)
+    newer = IceTrail(400, 0, 50, older)
+    probe = CircleShape(200, 200, PLAYER_RADIUS)
+    probe.previous_position = pygame.Vector2(200, -200)
+    # Enters the straight side, 70 px above the segment, far from both end caps
+    assert newer.sweep_check(probe) == pytest.approx(130 / 400)
+    assert older.sweep_check(probe) is None
+
+    monkeypatch.setattr(bossasteroid, "ICE_TRAIL_MERGED", False)
+    assert newer.sweep_check(probe) is None
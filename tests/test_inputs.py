@@ -0,0 +1,41 @@
+"""Recordings must carry everything the game loop needs to replay a session."""
+import pygame
+
+from inputs import InputFrame, InputRecorder, InputReplay
+
+
+class ScriptedInput:
+    """Input source handing out prepared frames"""
+
+    def __init__(self, frames):
+        self.frames = iter(frames)
+
+    def poll(self, events, dt):
+        return next(self.frames)
+
+
+def test_frame_round_trip():
+    frame = InputFrame(held=[pygame.K_w], pressed=[pygame.K_r], dt=0.016, reset=True, backend="numpy")
+    copy = InputFrame.from_dict(frame.to_dict())
+    assert copy.held == frame.held
+    assert copy.pressed == frame.pressed
+    assert copy.dt == frame.dt
+    assert copy.reset and copy.backend == "numpy"
+
+    plain = InputFrame.from_dict(InputFrame(dt=0.016).to_dict())
+    assert not plain.reset and plain.backend is None
+
+
+def test_recorder_keeps_flags_set_while_handling_events(tmp_path):
+    path = tmp_path / "run.jsonl"
+    frames = [InputFrame(dt=0.016) for _ in range(3)]
+    recorder = InputRecorder(path, {"seed": 1}, source=ScriptedInput(frames))
+    # The game loop flags a frame after polling it, while handling its events
+    recorder.poll((), 0.016).reset = True
+    recorder.poll((), 0.016).backend = "loop"
+    recorder.poll((), 0.016)
+    recorder.close()
+
+    replay = InputReplay(path)
+    assert [(frame.reset, frame.backend) for frame in replay.frames] == [
+        (True, None), (False, "loop"), (False, None)]
@@ -0,0 +1,133 @@
+"""SpatialHash queries must match a brute-force scan over the same objects."""
+import random
+
+import pygame
+import pytest
+
+from asteroid import Asteroid
+from circleshape import CircleShape, sweep_time
+from constants import *
+from spatialhash import SpatialHash
+
+SEEDS = range(8)
+MARGIN = 300  # How far off-screen objects may sit
+
+
+def random_point(circle_rng):
+    return (circle_rng.uniform(-MARGIN, SCREEN_WIDTH + MARGIN),
+            circle_rng.uniform(-MARGIN, SCREEN_HEIGHT + MARGIN))
+
+
+def make_circles(seed, count=150):
+    """Shots to bosses in size, a few oversized rings, some store-backed asteroids"""
+    circle_rng = random.Random(seed)
+    objs = []
+    for i in range(count):
+        x, y = random_point(circle_rng)
+        if i % 25 == 0:
+            radius = SPATIAL_HASH_CELL_SIZE * SPATIAL_HASH_MAX_SPAN * circle_rng.uniform(1.01, 2)
+        else:
+            radius = circle_rng.uniform(SHOT_RADIUS, BOSS_RADIUS)
+        obj = Asteroid(x, y, radius) if i % 3 == 0 else CircleShape(x, y, radius)
+        obj.velocity = pygame.Vector2(circle_rng.uniform(-400, 400), circle_rng.uniform(-400, 400))
+        objs.append(obj)
+    return objs
+
+
+def make_movers(seed, count=60):
+    """Shot-sized to boss-sized circles with a previous_position a step behind"""
+    mover_rng = random.Random(seed + 1000)
+    movers = []
+    for i in range(count):
+        x, y = random_point(mover_rng)
+        mover = CircleShape(x, y, mover_rng.uniform(SHOT_RADIUS, BOSS_RADIUS))
+        if i % 10:
+            step = pygame.Vector2(mover_rng.uniform(-600, 600), mover_rng.uniform(-600, 600))
+            mover.previous_position = mover.position - step
+        movers.append(mover)
+    return movers
+
+
+def build(objs):
+    group = pygame.sprite.Group(objs)
+    grid = SpatialHash()
+    grid.rebuild(group)
+    return grid
+
+
+@pytest.fixture(autouse=True)
+def fresh_store():
+    yield
+    Asteroid.store.clear()
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_rebuild_matches_insert(seed):
+    objs = make_circles(seed)
+    bulk = build(objs)
+    single = SpatialHash()
+    for obj in objs:
+        single.insert(obj)
+    assert bulk.entries == single.entries
+    assert bulk.cells == single.cells
+    assert bulk.oversized == single.oversized
+    assert bulk.max_radius == single.max_radius
+    assert bulk.newest_id == single.newest_id
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_query_matches_crash_check(seed):
+    objs = make_circles(seed)
+    grid = build(objs)
+    for probe in make_movers(seed):
+        expected = [obj for obj in objs if probe.crash_check(obj)]
+        assert grid.query(probe.position, probe.radius) == expected
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_query_circle_excludes_self(seed):
+    objs = make_circles(seed)
+    grid = build(objs)
+    for obj in objs:
+        expected = [other for other in objs if other is not obj and obj.crash_check(other)]
+        assert grid.query_circle(obj) == expected
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_query_swept_matches_sweep_time(seed):
+    objs = make_circles(seed)
+    grid = build(objs)
+    for mover in make_movers(seed):
+        start, end = mover.previous_position, mover.position
+        hits = []
+        for obj in objs:
+            t = sweep_time(start.x, start.y, end.x, end.y,
+                           obj.position.x, obj.position.y, mover.radius + obj.radius)
+            if t is not None:
+                hits.append((t, obj))
+        hits.sort(key=lambda hit: hit[0])
+        assert grid.query_swept(mover) == [obj for t, obj in hits]
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_query_annulus_matches_scan(seed):
+    objs = make_circles(seed)
+    grid = build(objs)
+    ring_rng = random.Random(seed + 2000)
+    for _ in range(40):
+        center = pygame.Vector2(random_point(ring_rng))
+        inner = ring_rng.uniform(-50, 600)
+        outer = inner + ring_rng.uniform(0, 200)
+        expected = []
+        for obj in objs:
+            dist_sq = center.distance_squared_to(obj.position)
+            if max(inner, 0) ** 2 <= dist_sq < (outer + obj.radius) ** 2:
+                expected.append(obj)
+        assert grid.query_annulus(center, inner, outer) == expected
+
+
+def test_newer_than_returns_tail():
+    objs = make_circles(0, count=20)
+    grid = build(objs)
+    watermark = objs[11].entity_id
+    assert grid.newer_than(watermark) == objs[12:]
@@ -0,0 +1,111 @@
+from collections import OrderedDict
+import pygame
+from constants import *
+
+
+class TextService:
+    """Shared fonts and an LRU cache of rendered strings.
+
+    Fonts are created once per size and handed out to every menu and the
+    HUD. render() caches whole strings by (font, text, color), which suits
+    labels and values that change now and then. compose() assembles a
+    string from cached per-character glyphs instead, for text that changes
+    almost every frame (cooldown timers). Its results go in a separate LRU
+    of the same size, so a timer repeats its surface while its value holds
+    without churning the render() cache.
+    """
+
+    def __init__(self, max_entries=TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.fonts = {}  # size -> pygame.font.Font
+        self.surfaces = OrderedDict()  # (font, text, color) -> surface, oldest first
+        self.composed = OrderedDict()  # Same keys, surfaces built by compose()
+        self.glyphs = {}  # (font, char, color) -> surface
+
+        # Statistics for tuning the cache size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.surfaces)
+
+    def font(self, size):
+        """Shared default-typeface font of the given point size"""
+        font = self.fonts.get(size)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = self.fonts[size] = pygame.font.Font(None, size)
+        return font
+
+    def render(self, font, text, color):
+        """Antialiased surface for text, rendered once and reused until evicted"""
+        return self._cached(self.surfaces, font, text, color, self._render)
+
+    def _render(self, font, text, color):
+        return font.render(text, True, color)
+
+    def _cached(self, cache, font, text, color, build):
+        """Look up (font, text, color) in an LRU cache, calling build on a miss"""
+        key = (font, text, tuple(color))
+        surf = cache.get(key)
+        if surf is not None:
+            self.hits += 1
+            cache.move_to_end(key)
+            return surf
+
+        self.misses += 1
+        surf = cache[key] = build(font, text, color)
+        if len(cache) > self.max_entries:
+            cache.popitem(last=False)
+            self.evictions += 1
+        return surf
+
+    def glyph(self, font, char, color):
+        """Cached surface of a single character"""
+        key = (font, char, tuple(color))
+        surf = self.glyphs.get(key)
+        if surf is None:
+            surf = self.glyphs[key] = font.render(char, True, color)
+        return surf
+
+    def compose(self, font, text, color):
+        """Surface for text built from cached glyphs (no kerning, same height as font.render)"""
+        return self._cached(self.composed, font, text, color, self._compose)
+
+    def _compose(self, font, text, color):
+        glyphs = [self.glyph(font, char, color) for char in text]
+        surf = pygame.Surface((sum(glyph.get_width() for glyph in glyphs) or 1, font.get_height()), pygame.SRCALPHA)
+        x = 0
+        for glyph in glyphs:
+            # Glyphs never overlap, so MAX copies them onto the transparent surface unchanged
+            surf.blit(glyph, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            x += glyph.get_width()
+        return surf
+
+    def clear(self):
+        """Drop cached strings and glyphs; fonts are kept (statistics too)"""
+        self.surfaces.clear()
+        self.composed.clear()
+        self.glyphs.clear()
+
+    def hit_ratio(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        """Summary of cache usage for logs and debug displays"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hit_ratio(), 3),
+            "evictions": self.evictions,
+            "strings": len(self.surfaces),
+            "composed": len(self.composed),
+            "glyphs": len(self.glyphs),
+            "fonts": len(self.fonts),
+        }
+
+
+text_service = TextService()  # Shared by the HUD and every menu
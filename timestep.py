@@ -0,0 +1,57 @@
+from constants import *
+
+
+class FixedTimestep:
+    """Accumulator that turns variable frame times into fixed simulation steps.
+
+    Each rendered frame adds its elapsed time to the accumulator and the
+    simulation runs as many whole steps as fit. The leftover fraction is
+    exposed as alpha so drawing can interpolate between the last two
+    simulated states.
+    """
+
+    def __init__(self, step=FIXED_TIMESTEP, max_frame_time=MAX_FRAME_TIME):
+        self.step = step
+        self.max_frame_time = max_frame_time
+        self.accumulator = 0.0
+
+    def advance(self, frame_dt):
+        """Add a frame's elapsed time, clamped to avoid a spiral of death after stalls"""
+        self.accumulator += min(max(frame_dt, 0.0), self.max_frame_time)
+
+    def steps(self):
+        """Yield the fixed step duration once for every whole step accumulated"""
+        while self.accumulator >= self.step:
+            self.accumulator -= self.step
+            yield self.step
+
+    @property
+    def alpha(self):
+        """Fraction of a step left over, used to blend previous and current state"""
+        return self.accumulator / self.step
+
+    def reset(self):
+        """Drop any accumulated time (e.g. after unpausing)"""
+        self.accumulator = 0.0
+
+
+def store_previous_positions(*groups):
+    """Remember where each object was before the next simulation step"""
+    for group in groups:
+        for obj in group:
+            obj.previous_position.update(obj.position)
+
+
+def draw_interpolated(obj, screen, alpha):
+    """Draw obj at its position blended between the last two simulation steps"""
+    previous = getattr(obj, "previous_position", None)
+    if previous is None:
+        obj.draw(screen)
+        return
+
+    actual = obj.position
+    obj.position = previous.lerp(actual, min(max(alpha, 0.0), 1.0))
+    try:
+        obj.draw(screen)
+    finally:
+        obj.position = actual